@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Asset Cache
+
+Content-addressed on-disk cache of built assets. An entry is keyed by the
+hash of the generating script, its params and the Blender version, and
+holds the saved ``.blend``, a ``.glb`` export, the scene stats Blender
+reported and the asset script's structured result. Asking for a cached asset again returns the entry without
+touching a Blender worker.
+
+Entries are written to a private staging directory and renamed into place,
+so readers never see a half-written entry and concurrent builders of the
+same key simply keep the first. Eviction (least recently used first, until
+the cache fits its size budget) runs under a cross-process file lock.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from file_lock import file_lock
+from mcp_transport import result_text
+
+logger = logging.getLogger(__name__)
+
+# Bump when the entry layout or the save script changes
+CACHE_FORMAT = 2
+STATS_MARKER = "@@MCP_ASSET_CACHE@@"
+VERSION_MARKER = "@@MCP_BLENDER_VERSION@@"
+
+VERSION_SCRIPT = f"import bpy\nprint({VERSION_MARKER!r} + bpy.app.version_string)\n"
+
+# Appended to an asset script; saves the asset's collection (and nothing
+# else the worker has built) into params["cache_dir"]
+SAVE_SOURCE = f'''
+import bpy as _cache_bpy, json as _cache_json, os as _cache_os
+
+_cache_dir = params["cache_dir"]
+_cache_objects = list(_collection.all_objects)
+# A copy of the scene keeps render settings, world and camera; only the
+# asset's collection stays linked to it
+_cache_scene = _cache_bpy.context.scene.copy()
+try:
+    for _cache_child in list(_cache_scene.collection.children):
+        if _cache_child != _collection:
+            _cache_scene.collection.children.unlink(_cache_child)
+    for _cache_obj in list(_cache_scene.collection.objects):
+        _cache_scene.collection.objects.unlink(_cache_obj)
+    if _cache_scene.camera not in _cache_objects:
+        _cache_scene.camera = next((o for o in _cache_objects if o.type == 'CAMERA'), None)
+    _cache_bpy.data.libraries.write(_cache_os.path.join(_cache_dir, "asset.blend"),
+                                    {{_cache_scene}}, fake_user=True)
+finally:
+    _cache_bpy.data.scenes.remove(_cache_scene)
+try:
+    _cache_layer = _cache_bpy.context.view_layer
+    for _cache_obj in _cache_layer.objects:
+        _cache_obj.select_set(False)
+    for _cache_obj in _cache_objects:
+        _cache_obj.select_set(True)
+    _cache_bpy.ops.export_scene.gltf(filepath=_cache_os.path.join(_cache_dir, "asset.glb"),
+                                     export_format='GLB', use_selection=True)
+except Exception as _cache_error:
+    print(f"⚠️ glTF export skipped: {{_cache_error}}")
+_cache_meshes = [o.data for o in _cache_objects if o.type == 'MESH']
+_cache_materials = {{slot.material for o in _cache_objects for slot in o.material_slots if slot.material}}
+print({STATS_MARKER!r} + _cache_json.dumps({{
+    "objects": len(_cache_objects),
+    "meshes": len(set(_cache_meshes)),
+    "vertices": sum(len(m.vertices) for m in _cache_meshes),
+    "faces": sum(len(m.polygons) for m in _cache_meshes),
+    "materials": len(_cache_materials),
+    "blender": _cache_bpy.app.version_string,
+}}))
+'''
+
+
+def cache_key(script: str, params: Optional[Dict], blender_version: str) -> str:
+    """Content address of the asset a script builds"""
+    text = json.dumps({"format": CACHE_FORMAT, "script": script, "params": params or {},
+                       "blender": blender_version}, sort_keys=True)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def parse_stats(result: Dict) -> Optional[Dict]:
+    """Scene stats printed by SAVE_SOURCE, or None if it did not run"""
+    for line in reversed(result_text(result).splitlines()):
+        if line.startswith(STATS_MARKER):
+            return json.loads(line[len(STATS_MARKER):])
+    return None
+
+
+async def blender_version(transport) -> str:
+    """Blender version behind a transport, part of every cache key
+
+    Worker pools answer without occupying a worker; MCP endpoints are asked
+    once with a one-line script.
+    """
+    if hasattr(transport, "blender_version"):
+        return await transport.blender_version()
+    output = result_text(await transport.execute_script(VERSION_SCRIPT))
+    for line in output.splitlines():
+        if line.startswith(VERSION_MARKER):
+            return line[len(VERSION_MARKER):].strip()
+    return "unknown"
+
+
+class AssetCache:
+    """Size-bounded LRU cache of built assets under ``root``"""
+
+    def __init__(self, root: Path, max_bytes: int = 2 * 1024**3):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.entries_dir = self.root / "entries"
+        self.staging_dir = self.root / "staging"
+        self.entries_dir.mkdir(parents=True, exist_ok=True)
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Dict]:
+        """Cached entry for key (marking it recently used), or None"""
+        entry = self._load(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def _load(self, key: str) -> Optional[Dict]:
+        entry_dir = self.entries_dir / key
+        try:
+            with open(entry_dir / "stats.json") as f:
+                entry = json.load(f)
+            # Recency lives in the directory mtime so a hit is one utime call
+            os.utime(entry_dir)
+        except (FileNotFoundError, json.JSONDecodeError):
+            # Absent, or evicted by another process between the two calls
+            return None
+        entry["path"] = str(entry_dir)
+        entry["files"] = {name: str(entry_dir / name) for name in entry["files"]}
+        return entry
+
+    def stage(self) -> Path:
+        """Fresh absolute directory for Blender to save a new entry into"""
+        return Path(tempfile.mkdtemp(prefix="build-", dir=self.staging_dir)).resolve()
+
+    def commit(self, key: str, staged: Path, stats: Dict,
+               result: Optional[Dict] = None) -> Optional[Dict]:
+        """Move a staged build into the cache; returns the entry, or None if nothing was saved"""
+        files = sorted(p.name for p in staged.iterdir() if p.suffix in (".blend", ".glb"))
+        if "asset.blend" not in files:
+            shutil.rmtree(staged, ignore_errors=True)
+            return None
+        with open(staged / "stats.json", "w") as f:
+            json.dump({"key": key, "created": time.time(), "files": files, "stats": stats,
+                       "result": result}, f)
+        try:
+            os.rename(staged, self.entries_dir / key)
+        except OSError:
+            # Another builder got there first; its entry is equivalent
+            shutil.rmtree(staged, ignore_errors=True)
+        self.evict()
+        return self._load(key)
+
+    def discard(self, staged: Path):
+        shutil.rmtree(staged, ignore_errors=True)
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        with file_lock(self.root / ".lock"):
+            entries = []
+            for entry_dir in self.entries_dir.iterdir():
+                try:
+                    size = sum(p.stat().st_size for p in entry_dir.iterdir())
+                    entries.append((entry_dir.stat().st_mtime, size, entry_dir))
+                except FileNotFoundError:
+                    continue
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry_dir in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                # Rename first so readers see either the whole entry or none of it
+                doomed = self.staging_dir / f"evicted-{entry_dir.name}-{os.getpid()}"
+                try:
+                    os.rename(entry_dir, doomed)
+                except OSError:
+                    continue
+                shutil.rmtree(doomed, ignore_errors=True)
+                total -= size
+                logger.info(f"Evicted cached asset {entry_dir.name[:12]} ({size} bytes)")
+
+    def usage(self) -> Dict:
+        """Entry count, bytes on disk and hit/miss counts for this process"""
+        entries, size = 0, 0
+        for entry_dir in self.entries_dir.iterdir():
+            with contextlib.suppress(FileNotFoundError):
+                size += sum(p.stat().st_size for p in entry_dir.iterdir())
+                entries += 1
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Asset Exporter
+
+Exports built assets to FBX, glTF (.glb), OBJ and .blend. Each asset is one
+Blender job that brings the asset into the worker's session (appending it
+from its cached .blend, or rebuilding it from its script) and then writes
+every requested format, so assets spread across a worker pool export side
+by side and a whole session takes about as long as its slowest asset.
+
+With LOD ratios set, the same job first bakes an LOD chain for every mesh
+(modifiers applied, then decimated to each ratio of the LOD0 triangle
+count) named ``<object>_LOD0`` .. ``_LOD3``, the suffix Unity and Unreal
+group on import, and exports those in place of the source meshes.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from mcp_transport import result_text
+from script_templates import TemplateRegistry
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {"fbx": ".fbx", "gltf": ".glb", "obj": ".obj", "blend": ".blend"}
+EXPORT_MARKER = "@@MCP_EXPORT@@"
+# Fraction of LOD0's triangles kept by each level
+LOD_RATIOS = (1.0, 0.5, 0.25, 0.1)
+
+# Appended to a script that builds the asset (or to nothing, when the asset
+# is appended from a cached .blend); reads its inputs from params
+EXPORT_SOURCE = f'''
+import bpy as _export_bpy, json as _export_json, os as _export_os, time as _export_time
+
+
+def _export_collections(params):
+    if params.get("blend"):
+        with _export_bpy.data.libraries.load(params["blend"]) as (_src, _dst):
+            _dst.collections = [name for name in _src.collections if name in params["collections"]]
+        for collection in _dst.collections:
+            _export_bpy.context.scene.collection.children.link(collection)
+        return list(_dst.collections), True
+    return [_export_bpy.data.collections[name] for name in params["collections"]], False
+
+
+def _export_select(objects):
+    view_layer = _export_bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = objects[0] if objects else None
+
+
+def _export_blend(path, name, collections):
+    # A scene holding only this asset, so the file opens showing just it
+    scene = _export_bpy.data.scenes.new(name)
+    try:
+        for collection in collections:
+            scene.collection.children.link(collection)
+        scene.world = _export_bpy.context.scene.world
+        _export_bpy.data.libraries.write(path, {{scene}}, fake_user=True)
+    finally:
+        _export_bpy.data.scenes.remove(scene)
+
+
+def _export_triangles(mesh):
+    mesh.calc_loop_triangles()
+    return len(mesh.loop_triangles)
+
+
+def _export_lods(name, collections, ratios):
+    """Bake an LOD chain per mesh into a new collection; returns it and per-level triangles"""
+    lod_collection = _export_bpy.data.collections.new(f"{{name}}_LODs")
+    _export_bpy.context.scene.collection.children.link(lod_collection)
+    depsgraph = _export_bpy.context.evaluated_depsgraph_get()
+    sources = {{obj for collection in collections for obj in collection.all_objects}}
+    chains = {{}}
+    for obj in sorted(sources, key=lambda o: o.name):
+        if obj.type != 'MESH' or any(mod.type == 'NODES' for mod in obj.modifiers):
+            # Rigs, lights, cameras and scatter instancers travel unchanged
+            lod_collection.objects.link(obj)
+            continue
+        # LOD0 is the evaluated mesh: subdivision and other modifiers applied
+        base = _export_bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph),
+                                                      preserve_all_data_layers=True,
+                                                      depsgraph=depsgraph)
+        chain = []
+        for level, ratio in enumerate(ratios):
+            lod = _export_bpy.data.objects.new(f"{{obj.name}}_LOD{{level}}",
+                                               base if level == 0 else base.copy())
+            lod.matrix_world = obj.matrix_world.copy()
+            for group in obj.vertex_groups:
+                lod.vertex_groups.new(name=group.name)
+            for source in obj.modifiers:
+                if source.type == 'ARMATURE':
+                    rig = lod.modifiers.new(source.name, 'ARMATURE')
+                    rig.object = source.object
+            if ratio < 1.0:
+                decimate = lod.modifiers.new("LOD_Decimate", 'DECIMATE')
+                decimate.ratio = ratio
+            lod_collection.objects.link(lod)
+            chain.append((lod, ratio))
+        chains[obj] = chain
+
+    # A mesh's LODs hang off the same level of its parent's chain; objects
+    # exported unchanged stay parents, anything outside the asset is dropped
+    for obj, chain in chains.items():
+        for level, (lod, _) in enumerate(chain):
+            if obj.parent in chains:
+                parent = chains[obj.parent][level][0]
+            else:
+                parent = obj.parent if obj.parent in sources else None
+            if parent is not None:
+                lod.parent, lod.parent_type, lod.parent_bone = parent, obj.parent_type, obj.parent_bone
+                lod.matrix_parent_inverse = obj.matrix_parent_inverse.copy()
+                lod.matrix_world = obj.matrix_world.copy()
+
+    # One depsgraph evaluation for every decimation, then bake them
+    depsgraph = _export_bpy.context.evaluated_depsgraph_get()
+    depsgraph.update()
+    triangles = [0] * len(ratios)
+    for chain in chains.values():
+        for level, (lod, ratio) in enumerate(chain):
+            if ratio < 1.0:
+                decimated = _export_bpy.data.meshes.new_from_object(
+                    lod.evaluated_get(depsgraph), preserve_all_data_layers=True, depsgraph=depsgraph)
+                _export_bpy.data.meshes.remove(lod.data)
+                lod.data = decimated
+                lod.modifiers.remove(lod.modifiers["LOD_Decimate"])
+            triangles[level] += _export_triangles(lod.data)
+    lods = [{{"level": level, "ratio": ratio, "triangles": count}}
+            for level, (ratio, count) in enumerate(zip(ratios, triangles))]
+    return lod_collection, lods
+
+
+def _export_remove_lods(lod_collection):
+    # Every mesh in the collection is a baked LOD; the rest are the asset's own
+    for obj in list(lod_collection.objects):
+        if obj.type == 'MESH' and obj.name.rpartition("_LOD")[2].isdigit():
+            mesh = obj.data
+            _export_bpy.data.objects.remove(obj, do_unlink=True)
+            if mesh.users == 0:
+                _export_bpy.data.meshes.remove(mesh)
+    _export_bpy.data.collections.remove(lod_collection)
+
+
+def _export_file(fmt, path, name, collections):
+    if fmt == "fbx":
+        _export_bpy.ops.export_scene.fbx(filepath=path, use_selection=True)
+    elif fmt == "gltf":
+        _export_bpy.ops.export_scene.gltf(filepath=path, export_format='GLB', use_selection=True)
+    elif fmt == "obj":
+        if _export_bpy.app.version >= (3, 2, 0):
+            _export_bpy.ops.wm.obj_export(filepath=path, export_selected_objects=True)
+        else:
+            _export_bpy.ops.export_scene.obj(filepath=path, use_selection=True)
+    else:
+        _export_blend(path, name, collections)
+
+
+def _export_asset(params):
+    _export_os.makedirs(params["export_dir"], exist_ok=True)
+    collections, appended = _export_collections(params)
+    objects = [obj for collection in collections for obj in collection.all_objects]
+    exported, lod_collection, lods = collections, None, None
+    if params.get("lod_ratios"):
+        started = _export_time.perf_counter()
+        lod_collection, lods = _export_lods(params["name"], collections, params["lod_ratios"])
+        exported = [lod_collection]
+        print(f"   🔻 LODs: {{' / '.join(str(lod['triangles']) for lod in lods)}} triangles "
+              f"({{_export_time.perf_counter() - started:.2f}}s)")
+    _export_select([obj for collection in exported for obj in collection.all_objects])
+    report = {{}}
+    for fmt, extension in params["formats"].items():
+        path = _export_os.path.join(params["export_dir"], params["name"] + extension)
+        started = _export_time.perf_counter()
+        try:
+            _export_file(fmt, path, params["name"], exported)
+            report[fmt] = {{"file": path, "bytes": _export_os.path.getsize(path),
+                           "seconds": round(_export_time.perf_counter() - started, 4)}}
+            print(f"   📤 {{fmt}}: {{path}}")
+        except Exception as error:
+            report[fmt] = {{"error": str(error)}}
+            print(f"   ⚠️ {{fmt}} export failed: {{error}}")
+    if lod_collection is not None:
+        _export_remove_lods(lod_collection)
+    if appended:
+        for obj in objects:
+            _export_bpy.data.objects.remove(obj, do_unlink=True)
+        for collection in collections:
+            _export_bpy.data.collections.remove(collection)
+    print({EXPORT_MARKER!r} + _export_json.dumps({{"formats": report, "lods": lods}}))
+
+
+_export_asset(params)
+'''
+
+
+def parse_formats(text: str) -> List[str]:
+    """Validate a comma-separated format list such as ``fbx,gltf``"""
+    formats = [fmt.strip().lower() for fmt in text.split(",") if fmt.strip()]
+    unknown = [fmt for fmt in formats if fmt not in EXPORT_FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(unknown)} "
+                         f"(choose from {', '.join(EXPORT_FORMATS)})")
+    return formats
+
+
+def parse_lod_ratios(text: str) -> List[float]:
+    """Validate a comma-separated LOD ratio list such as ``1,0.5,0.25,0.1``"""
+    try:
+        ratios = [float(ratio) for ratio in text.split(",") if ratio.strip()]
+    except ValueError:
+        raise ValueError(f"LOD ratios must be numbers: {text!r}")
+    if not ratios or ratios[0] != 1.0 or any(not 0 < r <= 1 for r in ratios) \
+            or ratios != sorted(ratios, reverse=True):
+        raise ValueError("LOD ratios must start at 1 and decrease, each in (0, 1]")
+    return ratios
+
+
+class AssetExporter:
+    """Runs one export job per asset concurrently on a transport"""
+
+    def __init__(self, transport, templates: TemplateRegistry, export_root: Path,
+                 formats: Optional[List[str]] = None, timeout: Optional[float] = None,
+                 lod_ratios: Optional[List[float]] = None):
+        self.transport = transport
+        self.templates = templates
+        self.export_root = Path(export_root).resolve()
+        self.formats = formats or list(EXPORT_FORMATS)
+        self.timeout = timeout
+        # None exports the assets as built; a list (see LOD_RATIOS) adds the LOD stage
+        self.lod_ratios = lod_ratios
+
+    def job(self, name: str, collections: List[str], build_script: str = "",
+            build_params: Optional[Dict] = None, blend: Optional[str] = None) -> Dict:
+        """Describe one asset export
+
+        Either ``blend`` (a .blend holding the asset's collections) or
+        ``build_script`` (a template that builds them from ``build_params``)
+        supplies the asset.
+        """
+        if blend is None and not build_script:
+            raise ValueError(f"Export of {name!r} needs a build script or a .blend")
+        return {"name": name, "collections": collections, "build_script": "" if blend else build_script,
+                "build_params": build_params or {}, "blend": blend}
+
+    async def export(self, job: Dict) -> Dict:
+        """Run one export job; returns per-format files, sizes and timings"""
+        template_name = "export_cached" if job["blend"] else f"export_{job['name']}"
+        template = self.templates.template(template_name, job["build_script"] + EXPORT_SOURCE)
+        params = {
+            **job["build_params"],
+            "name": job["name"],
+            "collections": job["collections"],
+            "blend": job["blend"],
+            "export_dir": str(self.export_root / job["name"]),
+            "formats": {fmt: EXPORT_FORMATS[fmt] for fmt in self.formats},
+            "lod_ratios": self.lod_ratios,
+        }
+        started = time.perf_counter()
+        summary = {"asset": job["name"], "source": "cache" if job["blend"] else "rebuild"}
+        try:
+            result = await self.transport.run_template(template, params, self.timeout)
+            report = None
+            for line in reversed(result_text(result).splitlines()):
+                if line.startswith(EXPORT_MARKER):
+                    report = json.loads(line[len(EXPORT_MARKER):])
+                    break
+            if report is None:
+                summary["error"] = (result_text(result).strip().splitlines() or ["no output"])[-1] \
+                    if result.get("isError") else "no export report (server did not run the script)"
+            else:
+                summary["formats"] = report["formats"]
+                if report.get("lods"):
+                    summary["lods"] = report["lods"]
+        except Exception as e:
+            logger.error(f"Export of {job['name']} failed: {e}")
+            summary["error"] = str(e)
+        summary["seconds"] = round(time.perf_counter() - started, 4)
+        return summary
+
+    async def export_all(self, jobs: List[Dict]) -> Dict:
+        """Export every job concurrently, printing each asset as it finishes"""
+        started = time.perf_counter()
+        results = []
+        for finished in asyncio.as_completed([self.export(job) for job in jobs]):
+            summary = await finished
+            results.append(summary)
+            if "error" in summary:
+                print(f"❌ {summary['asset']}: {summary['error']}")
+                continue
+            print(f"✅ {summary['asset']} ({summary['source']}, {summary['seconds']:.2f}s)")
+            if "lods" in summary:
+                print("   • LODs  " + ", ".join(f"LOD{lod['level']} {lod['triangles']:,} tris"
+                                                for lod in summary["lods"]))
+            for fmt, report in summary["formats"].items():
+                if "error" in report:
+                    print(f"   • {fmt:<5} failed: {report['error']}")
+                else:
+                    print(f"   • {fmt:<5} {report['bytes'] / 1024:9.1f} KB  {report['seconds']:.3f}s")
+        manifest = {
+            "exported_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "formats": self.formats,
+            "lod_ratios": self.lod_ratios,
+            "wall_seconds": round(time.perf_counter() - started, 4),
+            "serial_seconds": round(sum(summary["seconds"] for summary in results), 4),
+            "assets": sorted(results, key=lambda summary: summary["asset"]),
+        }
+        self.export_root.mkdir(parents=True, exist_ok=True)
+        with open(self.export_root / "export_manifest.json", 'w') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Asset Scripts
+
+The built-in assets, each described by a spec in ``asset_specs/`` and
+compiled to a Blender script with ``asset_spec``. Template inputs that vary
+per run (colors, samples) default to the spec's ``params``.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict
+
+from asset_spec import build_scene, compile_spec, default_params, load_spec
+from scene_builder import SceneBuilder
+
+SPEC_DIR = Path(__file__).parent / "asset_specs"
+
+# Asset kind -> spec file; the spec name doubles as the template name
+BUILTIN_SPECS = {
+    "character": "game_character.json",
+    "vehicle": "blue_car.json",
+    "environment": "architectural_scene.json",
+    "showcase": "material_demo.json",
+    "weapon": "medieval_sword.json",
+}
+
+
+@lru_cache(maxsize=None)
+def builtin_spec(kind: str) -> Dict:
+    return load_spec(SPEC_DIR / BUILTIN_SPECS[kind])
+
+
+def asset_script(kind: str, profile: bool = False) -> str:
+    """Compiled Blender script for a built-in asset, optionally section-profiled"""
+    return compile_spec(builtin_spec(kind), profile)
+
+
+def asset_builder(kind: str) -> SceneBuilder:
+    """Scene (and scene-graph nodes) for a built-in asset"""
+    return build_scene(builtin_spec(kind))
+
+
+def asset_params(kind: str) -> Dict:
+    """Default template params for a built-in asset"""
+    return default_params(builtin_spec(kind))
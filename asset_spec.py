@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+Asset Specs
+
+Assets are described in JSON (or TOML on Python 3.11+) files: materials,
+objects, generated layouts (rings and seeded, non-overlapping prop
+scatters), armature, lights, camera, world and render settings. A scatter's
+``backend`` is ``objects`` (one object per prop) or ``instances`` (one
+geometry-nodes point cloud, for tens of thousands of props). A spec is
+validated and compiled to a ``SceneBuilder`` scene without touching Blender. Compilation is
+deterministic and memoized by the spec's content hash.
+
+Any value written as ``"$name"`` is a template parameter; its default
+comes from the spec's ``params`` table and can be overridden per run.
+"""
+
+import copy
+import hashlib
+import json
+import math
+from pathlib import Path
+from typing import Dict, List, Union
+
+from prop_scatter import scatter
+from scene_builder import SCATTER_BACKENDS, Param, SceneBuilder
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+TOP_LEVEL_KEYS = {"name", "category", "collection", "description", "params", "materials",
+                  "objects", "rings", "scatter", "armature", "lights", "camera", "world",
+                  "render", "summary"}
+SHADERS = {
+    "principled": {"base_color", "metallic", "roughness", "specular", "alpha", "ior", "clearcoat"},
+    "emission": {"color", "strength"},
+    "noise": {"roughness", "scale", "colors"},
+}
+PRIMITIVES = {"cube", "plane", "cylinder", "uv_sphere", "monkey"}
+OBJECT_KEYS = {"name", "primitive", "text", "size", "location", "rotation", "scale",
+               "materials", "geometry", "modifiers"}
+SCATTER_KEYS = {"name", "seed", "count", "area", "spacing", "avoid", "rotate", "types",
+                "backend"}
+PROP_KEYS = {"name", "primitive", "scale", "materials", "geometry", "footprint", "weight", "z"}
+LIGHT_TYPES = {"POINT", "SUN", "SPOT", "AREA"}
+RENDER_ENGINES = {"EEVEE", "CYCLES", "BLENDER_WORKBENCH"}
+
+
+class SpecError(ValueError):
+    """Raised when an asset spec is malformed; lists every problem found"""
+
+    def __init__(self, source: str, problems: List[str]):
+        self.problems = problems
+        super().__init__(f"Invalid asset spec {source}:\n  - " + "\n  - ".join(problems))
+
+
+def load_spec(path: Union[str, Path]) -> Dict:
+    """Read and validate a .json or .toml asset spec"""
+    path = Path(path)
+    if path.suffix == ".toml":
+        if tomllib is None:
+            raise SpecError(str(path), ["TOML specs need Python 3.11+ (tomllib); use JSON"])
+        with open(path, 'rb') as f:
+            spec = tomllib.load(f)
+    else:
+        with open(path, 'r') as f:
+            spec = json.load(f)
+    validate_spec(spec, str(path))
+    return spec
+
+
+def spec_hash(spec: Dict) -> str:
+    """Content hash of a spec, independent of key order and file format"""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode()).hexdigest()
+
+
+def default_params(spec: Dict) -> Dict:
+    return copy.deepcopy(spec.get("params", {}))
+
+
+def validate_spec(spec: Dict, source: str = "<spec>"):
+    """Check structure and references, raising SpecError with all problems"""
+    problems = []
+    params = spec.get("params", {})
+
+    def check_refs(value, where):
+        if isinstance(value, str) and value.startswith("$") and value[1:] not in params:
+            problems.append(f"{where}: unknown parameter {value!r}")
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                check_refs(item, f"{where}.{key}")
+        elif isinstance(value, list):
+            for item in value:
+                check_refs(item, where)
+
+    for key in ("name", "collection"):
+        if not isinstance(spec.get(key), str):
+            problems.append(f"missing or non-string {key!r}")
+    for key in sorted(set(spec) - TOP_LEVEL_KEYS):
+        problems.append(f"unknown top-level key {key!r}")
+
+    materials = spec.get("materials", {})
+    for name, material in materials.items():
+        shader = material.get("shader", "principled")
+        if shader not in SHADERS:
+            problems.append(f"material {name!r}: unknown shader {shader!r}")
+            continue
+        for key in sorted(set(material) - SHADERS[shader] - {"shader"}):
+            problems.append(f"material {name!r}: unknown {shader} input {key!r}")
+
+    def check_object(obj, where):
+        if "name" not in obj:
+            problems.append(f"{where}: missing 'name'")
+        if ("primitive" in obj) == ("text" in obj):
+            problems.append(f"{where}: needs exactly one of 'primitive' or 'text'")
+        elif "primitive" in obj and obj["primitive"] not in PRIMITIVES:
+            problems.append(f"{where}: unknown primitive {obj['primitive']!r}")
+        for key in sorted(set(obj) - OBJECT_KEYS - {"radius", "z"}):
+            problems.append(f"{where}: unknown key {key!r}")
+        for material in obj.get("materials", []):
+            if material not in materials:
+                problems.append(f"{where}: unknown material {material!r}")
+
+    names = set()
+    for i, obj in enumerate(spec.get("objects", [])):
+        check_object(obj, f"objects[{i}]")
+        if obj.get("name") in names:
+            problems.append(f"objects[{i}]: duplicate name {obj['name']!r}")
+        names.add(obj.get("name"))
+    for i, ring in enumerate(spec.get("rings", [])):
+        if not ring.get("items"):
+            problems.append(f"rings[{i}]: needs a non-empty 'items' list")
+        for j, obj in enumerate(ring.get("objects", [])):
+            for k, item in enumerate(ring.get("items", [])):
+                check_object(_format(obj, item=item, index=k + 1), f"rings[{i}].objects[{j}]")
+    for i, layout in enumerate(spec.get("scatter", [])):
+        for key in ("count", "types"):
+            if key not in layout:
+                problems.append(f"scatter[{i}]: missing {key!r}")
+        for key in sorted(set(layout) - SCATTER_KEYS):
+            problems.append(f"scatter[{i}]: unknown key {key!r}")
+        if layout.get("backend", "objects") not in SCATTER_BACKENDS:
+            problems.append(f"scatter[{i}]: backend must be one of {', '.join(SCATTER_BACKENDS)}")
+        for j, prop in enumerate(layout.get("types", [])):
+            where = f"scatter[{i}].types[{j}]"
+            if prop.get("primitive") not in PRIMITIVES - {"monkey"}:
+                problems.append(f"{where}: scattered props need a cube, plane, cylinder "
+                                f"or uv_sphere primitive")
+            for key in sorted(set(prop) - PROP_KEYS):
+                problems.append(f"{where}: unknown key {key!r}")
+            for material in prop.get("materials", []):
+                if material not in materials:
+                    problems.append(f"{where}: unknown material {material!r}")
+
+    for i, light in enumerate(spec.get("lights", [])):
+        if light.get("type") not in LIGHT_TYPES:
+            problems.append(f"lights[{i}]: type must be one of {sorted(LIGHT_TYPES)}")
+    render = spec.get("render")
+    if render is not None and render.get("engine") not in RENDER_ENGINES:
+        problems.append(f"render: engine must be one of {sorted(RENDER_ENGINES)}")
+
+    check_refs({key: value for key, value in spec.items() if key != "params"}, "spec")
+    if problems:
+        raise SpecError(source, problems)
+
+
+def _value(value):
+    """Turn "$name" references into Param placeholders"""
+    if isinstance(value, str) and value.startswith("$"):
+        return Param(value[1:])
+    if isinstance(value, dict):
+        return {key: _value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return tuple(_value(item) for item in value)
+    return value
+
+
+def _add_object(scene: SceneBuilder, obj: Dict, location=None) -> str:
+    obj = _value(obj)
+    location = location if location is not None else obj.get("location", (0, 0, 0))
+    rotation = obj.get("rotation", (0, 0, 0))
+    if "text" in obj:
+        return scene.text(obj["name"], obj["text"], obj.get("size", 1.0), location, rotation)
+    var = scene.mesh(obj["name"], obj["primitive"], location, rotation, obj.get("scale", (1, 1, 1)),
+                     obj.get("materials", ()), **obj.get("geometry", {}))
+    for modifier in obj.get("modifiers", ()):
+        settings = dict(modifier)
+        scene.modifier(var, settings.pop("name"), settings.pop("type"), **settings)
+    return var
+
+
+def _format(obj: Dict, **fields) -> Dict:
+    """Fill {item}/{index} placeholders in a ring template's strings"""
+    def fill(value):
+        if isinstance(value, str) and "{" in value:
+            return value.format(**fields)
+        if isinstance(value, list):
+            return [fill(item) for item in value]
+        return value
+    return {key: fill(value) for key, value in obj.items()}
+
+
+_builders: Dict[str, SceneBuilder] = {}
+_scripts: Dict[str, str] = {}
+
+
+def build_scene(spec: Dict) -> SceneBuilder:
+    """SceneBuilder for a validated spec (memoized by spec hash)"""
+    key = spec_hash(spec)
+    if key in _builders:
+        return _builders[key]
+
+    scene = SceneBuilder(spec["collection"], progress=True)
+    scene.raw("setup", f"print({'🔨 Building ' + spec['name'] + '...'!r})")
+
+    for name, material in spec.get("materials", {}).items():
+        settings = _value({k: v for k, v in material.items() if k != "shader"})
+        shader = material.get("shader", "principled")
+        if shader == "emission":
+            scene.emission_material(name, settings["color"], settings["strength"])
+        elif shader == "noise":
+            scene.noise_material(name, settings["roughness"], settings["scale"], settings["colors"])
+        else:
+            scene.principled_material(name, **settings)
+
+    for obj in spec.get("objects", []):
+        _add_object(scene, obj)
+    for ring in spec.get("rings", []):
+        items = ring["items"]
+        for template in ring["objects"]:
+            for i, item in enumerate(items):
+                angle = i / len(items) * 2 * math.pi
+                radius = template.get("radius", ring.get("radius", 4))
+                location = (round(math.cos(angle) * radius, 4), round(math.sin(angle) * radius, 4),
+                            template.get("z", 0))
+                obj = {k: v for k, v in _format(template, item=item, index=i + 1).items()
+                       if k not in ("radius", "z")}
+                _add_object(scene, obj, location)
+    for i, layout in enumerate(spec.get("scatter", [])):
+        transforms = scatter(layout["types"], layout["count"], layout.get("area", (-15, 15, -15, 15)),
+                             layout.get("seed", 0), layout.get("spacing", 0.0),
+                             layout.get("avoid", ()), layout.get("rotate", False))
+        scene.scatter(layout.get("name", f"Scatter_{i + 1}"), layout["types"], transforms,
+                      layout.get("backend", "objects"))
+
+    armature = spec.get("armature")
+    if armature:
+        scene.armature(armature["name"], [tuple(bone) for bone in armature["bones"]],
+                       tuple(armature.get("location", (0, 0, 0))))
+    for light in spec.get("lights", []):
+        settings = _value({k: v for k, v in light.items()
+                           if k not in ("name", "type", "location", "rotation")})
+        scene.light(light["name"], light["type"], tuple(light.get("location", (0, 0, 0))),
+                    tuple(light.get("rotation", (0, 0, 0))), **settings)
+    camera = spec.get("camera")
+    if camera:
+        scene.camera(camera["name"], tuple(camera["location"]), tuple(camera["rotation"]))
+    world = spec.get("world")
+    if world:
+        scene.world(_value(world.get("color")), world.get("strength"))
+    render = spec.get("render")
+    if render:
+        scene.render(render["engine"], tuple(render.get("resolution", (1920, 1080))),
+                     _value(render.get("samples")), **_value(render.get("eevee", {})))
+    scene.summary(*spec.get("summary", []))
+
+    _builders[key] = scene
+    return scene
+
+
+def compile_spec(spec: Dict, profile: bool = False) -> str:
+    """Blender script for a validated spec (memoized by spec hash)
+    
+    ``profile`` adds the in-Blender section profiler (see section_profiler).
+    """
+    key = spec_hash(spec) + ("+profile" if profile else "")
+    if key not in _scripts:
+        _scripts[key] = build_scene(spec).build(profile)
+    return _scripts[key]
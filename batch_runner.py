@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Batch Runner
+
+Non-interactive mode for build pipelines. Jobs are read one JSON object per
+line and run concurrently on the application's transport; each result is
+appended to a results JSONL file as soon as its job finishes.
+
+    {"id": "car-red", "asset": "vehicle", "params": {"body_color": [0.9, 0.1, 0.1, 1.0]}}
+    {"id": "custom", "spec": "asset_specs/medieval_sword.json"}
+
+``asset`` names a built-in asset kind and ``spec`` an asset spec file;
+``params`` overrides the spec's defaults. Blank lines and lines starting
+with ``#`` are skipped.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Optional, TextIO, Union
+
+import asset_scripts
+from asset_result import measured_details
+from asset_spec import compile_spec, default_params, load_spec
+from mcp_transport import MCPError
+import tracing
+
+logger = logging.getLogger(__name__)
+
+
+class JobError(ValueError):
+    """Raised for a job line that cannot be run"""
+
+
+class BatchRunner:
+    """Streams jobs from a JSONL file through a RealAssetCreatorApp"""
+
+    def __init__(self, app, concurrency: int = 4):
+        if concurrency < 1:
+            raise ValueError("Batch concurrency must be at least 1")
+        self.app = app
+        self.concurrency = concurrency
+        self._specs: Dict[str, Dict] = {}
+        self.summary = {"jobs": 0, "succeeded": 0, "failed": 0, "cached": 0}
+
+    def resolve(self, job: Dict):
+        """Category, template name, script, params and log details for a job"""
+        if not isinstance(job, dict):
+            raise JobError("job must be a JSON object")
+        if ("asset" in job) == ("spec" in job):
+            raise JobError("job needs exactly one of 'asset' or 'spec'")
+        if "asset" in job:
+            kind = job["asset"]
+            if kind not in asset_scripts.BUILTIN_SPECS:
+                raise JobError(f"unknown asset {kind!r} "
+                               f"(choose from {', '.join(asset_scripts.BUILTIN_SPECS)})")
+            spec = asset_scripts.builtin_spec(kind)
+        else:
+            path = str(job["spec"])
+            if path not in self._specs:
+                self._specs[path] = load_spec(path)
+            spec = self._specs[path]
+            kind = spec.get("category", "custom")
+
+        params = default_params(spec)
+        overrides = job.get("params") or {}
+        unknown = sorted(set(overrides) - set(params))
+        if unknown:
+            raise JobError(f"unknown param(s) {', '.join(unknown)} for {spec['name']}")
+        params.update(overrides)
+        details = {"batch_job": str(job.get("id", "")), "params": overrides}
+        if "spec" in job:
+            details["spec"] = str(job["spec"])
+        return kind, spec["name"], compile_spec(spec, self.app.profile), params, details
+
+    async def run_job(self, line_no: int, line: str) -> Dict:
+        started = time.perf_counter()
+        record = {"id": f"line-{line_no}", "line": line_no}
+        # Typed once the job line is resolved
+        with self.app.tracer.job("batch") as trace:
+            try:
+                job = json.loads(line)
+                record["id"] = str(job.get("id", record["id"])) if isinstance(job, dict) else record["id"]
+                with tracing.span("script_build"):
+                    kind, template, script, params, details = self.resolve(job)
+                trace.asset_type = kind
+                record["asset"] = template
+                result = await self.app.build_asset(script, template, params)
+                if not result:
+                    raise JobError("Blender script failed")
+                cache = result.get("cache")
+                details.update(measured_details(result.get("report")))
+                self.app.log_asset_creation(kind, template, details, cache, result.get("thumbnail"),
+                                            result.get("profile"), result.get("cache_hit", False))
+                record["status"] = "ok"
+                record["cached"] = bool(result.get("cache_hit"))
+                if result.get("thumbnail"):
+                    record["thumbnail"] = result["thumbnail"]
+                if result.get("profile"):
+                    record["profile"] = result["profile"]
+                if result.get("report"):
+                    record["report"] = result["report"]
+                if cache is not None:
+                    record["files"] = cache["files"]
+                    record["stats"] = cache["stats"]
+            except MCPError as e:
+                # The message is the script's whole output; its last line is the error
+                output = str(e).strip().splitlines()
+                record["status"] = "failed"
+                record["error"] = output[-1] if output else "Blender reported an error"
+            except Exception as e:
+                record["status"] = "failed"
+                record["error"] = str(e)
+            trace.status = record["status"]
+        record["seconds"] = round(time.perf_counter() - started, 4)
+        record["phases"] = {phase: seconds for phase, seconds in trace.phases.items() if seconds}
+        if "worker" in trace.attrs:
+            record["worker"] = trace.attrs["worker"]
+        return record
+
+    async def run(self, jobs: TextIO, results: TextIO) -> Dict:
+        """Run every job line, writing result lines as jobs complete"""
+        slots = asyncio.Semaphore(self.concurrency)
+        pending = set()
+        started = time.perf_counter()
+
+        async def run_one(line_no: int, line: str):
+            try:
+                record = await self.run_job(line_no, line)
+            finally:
+                slots.release()
+            self.summary["jobs"] += 1
+            self.summary["succeeded" if record["status"] == "ok" else "failed"] += 1
+            self.summary["cached"] += bool(record.get("cached"))
+            results.write(json.dumps(record) + "\n")
+            results.flush()
+            mark = "✅" if record["status"] == "ok" else "❌"
+            print(f"{mark} {record['id']} ({record['seconds']:.2f}s)"
+                  + (f": {record['error']}" if "error" in record else ""))
+
+        # Jobs are read only as slots free up, so a huge file is never
+        # loaded or scheduled all at once
+        for line_no, line in enumerate(jobs, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            await slots.acquire()
+            task = asyncio.create_task(run_one(line_no, line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        if pending:
+            await asyncio.gather(*pending)
+
+        wall = time.perf_counter() - started
+        self.summary["wall_seconds"] = round(wall, 3)
+        self.summary["jobs_per_minute"] = round(self.summary["jobs"] / wall * 60, 1) if wall else 0.0
+        return self.summary
+
+
+async def run_batch(app, jobs_path: Union[str, Path], results_path: Optional[Union[str, Path]] = None,
+                    concurrency: int = 4) -> int:
+    """Run a jobs file to completion; returns the process exit code
+
+    0 when every job succeeded, 1 when any failed, 2 when the jobs file
+    could not be read.
+    """
+    results_path = Path(results_path or app.output_dir / "batch_results.jsonl")
+    runner = BatchRunner(app, concurrency)
+    app.quiet = True
+    print(f"📦 Batch {jobs_path} → {results_path} (concurrency {concurrency})")
+    try:
+        with open(jobs_path, 'r') as jobs, open(results_path, 'w') as results:
+            summary = await runner.run(jobs, results)
+    except OSError as e:
+        print(f"❌ Cannot run batch: {e}")
+        return 2
+    finally:
+        await app.close()
+
+    print("\n📊 BATCH SUMMARY")
+    print("="*50)
+    print(f"   Jobs: {summary['jobs']} ({summary['succeeded']} succeeded, "
+          f"{summary['failed']} failed, {summary['cached']} from cache)")
+    print(f"   Wall time: {summary['wall_seconds']:.2f}s ({summary['jobs_per_minute']} jobs/min)")
+    print(f"   Results: {results_path}")
+    return 0 if summary["failed"] == 0 else 1
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Object Creation Benchmark
+
+Measures object-creation throughput inside Blender for the old
+``bpy.ops`` primitive path and the data-API path used by ``SceneBuilder``
+with one mesh per object, as ``bpy.ops`` makes. A separate ``shared_mesh``
+row adds mesh sharing between identical shapes, so the speedup compares
+only operators against the data API. Also times each built-in asset
+script. Scripts run on a real Blender, either a headless worker started
+here or an existing MCP endpoint; the stand-in server only records scripts
+and cannot be timed.
+
+    python benchmark_object_creation.py --count 500
+    python benchmark_object_creation.py --endpoint localhost:30010 --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Dict, List, Optional
+
+import asset_scripts
+from blender_worker_pool import BlenderWorkerPool
+from mcp_transport import MCPConnectionPool, result_text
+from scene_builder import RUNTIME
+
+RESULT_MARKER = "@@BENCHMARK@@"
+
+OPS_SCRIPT = '''
+import bpy
+import time
+
+bpy.ops.object.select_all(action='SELECT')
+bpy.ops.object.delete(use_global=False)
+
+start = time.perf_counter()
+for i in range(COUNT):
+    if i % 2:
+        bpy.ops.mesh.primitive_cylinder_add(location=(i % 50, i // 50, 0))
+    else:
+        bpy.ops.mesh.primitive_cube_add(location=(i % 50, i // 50, 0))
+    bpy.context.active_object.name = f"Bench_{i}"
+bpy.context.view_layer.update()
+elapsed = time.perf_counter() - start
+'''
+
+# One mesh per object, like the bpy.ops path, so the two compare only the
+# cost of going through operators
+DATA_SCRIPT = '''
+import time
+
+_clear_scene()
+start = time.perf_counter()
+_collection = _asset_collection("Benchmark")
+for i in range(COUNT):
+    primitive = "cylinder" if i % 2 else "cube"
+    _place(bpy.data.objects.new(f"Bench_{i}", _primitive_mesh(f"Bench_{i}", primitive)),
+           _collection, (i % 50, i // 50, 0), (0, 0, 0), (1, 1, 1))
+bpy.context.view_layer.update()
+elapsed = time.perf_counter() - start
+'''
+
+# What SceneBuilder does: repeated shapes share one mesh datablock
+SHARED_SCRIPT = '''
+import time
+
+_clear_scene()
+start = time.perf_counter()
+_collection = _asset_collection("Benchmark")
+for i in range(COUNT):
+    _mesh_object(_collection, f"Bench_{i}", "cylinder" if i % 2 else "cube", (i % 50, i // 50, 0))
+bpy.context.view_layer.update()
+elapsed = time.perf_counter() - start
+'''
+
+def timed(script: str) -> str:
+    """Wrap a script so it reports its wall time and object count"""
+    return (f"import time as _bench_time\n_bench_start = _bench_time.perf_counter()\n{script}\n"
+            f"import bpy as _bench_bpy, json as _bench_json\n"
+            f"print({RESULT_MARKER!r} + _bench_json.dumps({{"
+            f"'seconds': globals().get('elapsed', _bench_time.perf_counter() - _bench_start), "
+            f"'objects': len(_bench_bpy.context.scene.objects)}}))\n")
+
+
+def parse_measurement(result: Dict) -> Dict:
+    for line in reversed(result_text(result).splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):])
+    raise RuntimeError("No timing in Blender output; is the server running scripts (not recording)?")
+
+
+async def run_benchmark(transport, count: int, repeat: int) -> Dict:
+    async def best_of(script: str) -> Dict:
+        runs = [parse_measurement(await transport.execute_script(script)) for _ in range(repeat)]
+        return min(runs, key=lambda run: run["seconds"])
+
+    results = {"count": count, "repeat": repeat, "primitives": {}, "assets": {}}
+    for name, script in [("bpy.ops", OPS_SCRIPT), ("data_api", RUNTIME + DATA_SCRIPT),
+                         ("shared_mesh", RUNTIME + SHARED_SCRIPT)]:
+        run = await best_of(timed(script.replace("COUNT", str(count))))
+        run["objects_per_second"] = count / run["seconds"] if run["seconds"] else None
+        results["primitives"][name] = run
+    ops, data = results["primitives"]["bpy.ops"], results["primitives"]["data_api"]
+    results["speedup"] = ops["seconds"] / data["seconds"] if data["seconds"] else None
+
+    for name in asset_scripts.BUILTIN_SPECS:
+        params = asset_scripts.asset_params(name)
+        script = f"{RUNTIME}\n_clear_scene()\nparams = {params!r}\n{asset_scripts.asset_script(name)}"
+        results["assets"][name] = await best_of(timed(script))
+    return results
+
+
+def print_results(results: Dict):
+    print(f"\n📊 OBJECT CREATION ({results['count']} objects, best of {results['repeat']})")
+    print("="*60)
+    for name, run in results["primitives"].items():
+        print(f"   {name:<12} {run['seconds']:8.3f}s  {run['objects_per_second']:10.0f} objects/s")
+    if results["speedup"]:
+        print(f"   ⚡ Data API speedup: {results['speedup']:.1f}x")
+    print("\n🎨 ASSET SCRIPTS")
+    for name, run in results["assets"].items():
+        print(f"   {name:<12} {run['seconds']:8.3f}s  {run['objects']:4d} objects")
+
+
+async def main(endpoints: Optional[List[str]], blender_path: str, count: int, repeat: int,
+               json_path: Optional[str]) -> int:
+    if endpoints:
+        transport = MCPConnectionPool(endpoints)
+    else:
+        transport = BlenderWorkerPool(1, blender_path)
+        await transport.start()
+    try:
+        results = await run_benchmark(transport, count, repeat)
+    except Exception as e:
+        print(f"❌ Benchmark failed: {e}")
+        return 1
+    finally:
+        await transport.close()
+
+    print_results(results)
+    if json_path:
+        with open(json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {json_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bpy.ops vs data-API object creation")
+    parser.add_argument("--endpoint", "-e", action="append", dest="endpoints",
+                        help="Benchmark against a running MCP Blender Server instead of a new worker")
+    parser.add_argument("--blender", default="blender", help="Path to the Blender executable")
+    parser.add_argument("--count", type=int, default=500, help="Objects created per run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept)")
+    parser.add_argument("--json", dest="json_path", help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.endpoints, args.blender, args.count, args.repeat, args.json_path)))
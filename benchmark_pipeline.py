@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark
+
+End-to-end benchmarks of the asset pipeline, written as one JSON document
+per run so results from different commits can be compared:
+
+- script generation: building each built-in asset's script from its spec
+- transport: round-trip latency of an empty script and a template run,
+  and pipelined requests per second
+- session log: ``log_asset_creation`` cost per event as a session grows
+- complete scene: ``create_complete_scene`` end to end, full and unchanged
+- throughput: assets per minute at several worker counts
+
+Transport, complete-scene and throughput runs use local stand-in servers
+(``local_mcp_server.py`` in record mode, one per simulated worker, each
+holding every script for ``--stand-in-latency-ms``) and, when a Blender
+executable is found, real headless workers as well.
+
+    python benchmark_pipeline.py --json bench.json
+    python benchmark_pipeline.py --quick --no-blender --compare bench.json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import asset_scripts
+import asset_spec
+from local_mcp_server import LocalMCPServer
+from mcp_transport import MCPConnectionPool
+from real_asset_creator_app import RealAssetCreatorApp
+from script_templates import TemplateRegistry
+
+# Relative change beyond which --compare flags a metric, and the metrics it checks
+REGRESSION_THRESHOLD = 0.10
+GATED_METRICS = ("p50_ms", "mean_ms", "_seconds", "_us_per_event", "per_minute", "per_second")
+
+
+def summarize(seconds: List[float]) -> Dict:
+    """Latency summary in milliseconds"""
+    ordered = sorted(seconds)
+    return {
+        "runs": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 4),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 4),
+        "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)] * 1000, 4),
+        "min_ms": round(ordered[0] * 1000, 4),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).parent, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def bench_script_generation(repeat: int) -> Dict:
+    """Spec -> SceneBuilder -> script, uncached, per built-in asset"""
+    results = {}
+    for kind in asset_scripts.BUILTIN_SPECS:
+        spec = asset_scripts.builtin_spec(kind)
+        times, script = [], ""
+        for _ in range(repeat):
+            # compile_spec memoizes both the builder and the script by spec hash
+            asset_spec._builders.clear()
+            asset_spec._scripts.clear()
+            started = time.perf_counter()
+            script = asset_spec.compile_spec(spec)
+            times.append(time.perf_counter() - started)
+        results[kind] = {**summarize(times), "script_bytes": len(script)}
+    return results
+
+
+async def bench_round_trip(endpoints: List[str], count: int) -> Dict:
+    """Sequential and pipelined round trips on warm connections"""
+    transport = MCPConnectionPool(endpoints)
+    template = TemplateRegistry().template("bench_noop", "value = params['n']")
+    try:
+        await transport.execute_script("pass")
+        await transport.run_template(template, {"n": 0})
+
+        script_times, template_times = [], []
+        for i in range(count):
+            started = time.perf_counter()
+            await transport.execute_script("pass")
+            script_times.append(time.perf_counter() - started)
+            started = time.perf_counter()
+            await transport.run_template(template, {"n": i})
+            template_times.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(transport.run_template(template, {"n": i}) for i in range(count)))
+        pipelined = time.perf_counter() - started
+    finally:
+        await transport.close()
+    return {"execute_script": summarize(script_times), "run_template": summarize(template_times),
+            "pipelined_requests_per_second": round(count / pipelined, 1)}
+
+
+async def bench_session_log(events: int, bucket: int) -> Dict:
+    """Per-event ``log_asset_creation`` cost at the start and end of a long session"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        app = RealAssetCreatorApp(output_dir, cache_size_mb=0)
+        details = {"components": "Blade, crossguard, handle, pommel", "materials": 4}
+        buckets = []
+        for start in range(0, events, bucket):
+            started = time.perf_counter()
+            for i in range(start, min(start + bucket, events)):
+                app.log_asset_creation("weapon", f"bench_{i}", details)
+            buckets.append((time.perf_counter() - started) / bucket)
+        started = time.perf_counter()
+        await app.close()
+        close_seconds = time.perf_counter() - started
+    return {
+        "events": events,
+        "first_bucket_us_per_event": round(buckets[0] * 1e6, 3),
+        "last_bucket_us_per_event": round(buckets[-1] * 1e6, 3),
+        "growth": round(buckets[-1] / buckets[0], 3) if buckets[0] else None,
+        "close_and_compact_seconds": round(close_seconds, 4),
+    }
+
+
+async def bench_complete_scene(make_app: Callable[[str], RealAssetCreatorApp]) -> Dict:
+    """``create_complete_scene`` from empty, then again with nothing changed"""
+    with tempfile.TemporaryDirectory() as output_dir:
+        app = make_app(output_dir)
+        timings = {}
+        try:
+            for run in ("full", "unchanged"):
+                started = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    await app.create_complete_scene()
+                timings[f"{run}_seconds"] = round(time.perf_counter() - started, 4)
+            timings["succeeded"] = app.session_log["total_assets"] == 2
+        finally:
+            with contextlib.redirect_stdout(io.StringIO()):
+                await app.close()
+    return timings
+
+
+async def bench_throughput(make_app: Callable[[str, int], RealAssetCreatorApp],
+                           worker_counts: List[int], rounds: int) -> Dict:
+    """Built-in assets per minute, all submitted at once, per worker count"""
+    kinds = list(asset_scripts.BUILTIN_SPECS)
+    jobs = [(asset_scripts.asset_script(kind), asset_scripts.builtin_spec(kind)["name"],
+             asset_scripts.asset_params(kind)) for kind in kinds]
+    results = {}
+    for workers in worker_counts:
+        with tempfile.TemporaryDirectory() as output_dir:
+            app = make_app(output_dir, workers)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    # Warm up: start workers and register every template on each
+                    await asyncio.gather(*(app.build_asset(*job) for job in jobs * workers))
+                    started = time.perf_counter()
+                    built = await asyncio.gather(*(app.build_asset(*job) for job in jobs * rounds))
+                    wall = time.perf_counter() - started
+            finally:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    await app.close()
+        assets = sum(bool(result) for result in built)
+        results[str(workers)] = {"assets": assets, "failed": len(built) - assets,
+                                 "wall_seconds": round(wall, 4),
+                                 "assets_per_minute": round(assets / wall * 60, 1)}
+    return results
+
+
+async def run_stand_in(args) -> Dict:
+    # Round trips are timed on a server that holds nothing, so only the
+    # transport is measured
+    servers = [LocalMCPServer("localhost", 0, mode="record")] + [
+        LocalMCPServer("localhost", 0, mode="record", latency=args.stand_in_latency_ms / 1000)
+        for _ in range(max(args.worker_counts))]
+    await asyncio.gather(*(server.start() for server in servers))
+    bare, endpoints = servers[0].endpoint, [server.endpoint for server in servers[1:]]
+    try:
+        return {
+            "latency_ms": args.stand_in_latency_ms,
+            "round_trip": await bench_round_trip([bare], args.round_trips),
+            "complete_scene": await bench_complete_scene(
+                lambda output_dir: RealAssetCreatorApp(output_dir, endpoints[:1], cache_size_mb=0)),
+            "throughput": await bench_throughput(
+                lambda output_dir, workers: RealAssetCreatorApp(output_dir, endpoints[:workers],
+                                                                cache_size_mb=0),
+                args.worker_counts, args.rounds),
+        }
+    finally:
+        await asyncio.gather(*(server.stop() for server in servers))
+
+
+async def run_blender(args) -> Dict:
+    def make_app(output_dir: str, workers: int = 1) -> RealAssetCreatorApp:
+        return RealAssetCreatorApp(output_dir, workers=workers, blender_path=args.blender,
+                                   cache_size_mb=0)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        app = make_app(output_dir)
+        try:
+            await app.transport.start()
+            version = await app.transport.blender_version()
+            worker = app.transport.workers[0]
+            round_trip = await bench_round_trip([f"{worker.host}:{worker.port}"], args.round_trips)
+        finally:
+            await app.close()
+    return {
+        "blender_version": version,
+        "round_trip": round_trip,
+        "complete_scene": await bench_complete_scene(make_app),
+        "throughput": await bench_throughput(make_app, args.worker_counts, args.rounds),
+    }
+
+
+def flatten(results: Dict, prefix: str = "") -> Dict[str, float]:
+    """Numeric leaves keyed by dotted path"""
+    flat = {}
+    for key, value in results.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(flatten(value, path + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[path] = value
+    return flat
+
+
+def compare(baseline: Dict, results: Dict, threshold: float = REGRESSION_THRESHOLD) -> List[str]:
+    """Metrics that moved past ``threshold`` in the wrong direction
+
+    Only medians, means, totals and rates are compared; minimums and p95s
+    are too noisy between runs to gate on.
+    """
+    old, new = flatten(baseline), flatten(results)
+    regressions = []
+    for path in sorted(old.keys() & new.keys()):
+        if not path.endswith(GATED_METRICS) or not old[path]:
+            continue
+        change = (new[path] - old[path]) / old[path]
+        # Rates should not drop; times and per-event costs should not rise
+        worse = -change if path.endswith(("per_minute", "per_second")) else change
+        if worse > threshold:
+            regressions.append(f"{path}: {old[path]} → {new[path]} ({change:+.0%})")
+    return regressions
+
+
+def print_results(results: Dict):
+    print("\n📊 PIPELINE BENCHMARK")
+    print("="*60)
+    print("\n🧱 Script generation (p50)")
+    for kind, run in results["script_generation"].items():
+        print(f"   {kind:<12} {run['p50_ms']:8.2f} ms  {run['script_bytes'] / 1024:7.1f} KB")
+    log = results["session_log"]
+    print(f"\n📝 Session log: {log['first_bucket_us_per_event']:.1f} → "
+          f"{log['last_bucket_us_per_event']:.1f} µs/event over {log['events']} events "
+          f"({log['growth']}x)")
+    for backend in ("stand_in", "blender"):
+        run = results.get(backend)
+        if not run:
+            continue
+        print(f"\n🔌 {backend.replace('_', '-')}")
+        trip = run["round_trip"]
+        print(f"   Round trip: script p50 {trip['execute_script']['p50_ms']:.2f} ms, "
+              f"template p50 {trip['run_template']['p50_ms']:.2f} ms, "
+              f"{trip['pipelined_requests_per_second']:.0f} req/s pipelined")
+        scene = run["complete_scene"]
+        print(f"   Complete scene: {scene['full_seconds']:.3f}s full, "
+              f"{scene['unchanged_seconds']:.3f}s unchanged")
+        for workers, through in run["throughput"].items():
+            print(f"   {workers:>3} worker(s): {through['assets_per_minute']:8.1f} assets/min")
+
+
+async def main(args) -> int:
+    results = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "script_generation": bench_script_generation(args.repeat),
+        "session_log": await bench_session_log(args.log_events, args.log_bucket),
+        "stand_in": await run_stand_in(args),
+    }
+    blender = None if args.no_blender else shutil.which(args.blender)
+    results["meta"]["blender"] = blender
+    if blender:
+        try:
+            results["blender"] = await run_blender(args)
+        except Exception as e:
+            print(f"⚠️ Blender benchmarks skipped: {e}")
+    else:
+        print("ℹ️ No Blender executable found; stand-in results only")
+
+    print_results(results)
+    if args.json_path:
+        with open(args.json_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results written to {args.json_path}")
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        print(f"\n🔍 Compared with {args.compare}: "
+              + ("no regressions" if not regressions else f"{len(regressions)} regression(s)"))
+        for line in regressions:
+            print(f"   ⚠️ {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the asset creation pipeline")
+    parser.add_argument("--blender", default="blender", help="Path to the Blender executable")
+    parser.add_argument("--no-blender", action="store_true",
+                        help="Only benchmark against the stand-in servers")
+    parser.add_argument("--workers", dest="worker_counts", default=[1, 2, 4, 8],
+                        type=lambda text: [int(n) for n in text.split(",")],
+                        help="Comma-separated worker counts (default 1,2,4,8)")
+    parser.add_argument("--stand-in-latency-ms", type=float, default=20.0,
+                        help="Time each stand-in server holds a script, simulating Blender")
+    parser.add_argument("--repeat", type=int, default=20, help="Script generation runs per asset")
+    parser.add_argument("--round-trips", type=int, default=200, help="Round trips per latency test")
+    parser.add_argument("--log-events", type=int, default=20000,
+                        help="Assets logged in the session log benchmark")
+    parser.add_argument("--log-bucket", type=int, default=1000, help="Events per timing bucket")
+    parser.add_argument("--rounds", type=int, default=4,
+                        help="Times each built-in asset is built per throughput run")
+    parser.add_argument("--quick", action="store_true", help="Small sizes for a fast smoke run")
+    parser.add_argument("--json", dest="json_path", help="Write results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE_JSON",
+                        help="Flag metrics worse than this earlier result by --threshold (exit 1)")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="Relative change --compare treats as a regression (default 0.10)")
+    args = parser.parse_args()
+    if args.quick:
+        args.repeat, args.round_trips, args.log_events, args.rounds = 3, 20, 2000, 1
+        args.worker_counts = [n for n in args.worker_counts if n <= 2] or [1]
+
+    sys.exit(asyncio.run(main(args)))
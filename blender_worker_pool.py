@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Blender Worker Pool
+
+Starts and supervises N headless Blender processes, each running
+local_mcp_server.py in exec mode, and sends every script to whichever
+worker is idle. Stub workers (in-process stand-in servers) replace Blender
+when it is not installed, so parallel pipelines can be exercised anywhere.
+"""
+
+import asyncio
+import logging
+import socket
+import subprocess
+import time
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+from local_mcp_server import LocalMCPServer
+from mcp_transport import EXECUTE_TOOL, MCPConnection, MCPError, MCPTimeout
+import tracing
+
+logger = logging.getLogger(__name__)
+
+SERVER_SCRIPT = Path(__file__).resolve().parent / "local_mcp_server.py"
+
+
+def find_free_port(host: str = "localhost") -> int:
+    """Ask the OS for a currently unused TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class BlenderWorker:
+    """One supervised headless Blender process (or stub) serving MCP"""
+
+    def __init__(self, worker_id: int, blender_path: str = "blender",
+                 stub: bool = False, stub_latency: float = 0.0,
+                 startup_timeout: float = 60.0, log_dir: Optional[Path] = None):
+        self.worker_id = worker_id
+        self.blender_path = blender_path
+        self.stub = stub
+        self.stub_latency = stub_latency
+        self.startup_timeout = startup_timeout
+        self.log_dir = log_dir
+        self.host = "localhost"
+        self.port = 0
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.stub_server: Optional[LocalMCPServer] = None
+        self.connection: Optional[MCPConnection] = None
+
+        self.started_at = 0.0
+        self.busy_seconds = 0.0
+        self.jobs_completed = 0
+        self.jobs_failed = 0
+        self.restarts = 0
+
+    @property
+    def name(self) -> str:
+        return f"worker-{self.worker_id}"
+
+    @property
+    def is_healthy(self) -> bool:
+        if self.connection is None or not self.connection.is_open:
+            return False
+        return self.process is None or self.process.returncode is None
+
+    async def start(self):
+        """Launch the worker and connect to it once it accepts requests"""
+        if self.stub:
+            self.stub_server = LocalMCPServer(self.host, 0, mode="record", latency=self.stub_latency)
+            await self.stub_server.start()
+            self.port = self.stub_server.port
+        else:
+            self.port = find_free_port(self.host)
+            log = subprocess.DEVNULL
+            if self.log_dir is not None:
+                self.log_dir.mkdir(parents=True, exist_ok=True)
+                log = open(self.log_dir / f"{self.name}.log", "ab")
+            try:
+                self.process = await asyncio.create_subprocess_exec(
+                    self.blender_path, "--background", "--factory-startup",
+                    "--python", str(SERVER_SCRIPT), "--",
+                    "--host", self.host, "--port", str(self.port), "--mode", "exec",
+                    stdout=log, stderr=subprocess.STDOUT,
+                )
+            finally:
+                if log is not subprocess.DEVNULL:
+                    log.close()
+
+        await self._connect()
+        if not self.started_at:
+            # Utilization is measured over the worker's whole life, restarts included
+            self.started_at = time.monotonic()
+        logger.info(f"{self.name} ready on {self.host}:{self.port}")
+
+    async def restart(self):
+        """Tear down a dead or wedged worker and bring up a fresh one"""
+        logger.warning(f"Restarting {self.name}")
+        await self.stop()
+        self.restarts += 1
+        await self.start()
+
+    async def execute(self, script: str, timeout: Optional[float] = None) -> Dict:
+        return await self._timed(self.connection.call_tool(EXECUTE_TOOL, {"script": script}, timeout))
+
+    async def run_template(self, template, params: Optional[Dict] = None,
+                           timeout: Optional[float] = None) -> Dict:
+        return await self._timed(self.connection.run_template(template, params, timeout))
+
+    async def stream(self, events: AsyncIterator[Dict]) -> AsyncIterator[Dict]:
+        """Relay a streaming job's events while accounting it to this worker"""
+        started = time.monotonic()
+        try:
+            async for event in events:
+                yield event
+            self.jobs_completed += 1
+        except Exception:
+            self.jobs_failed += 1
+            raise
+        finally:
+            self.busy_seconds += time.monotonic() - started
+
+    async def _timed(self, job) -> Dict:
+        started = time.monotonic()
+        try:
+            result = await job
+            self.jobs_completed += 1
+            return result
+        except Exception:
+            self.jobs_failed += 1
+            raise
+        finally:
+            self.busy_seconds += time.monotonic() - started
+
+    async def stop(self):
+        if self.connection is not None:
+            await self.connection.close()
+            self.connection = None
+        if self.stub_server is not None:
+            await self.stub_server.stop()
+            self.stub_server = None
+        if self.process is not None:
+            if self.process.returncode is None:
+                self.process.kill()
+            await self.process.wait()
+            self.process = None
+
+    def utilization(self) -> Dict:
+        uptime = time.monotonic() - self.started_at if self.started_at else 0.0
+        return {
+            "worker": self.name,
+            "endpoint": f"{self.host}:{self.port}",
+            "jobs_completed": self.jobs_completed,
+            "jobs_failed": self.jobs_failed,
+            "restarts": self.restarts,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "uptime_seconds": round(uptime, 3),
+            "utilization": round(self.busy_seconds / uptime, 3) if uptime else 0.0,
+        }
+
+    async def _connect(self):
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            if self.process is not None and self.process.returncode is not None:
+                raise MCPError(f"{self.name} exited during startup (code {self.process.returncode})")
+            connection = MCPConnection(self.host, self.port, connect_timeout=5.0)
+            try:
+                await connection.connect()
+                self.connection = connection
+                return
+            except (OSError, asyncio.TimeoutError, MCPError):
+                await connection.close()
+                if time.monotonic() > deadline:
+                    raise MCPError(f"{self.name} did not start within {self.startup_timeout}s")
+                await asyncio.sleep(0.25)
+
+
+class BlenderWorkerPool:
+    """Supervised pool of Blender workers; scripts go to whichever is idle
+    
+    A job that misses its deadline or is cancelled may still be running
+    inside Blender, so its worker is recycled (killed and restarted) in the
+    background before it takes new work. At most ``max_queued`` callers
+    wait for a worker at once; further callers block until a slot frees.
+    """
+
+    def __init__(self, size: int, blender_path: str = "blender", stub: bool = False,
+                 stub_latency: float = 0.0, startup_timeout: float = 60.0,
+                 log_dir: Optional[Path] = None, max_queued: int = 64):
+        if size < 1:
+            raise ValueError("Worker pool size must be at least 1")
+        self.workers = [
+            BlenderWorker(i + 1, blender_path, stub, stub_latency, startup_timeout, log_dir)
+            for i in range(size)
+        ]
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(size + max_queued)
+        self._recycling = set()
+        self._version: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return len(self.workers)
+
+    async def start(self):
+        """Start every worker in parallel (idempotent)"""
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            try:
+                await asyncio.gather(*(worker.start() for worker in self.workers))
+            except BaseException:
+                await asyncio.gather(*(worker.stop() for worker in self.workers),
+                                     return_exceptions=True)
+                raise
+            self._idle = asyncio.Queue()
+            for worker in self.workers:
+                self._idle.put_nowait(worker)
+
+    async def execute_script(self, script: str, timeout: Optional[float] = None) -> Dict:
+        """Run a script on the next idle worker, restarting it if it has died"""
+        return await self._on_idle_worker(lambda worker: worker.execute(script, timeout))
+
+    async def run_template(self, template, params: Optional[Dict] = None,
+                           timeout: Optional[float] = None) -> Dict:
+        """Run a template on the next idle worker (uploaded once per worker)"""
+        return await self._on_idle_worker(lambda worker: worker.run_template(template, params, timeout))
+
+    async def stream_script(self, script: str, timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """Run a script on the next idle worker, yielding events as they arrive"""
+        async for event in self._stream_on_idle_worker(
+                lambda worker: worker.connection.stream_tool(EXECUTE_TOOL, {"script": script}, timeout)):
+            yield event
+
+    async def stream_template(self, template, params: Optional[Dict] = None,
+                              timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """Run a template on the next idle worker, yielding events as they arrive"""
+        async for event in self._stream_on_idle_worker(
+                lambda worker: worker.connection.stream_template(template, params, timeout)):
+            yield event
+
+    async def blender_version(self) -> str:
+        """Version of the workers' Blender, asked of the executable rather than a worker"""
+        if self._version is None:
+            worker = self.workers[0]
+            if worker.stub:
+                self._version = "stub"
+            else:
+                process = await asyncio.create_subprocess_exec(
+                    worker.blender_path, "--version",
+                    stdout=asyncio.subprocess.PIPE, stderr=subprocess.DEVNULL,
+                )
+                output, _ = await process.communicate()
+                # First line reads e.g. "Blender 4.1.0"
+                lines = output.decode(errors="replace").strip().splitlines()
+                self._version = lines[0].replace("Blender", "").strip() if lines else "unknown"
+        return self._version
+
+    def utilization(self) -> List[Dict]:
+        """Per-worker job counts and busy ratio"""
+        return [worker.utilization() for worker in self.workers]
+
+    async def close(self):
+        for task in list(self._recycling):
+            task.cancel()
+        await asyncio.gather(*self._recycling, return_exceptions=True)
+        await asyncio.gather(*(worker.stop() for worker in self.workers))
+        self._idle = None
+
+    async def _on_idle_worker(self, job) -> Dict:
+        started = time.perf_counter()
+        async with self._slots:
+            worker = await self._checkout()
+            self._traced(worker, started)
+            recycle = False
+            try:
+                return await job(worker)
+            except (MCPTimeout, asyncio.CancelledError):
+                recycle = True
+                raise
+            except MCPError:
+                recycle = not worker.is_healthy
+                raise
+            finally:
+                self._checkin(worker, recycle)
+
+    async def _stream_on_idle_worker(self, job) -> AsyncIterator[Dict]:
+        started = time.perf_counter()
+        async with self._slots:
+            worker = await self._checkout()
+            self._traced(worker, started)
+            # Anything but a clean finish (deadline, cancellation, the
+            # consumer abandoning the stream) may leave Blender busy.
+            recycle = True
+            try:
+                async for event in worker.stream(job(worker)):
+                    yield event
+                recycle = False
+            except MCPError as e:
+                recycle = isinstance(e, MCPTimeout) or not worker.is_healthy
+                raise
+            finally:
+                self._checkin(worker, recycle)
+
+    async def _checkout(self) -> BlenderWorker:
+        await self.start()
+        worker = await self._idle.get()
+        if not worker.is_healthy:
+            try:
+                await worker.restart()
+            except BaseException:
+                self._idle.put_nowait(worker)
+                raise
+        return worker
+
+    @staticmethod
+    def _traced(worker: BlenderWorker, started: float):
+        # Time from asking for a worker to holding one, for the current job
+        tracing.record("queue_wait", started, worker=worker.name)
+        tracing.annotate(worker=worker.name)
+
+    def _checkin(self, worker: BlenderWorker, recycle: bool):
+        if not recycle:
+            self._idle.put_nowait(worker)
+            return
+        task = asyncio.create_task(self._recycle(worker))
+        self._recycling.add(task)
+        task.add_done_callback(self._recycling.discard)
+
+    async def _recycle(self, worker: BlenderWorker):
+        try:
+            await worker.restart()
+        except Exception as e:
+            # Left unhealthy; the next checkout retries the restart
+            logger.error(f"Failed to recycle {worker.name}: {e}")
+        if self._idle is not None:
+            self._idle.put_nowait(worker)
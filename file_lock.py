@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+File Lock
+
+Cross-process exclusive lock on a lock file, used wherever several app or
+launcher processes share files under ``output_dir``.
+"""
+
+import contextlib
+from pathlib import Path
+from typing import Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextlib.contextmanager
+def file_lock(path: Union[str, Path]):
+    """Hold an exclusive lock on ``path`` (created if missing) for the block"""
+    with open(path, "a+") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
@@ -6,10 +6,18 @@ Launch script for the production asset creation application.
 Integrates with MCP Blender Server to create actual 3D assets.
 """
 
+import argparse
 import asyncio
 import sys
 import os
+import time
 from pathlib import Path
+from typing import List, Optional
+
+from mcp_transport import DEFAULT_ENDPOINT, MCPConnectionPool, result_text
+from session_catalog import SessionCatalog
+from tracing import Tracer
+import tracing
 
 def display_launcher_menu():
     """Display launcher options"""
@@ -29,11 +37,17 @@ def display_launcher_menu():
     
     return input("\n🎯 Select option (0-5): ").strip()
 
-async def test_mcp_connection():
+async def test_mcp_connection(transport: MCPConnectionPool, tracer: Optional[Tracer] = None):
     """Test connection to MCP Blender Server"""
     print("\n🔧 TESTING MCP BLENDER SERVER CONNECTION")
     print("="*50)
     
+    with (tracer or Tracer()).job("connection_test") as job:
+        ok = await _test_connection(transport)
+        job.status = "ok" if ok else "failed"
+    return ok
+
+async def _test_connection(transport: MCPConnectionPool) -> bool:
     try:
         # Test script to verify Blender connection
         test_script = '''
@@ -53,9 +67,12 @@ print("✅ MCP integration is working!")
         
         print("🔄 Executing test script in Blender...")
         
-        # Here you would call your MCP Blender Server
-        # For now, we'll simulate the test
-        await asyncio.sleep(1)
+        with tracing.span("transport"):
+            connection = await transport.acquire()
+        print(f"🔗 Connected to {connection.endpoint} ({connection.server_info.get('name', 'unknown server')})")
+        with tracing.span("transport"):
+            result = await transport.execute_script(test_script)
+        print(result_text(result))
         
         print("✅ MCP Blender Server connection test completed!")
         print("🎯 Ready to create real 3D assets!")
@@ -65,6 +82,7 @@ print("✅ MCP integration is working!")
     except Exception as e:
         print(f"❌ MCP connection failed: {e}")
         print("💡 Make sure your MCP Blender Server is running")
+        print("💡 Or start the local stand-in: python local_mcp_server.py --port 30010")
         return False
 
 def show_integration_instructions():
@@ -78,16 +96,18 @@ def show_integration_instructions():
 1. 📡 Start MCP Blender Server:
    mcp-blender-server --port 30010
 
-2. 🔗 Update the execute_blender_script method in real_asset_creator_app.py:
-   
-   async def execute_blender_script(self, script: str):
-       try:
-           # Use your MCP Blender Server tools
-           result = await blender___execute_blender_script(script=script)
-           return result.get('content', [{}])[0].get('text', '')
-       except Exception as e:
-           logger.error(f"MCP execution failed: {e}")
-           return False
+   Or run Blender headless with the bundled server:
+   blender --background --python local_mcp_server.py -- --port 30010 --mode exec
+
+   Or, without Blender, the local stand-in that records scripts:
+   python local_mcp_server.py --port 30010
+
+2. 🔗 Point the application at one or more endpoints:
+   python launch_real_creator.py --endpoint localhost:30010
+   python real_asset_creator_app.py -e host1:30010 -e host2:30010
+
+   Connections are persistent and pipelined (mcp_transport.py), so the
+   handshake is paid once per connection, not once per asset.
 
 3. 🎯 The application is ready with production scripts for:
    • 👤 Game characters with rigging and materials
@@ -113,12 +133,12 @@ def show_integration_instructions():
 ✅ PBR material workflows
 ✅ Asset logging and tracking
 ✅ Export pipeline preparation
-🔄 Needs MCP server connection for real execution
+✅ Persistent pooled MCP transport
 
 💡 TIP: Test the connection first (option 2) before running the full application!
 """)
 
-async def quick_demo():
+async def quick_demo(transport: MCPConnectionPool, tracer: Optional[Tracer] = None):
     """Run a quick asset creation demo"""
     print("\n🎯 QUICK ASSET CREATION DEMO")
     print("="*50)
@@ -169,77 +189,142 @@ print("✅ Treasure chest created!")
 print("🎯 Switch to Material Preview to see the wooden chest!")
 '''
     
-    try:
-        print("🔄 Creating treasure chest in Blender...")
-        # Here you would execute via MCP
-        await asyncio.sleep(1)
-        print("✅ Demo asset created successfully!")
-        print("🎯 Check Blender viewport to see the treasure chest!")
-        
-    except Exception as e:
-        print(f"❌ Demo failed: {e}")
+    with (tracer or Tracer()).job("demo") as job:
+        try:
+            print("🔄 Creating treasure chest in Blender...")
+            with tracing.span("transport"):
+                result = await transport.execute_script(demo_script)
+            print(result_text(result))
+            print("✅ Demo asset created successfully!")
+            print("🎯 Check Blender viewport to see the treasure chest!")
+            
+        except Exception as e:
+            job.status = "failed"
+            print(f"❌ Demo failed: {e}")
 
-def view_previous_sessions():
-    """View previous asset creation sessions"""
+def view_previous_sessions(output_dir: str = "created_assets", page_size: int = 10):
+    """Browse previous asset creation sessions from the session catalog"""
     print("\n📊 PREVIOUS SESSIONS")
     print("="*50)
     
-    sessions_dir = Path("created_assets")
+    sessions_dir = Path(output_dir)
     if not sessions_dir.exists():
         print("❌ No previous sessions found.")
         return
     
-    session_files = list(sessions_dir.glob("real_assets_session*.json"))
-    
-    if not session_files:
-        print("❌ No session files found.")
-        return
-    
-    print(f"📁 Found {len(session_files)} session(s):")
-    for i, session_file in enumerate(session_files, 1):
-        print(f"{i}. {session_file.name}")
+    catalog = SessionCatalog(sessions_dir)
+    try:
+        # Summary files from before the catalog existed are indexed once
+        imported = catalog.import_summaries()
+        if imported:
+            print(f"📥 Indexed {imported} older session file(s)")
         
-        try:
-            import json
-            with open(session_file, 'r') as f:
-                data = json.load(f)
-                print(f"   📅 Started: {data.get('session_start', 'Unknown')[:19]}")
-                print(f"   🎯 Assets: {data.get('total_assets', 0)}")
-                print()
-        except Exception as e:
-            print(f"   ❌ Error reading file: {e}")
+        filters = {"category": None, "since": None, "until": None}
+        page = 1
+        while True:
+            sessions, total = catalog.list_sessions(page=page, page_size=page_size, **filters)
+            if not total:
+                print("❌ No sessions match." if any(filters.values()) else "❌ No session files found.")
+            else:
+                pages = (total + page_size - 1) // page_size
+                active = ", ".join(f"{key}={value}" for key, value in filters.items() if value)
+                print(f"\n📁 {total} session(s), page {page}/{pages}" + (f" ({active})" if active else ""))
+                for i, session in enumerate(sessions, (page - 1) * page_size + 1):
+                    print(f"{i}. {session['session_id']}")
+                    print(f"   📅 Started: {(session['session_start'] or 'Unknown')[:19]}")
+                    breakdown = ", ".join(f"{category} {count}" for category, count
+                                          in sorted(session["categories"].items()))
+                    print(f"   🎯 Assets: {session['total_assets']}" + (f" ({breakdown})" if breakdown else ""))
+            
+            command = input("\n[n]ext [p]rev | c <category> | s <YYYY-MM-DD> since | "
+                            "u <YYYY-MM-DD> until | x clear | q back: ").strip().split(maxsplit=1)
+            if not command or command[0] == "q":
+                break
+            action, value = command[0], command[1] if len(command) > 1 else None
+            if action == "n" and total and page < pages:
+                page += 1
+            elif action == "p" and page > 1:
+                page -= 1
+            elif action in ("c", "s", "u"):
+                filters[{"c": "category", "s": "since", "u": "until"}[action]] = value
+                page = 1
+            elif action == "x":
+                filters = dict.fromkeys(filters)
+                page = 1
+    finally:
+        catalog.close()
 
-async def main():
+async def main(endpoints: Optional[List[str]] = None, workers: int = 0,
+               blender_path: str = "blender", stub_workers: bool = False, trace: bool = False):
     """Main launcher function"""
+    endpoints = endpoints or [DEFAULT_ENDPOINT]
+    transport = MCPConnectionPool(endpoints)
+    # The launcher's own jobs (connection test, demo); the application
+    # writes its own trace next to this one
+    tracer = Tracer(Path("created_assets") / "traces" if trace else None,
+                    f"launcher_{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}")
     while True:
         choice = display_launcher_menu()
         
         if choice == '0':
             print("\n👋 Thanks for using Real Asset Creator!")
+            await transport.close()
+            for path in tracer.write():
+                print(f"⏱️ Trace written to {path}")
             break
         elif choice == '1':
             print("\n🚀 Launching Real Asset Creator Application...")
             try:
                 from real_asset_creator_app import RealAssetCreatorApp
-                app = RealAssetCreatorApp()
+                app = RealAssetCreatorApp(endpoints=endpoints, workers=workers,
+                                          blender_path=blender_path,
+                                          stub_workers=stub_workers, trace=trace)
                 await app.run_application()
             except ImportError as e:
                 print(f"❌ Failed to import application: {e}")
                 print("💡 Make sure real_asset_creator_app.py is in the same directory")
         elif choice == '2':
-            await test_mcp_connection()
+            await test_mcp_connection(transport, tracer)
         elif choice == '3':
             show_integration_instructions()
         elif choice == '4':
-            await quick_demo()
+            await quick_demo(transport, tracer)
         elif choice == '5':
             view_previous_sessions()
         else:
             print("❌ Invalid choice. Please select 0-5.")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Real Asset Creator Launcher")
+    parser.add_argument("--endpoint", "-e", action="append", dest="endpoints",
+                        help=f"MCP Blender Server endpoint host:port (repeatable, default {DEFAULT_ENDPOINT})")
+    parser.add_argument("--workers", "-w", type=int, default=0,
+                        help="Start this many headless Blender workers for the application")
+    parser.add_argument("--blender", default="blender",
+                        help="Path to the Blender executable for --workers")
+    parser.add_argument("--stub-workers", action="store_true",
+                        help="Use in-process stand-in workers instead of Blender (testing)")
+    parser.add_argument("--batch", metavar="JOBS_JSONL",
+                        help="Run the jobs in this JSONL file without menus, then exit")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Batch jobs in flight at once")
+    parser.add_argument("--results", metavar="RESULTS_JSONL",
+                        help="Batch results file (default: created_assets/batch_results.jsonl)")
+    parser.add_argument("--trace", action="store_true",
+                        help="Write JSON traces and Prometheus metrics of every asset job "
+                             "to created_assets/traces")
+    args = parser.parse_args()
+    
+    if args.batch:
+        from batch_runner import run_batch
+        from real_asset_creator_app import RealAssetCreatorApp
+        app = RealAssetCreatorApp(endpoints=args.endpoints, workers=args.workers,
+                                  blender_path=args.blender, stub_workers=args.stub_workers,
+                                  trace=args.trace)
+        sys.exit(asyncio.run(run_batch(app, args.batch, args.results, args.concurrency)))
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(args.endpoints, args.workers, args.blender, args.stub_workers, args.trace))
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
     except Exception as e:
@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+Local MCP Server
+
+Stand-in MCP Blender Server speaking the same newline-delimited JSON-RPC
+protocol as the transport in mcp_transport.py. It either records scripts
+(compiling them so syntax errors still surface) or executes them, which
+lets latency and throughput be measured without a Blender install.
+
+When launched inside Blender it executes scripts against the real bpy:
+
+    blender --background --python local_mcp_server.py -- --port 30010 --mode exec
+
+Launched as a program, the asyncio loop serves clients on a background
+thread while scripts run one at a time on the main thread, where bpy (and
+its operators in particular) must be called from.
+"""
+
+import argparse
+import asyncio
+import concurrent.futures
+import contextlib
+import ctypes
+import io
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SERVER_INFO = {"name": "local-mcp-blender", "version": "1.0"}
+PROTOCOL_VERSION = "2024-11-05"
+STREAM_LIMIT = 16 * 1024 * 1024
+
+# JSON-RPC error codes (kept in sync with mcp_transport.py)
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+TEMPLATE_NOT_FOUND = -32004
+
+EXECUTE_TOOL_SCHEMA = {
+    "name": "execute_blender_script",
+    "description": "Execute a Python script in Blender and return its output",
+    "inputSchema": {
+        "type": "object",
+        "properties": {"script": {"type": "string"}},
+        "required": ["script"],
+    },
+}
+
+REGISTER_TEMPLATE_SCHEMA = {
+    "name": "register_template",
+    "description": "Compile a script once and keep it under a handle",
+    "inputSchema": {
+        "type": "object",
+        "properties": {"handle": {"type": "string"}, "source": {"type": "string"}},
+        "required": ["handle", "source"],
+    },
+}
+
+RUN_TEMPLATE_SCHEMA = {
+    "name": "run_template",
+    "description": "Run a registered template with a params dict",
+    "inputSchema": {
+        "type": "object",
+        "properties": {"handle": {"type": "string"}, "params": {"type": "object"}},
+        "required": ["handle"],
+    },
+}
+
+
+class MethodNotFound(Exception):
+    """Raised for JSON-RPC methods or tools this server does not offer"""
+
+
+class TemplateNotFound(Exception):
+    """Raised when run_template names a handle this server never compiled"""
+
+
+class ScriptTimeout(BaseException):
+    """Raised inside a running script when its deadline passes"""
+
+
+class ScriptCancelled(BaseException):
+    """Raised inside a running script when its client cancels the request"""
+
+
+class ScriptWatchdog:
+    """Interrupts the script running in its ``with`` block on deadline or cancel
+    
+    Pure-Python sections stop at once; a script stuck inside a long C call
+    (e.g. a render) only stops when it returns to Python, which is why the
+    worker pool also recycles workers whose calls time out client-side.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        self._thread_id = None
+        self._timer = None
+        if timeout:
+            self._timer = threading.Timer(timeout, self.interrupt, (ScriptTimeout,))
+            self._timer.daemon = True
+        self._lock = threading.Lock()
+        self._armed = False
+        self._fired = False
+        self._pending = None
+
+    def __enter__(self):
+        with self._lock:
+            if self._pending is not None:
+                # Cancelled while still queued behind the executor
+                raise self._pending
+            self._thread_id = threading.get_ident()
+            self._armed = True
+        if self._timer is not None:
+            self._timer.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self._armed = False
+            if self._timer is not None:
+                self._timer.cancel()
+            if self._fired:
+                # Clear the interrupt in case it had not been delivered yet
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self._thread_id), None)
+        return False
+
+    def interrupt(self, exception=ScriptCancelled):
+        """Raise ``exception`` in the script; safe to call from any thread"""
+        with self._lock:
+            if self._thread_id is None:
+                self._pending = exception
+            elif self._armed and not self._fired:
+                self._fired = True
+                ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(self._thread_id),
+                                                           ctypes.py_object(exception))
+
+
+class ProgressStream:
+    """Sends a running script's stdout lines and progress reports to the client"""
+
+    def __init__(self, send, token):
+        self._send = send
+        self.token = token
+
+    def line(self, text: str):
+        self._send({"jsonrpc": "2.0", "method": "notifications/message",
+                    "params": {"level": "info", "logger": "stdout",
+                               "data": {"progressToken": self.token, "line": text}}})
+
+    def progress(self, progress: float, total: Optional[float] = None, message: str = ""):
+        params = {"progressToken": self.token, "progress": progress, "message": message}
+        if total is not None:
+            params["total"] = total
+        self._send({"jsonrpc": "2.0", "method": "notifications/progress", "params": params})
+
+
+class StreamingOutput(io.StringIO):
+    """Captures stdout and forwards every completed line as it is printed"""
+
+    def __init__(self, stream: ProgressStream):
+        super().__init__()
+        self._stream = stream
+        self._partial = ""
+
+    def write(self, text: str) -> int:
+        written = super().write(text)
+        *lines, self._partial = (self._partial + text).split("\n")
+        for line in lines:
+            self._stream.line(line)
+        return written
+
+    def finish(self):
+        if self._partial:
+            self._stream.line(self._partial)
+            self._partial = ""
+
+
+class ScriptOutput:
+    """sys.stdout while a script runs: its thread prints into ``capture``
+
+    Other threads (the event loop, an in-process client) keep printing to
+    the real stdout, since scripts no longer run on the loop's thread.
+    """
+
+    def __init__(self, capture: io.StringIO, original):
+        self._capture = capture
+        self._original = original
+        self._thread_id = threading.get_ident()
+
+    def write(self, text: str) -> int:
+        if threading.get_ident() == self._thread_id:
+            return self._capture.write(text)
+        return self._original.write(text)
+
+    def flush(self):
+        self._original.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
+
+
+class LocalMCPServer:
+    """Stand-in MCP server that records or executes Blender scripts"""
+
+    def __init__(self, host: str = "localhost", port: int = 30010,
+                 mode: str = "record", latency: float = 0.0, main_thread_scripts: bool = False):
+        if mode not in ("record", "exec"):
+            raise ValueError(f"Unknown server mode '{mode}'")
+        self.host = host
+        self.port = port
+        self.mode = mode
+        self.latency = latency
+
+        self.recorded_scripts: List[str] = []
+        self.templates: Dict[str, object] = {}
+        self.stats = {"connections": 0, "requests": 0, "scripts": 0,
+                      "compiles": 0, "exec_seconds": 0.0}
+
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Blender runs scripts one at a time; mirror that. Scripts run off
+        # the event loop's thread so it keeps reading requests, accepting
+        # connections and streaming output while one runs: on the thread
+        # calling run_scripts() with main_thread_scripts, otherwise on a
+        # script thread started with the server.
+        self._exec_lock = asyncio.Lock()
+        self._scripts: "queue.Queue" = queue.Queue()
+        self.main_thread_scripts = main_thread_scripts
+        self._script_thread: Optional[threading.Thread] = None
+
+    async def start(self):
+        """Start listening; port 0 picks a free port"""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port, limit=STREAM_LIMIT
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.mode == "exec" and not self.main_thread_scripts and self._script_thread is None:
+            self._script_thread = threading.Thread(target=self.run_scripts, name="mcp-exec", daemon=True)
+            self._script_thread.start()
+        logger.info(f"Local MCP server listening on {self.host}:{self.port} ({self.mode} mode)")
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._scripts.put(None)
+
+    def run_scripts(self):
+        """Run queued scripts on the calling thread until the server stops
+
+        Under Blender this is the main thread; see ``serve_in_main_thread``.
+        """
+        while True:
+            try:
+                # Wake up now and then so Ctrl-C is handled while idle
+                job = self._scripts.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if job is None:
+                return
+            run, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(run())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def serve_in_main_thread(self):
+        """Serve clients from a background thread and run scripts on this one"""
+        def serve():
+            try:
+                asyncio.run(self.serve_forever())
+            except Exception as e:
+                logger.error(f"Local MCP server stopped: {e}")
+            finally:
+                self._scripts.put(None)
+
+        self.main_thread_scripts = True
+        threading.Thread(target=serve, name="mcp-loop", daemon=True).start()
+        self.run_scripts()
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.stats["connections"] += 1
+        tasks: Dict[object, asyncio.Task] = {}
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    self._write(writer, {"jsonrpc": "2.0", "id": None,
+                                         "error": {"code": -32700, "message": "Parse error"}})
+                    continue
+                if message.get("method") == "notifications/cancelled":
+                    # Drops a request still queued for execution and
+                    # interrupts one already running
+                    task = tasks.get((message.get("params") or {}).get("requestId"))
+                    if task is not None:
+                        task.cancel()
+                    continue
+                if "id" not in message:
+                    continue  # other notifications
+                # Requests are handled concurrently so pipelined calls queue
+                # here rather than waiting for a client round trip each.
+                request_id = message["id"]
+                task = asyncio.create_task(self._handle_message(message, writer))
+                tasks[request_id] = task
+                task.add_done_callback(lambda _, key=request_id: tasks.pop(key, None))
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            for task in list(tasks.values()):
+                task.cancel()
+            writer.close()
+
+    async def _handle_message(self, message: Dict, writer: asyncio.StreamWriter):
+        self.stats["requests"] += 1
+        request_id = message["id"]
+        params = message.get("params") or {}
+        meta = params.get("_meta") or {}
+        token = meta.get("progressToken")
+        stream = None
+        if token is not None:
+            # Scripts print on the exec thread; writes go through the loop
+            loop = asyncio.get_running_loop()
+            stream = ProgressStream(lambda note: loop.call_soon_threadsafe(self._write, writer, note),
+                                    token)
+        try:
+            result = await self._dispatch(message.get("method"), params, stream, meta.get("timeout"))
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except TemplateNotFound as e:
+            response = {"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": TEMPLATE_NOT_FOUND, "message": str(e)}}
+        except MethodNotFound as e:
+            response = {"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": METHOD_NOT_FOUND, "message": str(e)}}
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            # Anything else, SystemExit included, is answered rather than
+            # taking the event loop down
+            response = {"jsonrpc": "2.0", "id": request_id,
+                        "error": {"code": INTERNAL_ERROR, "message": str(e) or type(e).__name__}}
+        self._write(writer, response)
+
+    async def _dispatch(self, method: str, params: Dict,
+                        stream: Optional[ProgressStream] = None,
+                        timeout: Optional[float] = None) -> Dict:
+        if method == "initialize":
+            return {"protocolVersion": PROTOCOL_VERSION,
+                    "capabilities": {"tools": {}},
+                    "serverInfo": SERVER_INFO}
+        if method == "ping":
+            return {}
+        if method == "tools/list":
+            return {"tools": [EXECUTE_TOOL_SCHEMA, REGISTER_TEMPLATE_SCHEMA, RUN_TEMPLATE_SCHEMA]}
+        if method == "tools/call":
+            name = params.get("name")
+            arguments = params.get("arguments") or {}
+            if name == EXECUTE_TOOL_SCHEMA["name"]:
+                return await self._execute_script(arguments.get("script", ""), stream, timeout)
+            if name == REGISTER_TEMPLATE_SCHEMA["name"]:
+                return self._register_template(arguments["handle"], arguments["source"])
+            if name == RUN_TEMPLATE_SCHEMA["name"]:
+                return await self._run_template(arguments["handle"], arguments.get("params") or {},
+                                                stream, timeout)
+            raise MethodNotFound(f"Unknown tool '{name}'")
+        raise MethodNotFound(f"Method not found: {method}")
+
+    async def _execute_script(self, script: str, stream: Optional[ProgressStream] = None,
+                              timeout: Optional[float] = None) -> Dict:
+        try:
+            code = self._compile(script, "<mcp-script>")
+        except SyntaxError:
+            return self._tool_result(traceback.format_exc(limit=0), True)
+        if self.mode == "record":
+            self.recorded_scripts.append(script)
+        return await self._execute(code, {}, f"Recorded script ({len(script)} bytes)", stream, timeout)
+
+    def _register_template(self, handle: str, source: str) -> Dict:
+        try:
+            self.templates[handle] = self._compile(source, f"<template {handle}>")
+        except SyntaxError:
+            return self._tool_result(traceback.format_exc(limit=0), True)
+        return self._tool_result(f"Registered template {handle}", False)
+
+    async def _run_template(self, handle: str, params: Dict,
+                            stream: Optional[ProgressStream] = None,
+                            timeout: Optional[float] = None) -> Dict:
+        code = self.templates.get(handle)
+        if code is None:
+            raise TemplateNotFound(f"Template not registered: {handle}")
+        if self.mode == "record":
+            self.recorded_scripts.append(f"# run_template {handle} {params!r}")
+        return await self._execute(code, {"params": params}, f"Ran template {handle}", stream, timeout)
+
+    def _compile(self, source: str, filename: str):
+        self.stats["compiles"] += 1
+        return compile(source, filename, "exec")
+
+    async def _execute(self, code, namespace: Dict, record_note: str,
+                       stream: Optional[ProgressStream] = None,
+                       timeout: Optional[float] = None) -> Dict:
+        queued = time.perf_counter()
+        async with self._exec_lock:
+            started = time.perf_counter()
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if self.mode == "record":
+                output, is_error = record_note, False
+            else:
+                watchdog = ScriptWatchdog(timeout)
+                job = concurrent.futures.Future()
+                self._scripts.put((lambda: self._run(code, namespace, stream, timeout, watchdog), job))
+                running = asyncio.wrap_future(job)
+                try:
+                    output, is_error = await asyncio.shield(running)
+                except asyncio.CancelledError:
+                    watchdog.interrupt()
+                    # Keep the lock until the script has actually stopped
+                    await running
+                    raise
+            elapsed = time.perf_counter() - started
+            self.stats["scripts"] += 1
+            self.stats["exec_seconds"] += elapsed
+        result = self._tool_result(output, is_error)
+        # Lets clients tell time behind other scripts and running time from the round trip
+        result["_meta"] = {"queueSeconds": round(started - queued, 6),
+                           "execSeconds": round(elapsed, 6)}
+        return result
+
+    def _run(self, code, namespace: Dict, stream: Optional[ProgressStream] = None,
+             timeout: Optional[float] = None, watchdog: Optional[ScriptWatchdog] = None):
+        globals_ = {"__name__": "__main__", **namespace}
+        if stream is not None:
+            # Scripts report structured progress with report_progress(done, total, message)
+            stdout = StreamingOutput(stream)
+            globals_["report_progress"] = stream.progress
+        else:
+            stdout = io.StringIO()
+        watchdog = watchdog or ScriptWatchdog(timeout)
+        try:
+            with contextlib.redirect_stdout(ScriptOutput(stdout, sys.stdout)), watchdog:
+                exec(code, globals_)
+        except ScriptTimeout:
+            stdout.write(f"\nScript exceeded its {timeout}s deadline and was interrupted\n")
+            return stdout.getvalue(), True
+        except ScriptCancelled:
+            stdout.write("\nScript was cancelled by the client and interrupted\n")
+            return stdout.getvalue(), True
+        except BaseException:
+            # sys.exit() or KeyboardInterrupt in a script ends the script, not the server
+            stdout.write(traceback.format_exc())
+            return stdout.getvalue(), True
+        finally:
+            if stream is not None:
+                stdout.finish()
+        return stdout.getvalue(), False
+
+    @staticmethod
+    def _tool_result(text: str, is_error: bool) -> Dict:
+        return {"content": [{"type": "text", "text": text}], "isError": is_error}
+
+    @staticmethod
+    def _write(writer: asyncio.StreamWriter, message: Dict):
+        if not writer.is_closing():
+            writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+
+def parse_args(argv=None):
+    # Under Blender, our arguments follow a literal "--".
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+    parser = argparse.ArgumentParser(description="Local stand-in MCP Blender Server")
+    parser.add_argument("--host", default="localhost", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=30010, help="Port to listen on (0 = any free port)")
+    parser.add_argument("--mode", choices=["record", "exec"], default="record",
+                        help="Record scripts without running them, or execute them")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Simulated per-script execution time in seconds")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    args = parse_args()
+    server = LocalMCPServer(args.host, args.port, args.mode, args.latency)
+    try:
+        server.serve_in_main_thread()
+    except KeyboardInterrupt:
+        pass
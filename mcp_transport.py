@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+MCP Transport
+
+Async JSON-RPC client for MCP Blender Server endpoints. Connections are
+persistent and pipelined: many requests can be in flight on one socket,
+and a pool reuses those sockets across asset creations so the connect and
+``initialize`` handshake are only paid once per connection.
+
+Wire format is newline-delimited JSON-RPC 2.0 over TCP, one message per line.
+"""
+
+import asyncio
+import contextlib
+import itertools
+import json
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import tracing
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT = "localhost:30010"
+PROTOCOL_VERSION = "2024-11-05"
+CLIENT_INFO = {"name": "real-asset-creator", "version": "1.0"}
+
+EXECUTE_TOOL = "execute_blender_script"
+REGISTER_TEMPLATE_TOOL = "register_template"
+RUN_TEMPLATE_TOOL = "run_template"
+
+# JSON-RPC error codes (kept in sync with local_mcp_server.py)
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+TEMPLATE_NOT_FOUND = -32004
+
+# Scripts print machine-readable lines for the client (e.g.
+# "@@MCP_RESULT@@{...}") starting with this; they are not console output
+MARKER_PREFIX = "@@MCP_"
+
+# Asset scripts are sent as a single JSON line, so the stream reader must
+# accept lines far larger than asyncio's 64 KiB default.
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class MCPError(Exception):
+    """Raised when an MCP endpoint returns an error or the connection drops"""
+
+    def __init__(self, message: str, code: Optional[int] = None, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class MCPTimeout(MCPError):
+    """Raised when a call misses its deadline; the server is told to cancel it"""
+
+
+def parse_endpoint(endpoint: str) -> Tuple[str, int]:
+    """Split a ``host:port`` endpoint string"""
+    host, sep, port = endpoint.rpartition(":")
+    if not sep or not host:
+        raise ValueError(f"Invalid MCP endpoint '{endpoint}', expected host:port")
+    return host, int(port)
+
+
+def tool_params(name: str, arguments: Dict, timeout: Optional[float] = None) -> Dict:
+    """Build tools/call params; the deadline is forwarded so servers can enforce it too"""
+    meta = {} if timeout is None else {"timeout": timeout}
+    return {"name": name, "arguments": arguments, "_meta": meta}
+
+
+def result_text(result: Dict) -> str:
+    """Join the text content blocks of an MCP tool result"""
+    return "\n".join(
+        block.get("text", "")
+        for block in result.get("content", [])
+        if block.get("type", "text") == "text"
+    )
+
+
+def is_marker_line(line: str) -> bool:
+    """Whether a line of script output is a machine-readable marker line"""
+    return line.startswith(MARKER_PREFIX)
+
+
+def console_text(text: str) -> str:
+    """Script output with its marker lines removed, for printing"""
+    return "\n".join(line for line in text.splitlines() if not is_marker_line(line))
+
+
+def server_timings(result: Dict) -> List[Tuple[str, float]]:
+    """Phases a server timed itself, from the result's ``_meta``
+    
+    local_mcp_server.py reports how long a call waited behind other scripts
+    and how long it ran; other servers report nothing.
+    """
+    meta = result.get("_meta") or {}
+    return [(phase, meta[key]) for phase, key in (("queue_wait", "queueSeconds"),
+                                                  ("blender_exec", "execSeconds"))
+            if isinstance(meta.get(key), (int, float))]
+
+
+class MCPConnection:
+    """One persistent, pipelined JSON-RPC connection to an MCP endpoint"""
+
+    def __init__(self, host: str, port: int, connect_timeout: float = 10.0):
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.server_info: Dict = {}
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._read_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._streams: Dict[str, asyncio.Queue] = {}
+
+        # Template handles already compiled on the server behind this socket
+        self.registered_templates = set()
+        self.supports_templates = True
+
+    @property
+    def endpoint(self) -> str:
+        return f"{self.host}:{self.port}"
+
+    @property
+    def is_open(self) -> bool:
+        return self._read_task is not None and not self._read_task.done()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests sent on this connection and not yet answered"""
+        return len(self._pending)
+
+    async def connect(self):
+        """Open the socket and perform the MCP initialize handshake"""
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, limit=STREAM_LIMIT),
+            timeout=self.connect_timeout,
+        )
+        self._read_task = asyncio.create_task(self._read_loop())
+
+        init = await self.request("initialize", {
+            "protocolVersion": PROTOCOL_VERSION,
+            "capabilities": {},
+            "clientInfo": CLIENT_INFO,
+        })
+        self.server_info = init.get("serverInfo", {})
+        await self.notify("notifications/initialized")
+        logger.info(f"Connected to MCP endpoint {self.endpoint} ({self.server_info.get('name', 'unknown')})")
+
+    async def request(self, method: str, params: Optional[Dict] = None,
+                      timeout: Optional[float] = None):
+        """Send a request and wait for its response without blocking other requests
+        
+        If the deadline passes or the caller is cancelled, the server is sent
+        ``notifications/cancelled`` for the request.
+        """
+        if not self.is_open:
+            raise MCPError(f"Connection to {self.endpoint} is closed")
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            await self._send(message)
+            if timeout is None:
+                return await future
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            self._cancel_remote(request_id, "timeout")
+            raise MCPTimeout(f"{method} on {self.endpoint} exceeded its {timeout}s deadline")
+        except asyncio.CancelledError:
+            self._cancel_remote(request_id, "cancelled by client")
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def notify(self, method: str, params: Optional[Dict] = None):
+        """Send a notification (no response expected)"""
+        message = {"jsonrpc": "2.0", "method": method}
+        if params is not None:
+            message["params"] = params
+        await self._send(message)
+
+    async def call_tool(self, name: str, arguments: Dict, timeout: Optional[float] = None) -> Dict:
+        """Call an MCP tool and return its result, raising on tool errors"""
+        result = await self.request("tools/call", tool_params(name, arguments, timeout), timeout)
+        tracing.remote(server_timings(result))
+        if result.get("isError"):
+            raise MCPError(result_text(result) or f"Tool '{name}' failed")
+        return result
+
+    async def stream_tool(self, name: str, arguments: Dict,
+                          timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """Call an MCP tool, yielding stdout/progress events while it runs
+        
+        Events are dicts: ``{"type": "stdout", "line": ...}``,
+        ``{"type": "progress", "progress": ..., "total": ..., "message": ...}``
+        and finally ``{"type": "result", "result": ...}``. Servers that do
+        not stream simply produce the final result event.
+        """
+        token = f"{id(self):x}-{next(self._ids)}"
+        events: asyncio.Queue = asyncio.Queue()
+        self._streams[token] = events
+        params = tool_params(name, arguments, timeout)
+        params["_meta"]["progressToken"] = token
+        call = asyncio.create_task(self.request("tools/call", params))
+        deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+        # Notifications are queued in arrival order, before the response
+        # that completes the call, so the sentinel always comes last.
+        call.add_done_callback(lambda _: events.put_nowait(None))
+        try:
+            while True:
+                if deadline is None:
+                    event = await events.get()
+                else:
+                    remaining = deadline - asyncio.get_running_loop().time()
+                    try:
+                        event = await asyncio.wait_for(events.get(), max(remaining, 0))
+                    except asyncio.TimeoutError:
+                        raise MCPTimeout(f"{name} on {self.endpoint} exceeded its {timeout}s deadline")
+                if event is None:
+                    break
+                yield event
+            result = call.result()
+            tracing.remote(server_timings(result))
+            if result.get("isError"):
+                raise MCPError(result_text(result) or f"Tool '{name}' failed")
+            yield {"type": "result", "result": result}
+        finally:
+            self._streams.pop(token, None)
+            if not call.done():
+                call.cancel()
+
+    async def run_template(self, template, params: Optional[Dict] = None,
+                           timeout: Optional[float] = None) -> Dict:
+        """Run a ScriptTemplate by handle, uploading it on first use"""
+        for attempt in range(2):
+            name, arguments = await self._template_call(template, params)
+            try:
+                return await self.call_tool(name, arguments, timeout)
+            except MCPError as e:
+                if e.code == TEMPLATE_NOT_FOUND and attempt == 0:
+                    self.registered_templates.discard(template.handle)
+                    continue
+                raise
+
+    async def stream_template(self, template, params: Optional[Dict] = None,
+                              timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """Streaming counterpart of run_template"""
+        name, arguments = await self._template_call(template, params)
+        async for event in self.stream_tool(name, arguments, timeout):
+            yield event
+
+    async def _template_call(self, template, params: Optional[Dict]) -> Tuple[str, Dict]:
+        """Pick the tool call for a template, uploading it on first use"""
+        if self.supports_templates and template.handle not in self.registered_templates:
+            try:
+                await self.call_tool(REGISTER_TEMPLATE_TOOL,
+                                     {"handle": template.handle, "source": template.source})
+                self.registered_templates.add(template.handle)
+            except MCPError as e:
+                if e.code not in (METHOD_NOT_FOUND, INVALID_PARAMS):
+                    raise
+                # Plain MCP Blender servers only offer execute_blender_script
+                logger.info(f"{self.endpoint} has no template support; sending full scripts")
+                self.supports_templates = False
+
+        if not self.supports_templates:
+            return EXECUTE_TOOL, {"script": template.render(params)}
+        return RUN_TEMPLATE_TOOL, {"handle": template.handle, "params": params or {}}
+
+    async def close(self):
+        """Close the socket and fail any requests still waiting"""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        if self._read_task is not None:
+            self._read_task.cancel()
+            try:
+                await self._read_task
+            except asyncio.CancelledError:
+                pass
+        self._fail_pending(MCPError(f"Connection to {self.endpoint} closed"))
+
+    def _cancel_remote(self, request_id: int, reason: str):
+        """Tell the server to drop a request we no longer wait for"""
+        if self.is_open:
+            task = asyncio.ensure_future(self.notify("notifications/cancelled",
+                                                     {"requestId": request_id, "reason": reason}))
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+    async def _send(self, message: Dict):
+        data = json.dumps(message, separators=(",", ":")).encode() + b"\n"
+        async with self._write_lock:
+            self._writer.write(data)
+            await self._writer.drain()
+
+    async def _read_loop(self):
+        error = MCPError(f"Connection to {self.endpoint} lost")
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Ignoring malformed message from {self.endpoint}")
+                    continue
+                self._dispatch(message)
+        except (ConnectionError, OSError, asyncio.IncompleteReadError) as e:
+            error = MCPError(f"Connection to {self.endpoint} lost: {e}")
+        finally:
+            self._fail_pending(error)
+
+    def _dispatch(self, message: Dict):
+        if "id" not in message:
+            self._dispatch_notification(message.get("method"), message.get("params") or {})
+            return
+        future = self._pending.get(message.get("id"))
+        if future is None or future.done():
+            return
+        if "error" in message:
+            err = message["error"]
+            future.set_exception(MCPError(err.get("message", "Unknown error"),
+                                          err.get("code"), err.get("data")))
+        else:
+            future.set_result(message.get("result", {}))
+
+    def _dispatch_notification(self, method: str, params: Dict):
+        if method == "notifications/progress":
+            events = self._streams.get(params.get("progressToken"))
+            if events is not None:
+                events.put_nowait({"type": "progress",
+                                   "progress": params.get("progress"),
+                                   "total": params.get("total"),
+                                   "message": params.get("message", "")})
+        elif method == "notifications/message":
+            data = params.get("data") or {}
+            events = self._streams.get(data.get("progressToken")) if isinstance(data, dict) else None
+            if events is not None:
+                events.put_nowait({"type": "stdout", "line": data.get("line", "")})
+
+    def _fail_pending(self, error: Exception):
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+
+class MCPConnectionPool:
+    """Persistent, reusable connections to one or more Blender MCP endpoints"""
+
+    def __init__(self, endpoints: Optional[List[str]] = None,
+                 connections_per_endpoint: int = 1,
+                 connect_timeout: float = 10.0,
+                 max_in_flight: int = 64):
+        self.endpoints = list(endpoints or [DEFAULT_ENDPOINT])
+        # Callers beyond this many outstanding scripts wait here (backpressure)
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._slots: List[MCPConnection] = [
+            MCPConnection(*parse_endpoint(endpoint), connect_timeout=connect_timeout)
+            for endpoint in self.endpoints
+            for _ in range(connections_per_endpoint)
+        ]
+        self._connect_locks = [asyncio.Lock() for _ in self._slots]
+        # Calls currently assigned to each slot, counted from the moment a
+        # slot is picked rather than when its request is sent
+        self._leases = [0] * len(self._slots)
+
+    async def acquire(self) -> MCPConnection:
+        """Return the least-loaded connection, (re)connecting lazily"""
+        async with self._lease() as connection:
+            return connection
+
+    @contextlib.asynccontextmanager
+    async def _lease(self):
+        """The least-loaded connection, counted as busy until the block exits"""
+        started = time.perf_counter()
+        async with self._in_flight:
+            # Unopened slots count as idle: they are connected on first use
+            order = sorted(range(len(self._slots)),
+                           key=lambda i: (self._leases[i] + self._slots[i].in_flight,
+                                          not self._slots[i].is_open))
+            last_error = None
+            for index in order:
+                # Reserve before connecting, so callers arriving together spread out
+                self._leases[index] += 1
+                try:
+                    connection = await self._ensure_open(index)
+                except (OSError, asyncio.TimeoutError, MCPError) as e:
+                    self._leases[index] -= 1
+                    last_error = e
+                    logger.warning(f"MCP endpoint {self._slots[index].endpoint} unavailable: {e}")
+                    continue
+                tracing.record("queue_wait", started, worker=connection.endpoint)
+                tracing.annotate(worker=connection.endpoint)
+                try:
+                    yield connection
+                finally:
+                    self._leases[index] -= 1
+                return
+            raise MCPError(f"No MCP endpoint reachable ({last_error})")
+
+    async def execute_script(self, script: str, timeout: Optional[float] = None) -> Dict:
+        """Run a Blender script on the least-loaded endpoint"""
+        async with self._lease() as connection:
+            return await connection.call_tool(EXECUTE_TOOL, {"script": script}, timeout)
+
+    async def run_template(self, template, params: Optional[Dict] = None,
+                           timeout: Optional[float] = None) -> Dict:
+        """Run a registered template on the least-loaded endpoint"""
+        async with self._lease() as connection:
+            return await connection.run_template(template, params, timeout)
+
+    async def stream_script(self, script: str, timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """Run a script, yielding output and progress events as they arrive"""
+        async with self._lease() as connection:
+            async for event in connection.stream_tool(EXECUTE_TOOL, {"script": script}, timeout):
+                yield event
+
+    async def stream_template(self, template, params: Optional[Dict] = None,
+                              timeout: Optional[float] = None) -> AsyncIterator[Dict]:
+        """Run a template, yielding output and progress events as they arrive"""
+        async with self._lease() as connection:
+            async for event in connection.stream_template(template, params, timeout):
+                yield event
+
+    async def close(self):
+        """Close every open connection in the pool"""
+        await asyncio.gather(*(conn.close() for conn in self._slots if conn.is_open))
+
+    async def _ensure_open(self, index: int) -> MCPConnection:
+        connection = self._slots[index]
+        if connection.is_open:
+            return connection
+        async with self._connect_locks[index]:
+            connection = self._slots[index]
+            if not connection.is_open:
+                connection = MCPConnection(connection.host, connection.port,
+                                           connection.connect_timeout)
+                try:
+                    await connection.connect()
+                except BaseException:
+                    await connection.close()
+                    raise
+                self._slots[index] = connection
+        return connection
@@ -8,15 +8,33 @@ materials, lighting, and export capabilities.
 """
 
 import asyncio
-import json
 import logging
-import os
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 import argparse
 
+import asset_scripts
+from asset_cache import SAVE_SOURCE, AssetCache, blender_version, cache_key, parse_stats
+from asset_exporter import EXPORT_FORMATS, LOD_RATIOS, AssetExporter, parse_formats, parse_lod_ratios
+from asset_result import measured_details, parse_result
+from asset_spec import compile_spec, default_params, load_spec
+from batch_runner import run_batch
+from blender_worker_pool import BlenderWorkerPool
+from mcp_transport import (DEFAULT_ENDPOINT, MCPConnectionPool, MCPError, console_text, is_marker_line,
+                           result_text)
+from render_farm import RenderFarm, parse_frames, parse_grid
+from scene_builder import RUNTIME
+from scene_graph import APPLY_SOURCE, SceneGraph, SceneSync, apply_params, diff
+from script_batcher import ScriptBatcher
+from section_profiler import format_profile, parse_profile
+from session_log import SessionLog
+from thumbnails import THUMBNAIL_ENGINES, THUMBNAIL_SOURCE, ThumbnailStore
+from script_templates import TemplateRegistry
+from tracing import Tracer, traced
+import tracing
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -24,20 +42,96 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def format_progress(event: Dict) -> str:
+    """Render a streamed progress event as a short status line"""
+    if event.get("total"):
+        return f"{event['progress'] / event['total']:.0%} {event.get('message', '')}".rstrip()
+    return event.get("message") or str(event.get("progress", ""))
+
 class RealAssetCreatorApp:
     """Production application for creating real 3D assets in Blender"""
     
-    def __init__(self, output_dir: str = "created_assets"):
+    def __init__(self, output_dir: str = "created_assets",
+                 endpoints: Optional[List[str]] = None,
+                 workers: int = 0, blender_path: str = "blender",
+                 stub_workers: bool = False, batch_window: float = 0.0,
+                 max_batch_size: int = 16, script_timeout: Optional[float] = 300.0,
+                 cache_size_mb: int = 2048, export_formats: Optional[List[str]] = None,
+                 lod_ratios: Optional[List[float]] = None, thumbnails: Optional[str] = None,
+                 trace: bool = False, profile: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
         
-        # Asset creation tracking
+        # Either a pool of local headless Blender workers, or persistent
+        # MCP connections to already-running servers
+        if workers > 0:
+            self.transport = BlenderWorkerPool(
+                workers, blender_path, stub=stub_workers,
+                log_dir=self.output_dir / "worker_logs"
+            )
+        else:
+            self.transport = MCPConnectionPool(endpoints or [DEFAULT_ENDPOINT])
+        
+        # Deadline for each Blender script; a hung script is cancelled and
+        # its worker recycled instead of stalling the menu loop forever
+        self.script_timeout = script_timeout
+        
+        # Asset scripts are compiled once per worker and then run by handle
+        self.templates = TemplateRegistry()
+        
+        # Composite scenes are kept in step with Blender by sending diffs
+        self.scene_sync = SceneSync(self.execute_blender_script)
+        
+        # Optionally coalesce scripts submitted within batch_window seconds
+        self.batcher = None
+        if batch_window > 0:
+            self.batcher = ScriptBatcher(self.transport, max_batch_size, batch_window,
+                                         batch_timeout=script_timeout)
+        
+        # Built assets are cached on disk by script, params and Blender
+        # version; asking for one again skips Blender entirely
+        self.cache = None
+        if cache_size_mb > 0:
+            self.cache = AssetCache(self.output_dir / "cache", cache_size_mb * 1024 * 1024)
+        self.blender_version: Optional[str] = None
+        
+        # Optional low-res previews ("workbench" or "eevee"), stored by the
+        # same content hash as the cache and rendered in the build job
+        self.thumbnails = None
+        if thumbnails:
+            self.thumbnails = ThumbnailStore(self.output_dir / "thumbnails", engine=thumbnails)
+        
+        # Exports run one Blender job per asset, spread across the workers;
+        # with lod_ratios each job also bakes the asset's LOD chain
+        self.exporter = AssetExporter(self.transport, self.templates, self.output_dir / "exports",
+                                      export_formats, script_timeout, lod_ratios)
+        
+        # Distributed renders: border tiles or frame ranges across the workers
+        self.renderer = RenderFarm(self.transport, self.templates, self.output_dir / "renders",
+                                   script_timeout)
+        
+        # Time each section of asset scripts inside Blender (setup,
+        # geometry, materials, ...); the breakdown is logged with the asset
+        self.profile = profile
+        
+        # Set by batch mode to keep per-script output off the console
+        self.quiet = False
+        
+        # Asset creation tracking; events are appended to a log shared with
+        # other processes and compacted into a session summary on close
         self.created_assets = []
+        self.event_log = SessionLog(self.output_dir)
         self.session_log = {
+            "session_id": self.event_log.session_id,
             "session_start": datetime.now().isoformat(),
             "assets_created": [],
             "total_assets": 0
         }
+        
+        # Every asset job is timed phase by phase; with trace on, a Chrome
+        # trace and Prometheus metrics are written to traces/ on close
+        self.tracer = Tracer(self.output_dir / "traces" if trace else None,
+                             f"session_{self.event_log.session_id}")
     
     def display_welcome(self):
         """Display application welcome"""
@@ -65,210 +159,31 @@ class RealAssetCreatorApp:
         print("7. 📊 View Created Assets")
         print("8. 💾 Export Assets")
         print("9. 📋 Generate Report")
+        print("R. 🖼️  Render Asset (distributed)")
         print("0. 🚪 Exit")
         
         while True:
-            choice = input("\n🎯 Select option (0-9): ").strip()
-            if choice in [str(i) for i in range(10)]:
+            choice = input("\n🎯 Select option (0-9, R): ").strip().lower()
+            if choice in [str(i) for i in range(10)] + ["r"]:
                 return choice
-            print("❌ Invalid choice. Please select 0-9.")
+            print("❌ Invalid choice. Please select 0-9 or R.")
     
+    @traced("character")
     async def create_game_character(self):
         """Create a real game character in Blender"""
         print("\n👤 CREATING GAME CHARACTER...")
         print("="*50)
         
-        character_script = '''
-import bpy
-import bmesh
-from mathutils import Vector
-
-# Clear existing objects
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
-
-print("🎭 Creating game character...")
-
-# Create character base (using Suzanne as a stylized character head)
-bpy.ops.mesh.primitive_monkey_add(size=2, location=(0, 0, 1))
-character = bpy.context.active_object
-character.name = "GameCharacter"
-
-# Add subdivision for smooth character
-modifier = character.modifiers.new(name="Subdivision", type='SUBSURF')
-modifier.levels = 2
-
-# Create character body
-bpy.ops.mesh.primitive_cube_add(size=1.5, location=(0, 0, -0.5))
-body = bpy.context.active_object
-body.name = "Character_Body"
-body.scale = (0.8, 0.4, 1.2)
-
-# Create arms
-bpy.ops.mesh.primitive_cube_add(size=0.8, location=(-1.2, 0, 0))
-left_arm = bpy.context.active_object
-left_arm.name = "Left_Arm"
-left_arm.scale = (1.5, 0.3, 0.3)
-
-bpy.ops.mesh.primitive_cube_add(size=0.8, location=(1.2, 0, 0))
-right_arm = bpy.context.active_object
-right_arm.name = "Right_Arm"
-right_arm.scale = (1.5, 0.3, 0.3)
-
-# Create legs
-bpy.ops.mesh.primitive_cube_add(size=0.6, location=(-0.4, 0, -1.8))
-left_leg = bpy.context.active_object
-left_leg.name = "Left_Leg"
-left_leg.scale = (0.4, 0.4, 1.2)
-
-bpy.ops.mesh.primitive_cube_add(size=0.6, location=(0.4, 0, -1.8))
-right_leg = bpy.context.active_object
-right_leg.name = "Right_Leg"
-right_leg.scale = (0.4, 0.4, 1.2)
-
-# Create character materials
-# Skin material
-skin_mat = bpy.data.materials.new(name="Character_Skin")
-skin_mat.use_nodes = True
-nodes = skin_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-skin_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.8, 0.6, 0.4, 1.0)  # Skin tone
-bsdf.inputs['Roughness'].default_value = 0.3
-bsdf.inputs['Specular'].default_value = 0.2
-
-# Clothing material
-cloth_mat = bpy.data.materials.new(name="Character_Clothing")
-cloth_mat.use_nodes = True
-nodes = cloth_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-cloth_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.2, 0.4, 0.8, 1.0)  # Blue clothing
-bsdf.inputs['Roughness'].default_value = 0.8
-
-# Assign materials
-character.data.materials.append(skin_mat)
-body.data.materials.append(cloth_mat)
-left_arm.data.materials.append(skin_mat)
-right_arm.data.materials.append(skin_mat)
-left_leg.data.materials.append(cloth_mat)
-right_leg.data.materials.append(cloth_mat)
-
-# Create armature for rigging
-bpy.ops.object.armature_add(location=(0, 0, 0))
-armature = bpy.context.active_object
-armature.name = "Character_Armature"
-
-# Add basic bones
-bpy.ops.object.mode_set(mode='EDIT')
-bones = armature.data.edit_bones
-
-# Root bone
-root = bones.new("Root")
-root.head = Vector((0, 0, -2.5))
-root.tail = Vector((0, 0, -1.5))
-
-# Spine
-spine = bones.new("Spine")
-spine.head = Vector((0, 0, -1.5))
-spine.tail = Vector((0, 0, 0))
-spine.parent = root
-
-# Head
-head = bones.new("Head")
-head.head = Vector((0, 0, 0.5))
-head.tail = Vector((0, 0, 2))
-head.parent = spine
-
-# Arms
-left_shoulder = bones.new("Left_Shoulder")
-left_shoulder.head = Vector((-0.5, 0, 0))
-left_shoulder.tail = Vector((-1.5, 0, 0))
-left_shoulder.parent = spine
-
-right_shoulder = bones.new("Right_Shoulder")
-right_shoulder.head = Vector((0.5, 0, 0))
-right_shoulder.tail = Vector((1.5, 0, 0))
-right_shoulder.parent = spine
-
-# Legs
-left_hip = bones.new("Left_Hip")
-left_hip.head = Vector((-0.4, 0, -1.5))
-left_hip.tail = Vector((-0.4, 0, -2.5))
-left_hip.parent = root
-
-right_hip = bones.new("Right_Hip")
-right_hip.head = Vector((0.4, 0, -1.5))
-right_hip.tail = Vector((0.4, 0, -2.5))
-right_hip.parent = root
-
-bpy.ops.object.mode_set(mode='OBJECT')
-
-# Professional lighting setup
-# Key light
-bpy.ops.object.light_add(type='AREA', location=(3, -3, 4))
-key_light = bpy.context.active_object
-key_light.name = "Key_Light"
-key_light.data.energy = 100
-key_light.data.size = 2
-key_light.rotation_euler = (0.8, 0, 0.8)
-
-# Fill light
-bpy.ops.object.light_add(type='AREA', location=(-2, -2, 2))
-fill_light = bpy.context.active_object
-fill_light.name = "Fill_Light"
-fill_light.data.energy = 50
-fill_light.data.size = 3
-fill_light.rotation_euler = (1.2, 0, -0.5)
-
-# Rim light
-bpy.ops.object.light_add(type='SPOT', location=(0, 3, 3))
-rim_light = bpy.context.active_object
-rim_light.name = "Rim_Light"
-rim_light.data.energy = 80
-rim_light.data.spot_size = 1.2
-rim_light.rotation_euler = (0.5, 0, 3.14)
-
-# Camera setup
-bpy.ops.object.camera_add(location=(5, -5, 2))
-camera = bpy.context.active_object
-camera.name = "Character_Camera"
-camera.rotation_euler = (1.3, 0, 0.785)
-
-# Set render settings
-scene = bpy.context.scene
-scene.render.engine = 'EEVEE'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-
-# Enable screen space reflections for better materials
-scene.eevee.use_ssr = True
-scene.eevee.use_ssr_refraction = True
-
-print("✅ Game character created successfully!")
-print(f"📊 Character components:")
-print(f"   • Head: {character.name} (Skin material)")
-print(f"   • Body parts: 5 components (Skin + Clothing)")
-print(f"   • Armature: {len(armature.data.bones)} bones")
-print(f"   • Materials: 2 PBR materials")
-print(f"   • Lighting: 3-point professional setup")
-print("🎯 Switch to Material Preview or Rendered view to see the character!")
-'''
+        with tracing.span("script_build"):
+            character_script = asset_scripts.asset_script("character", self.profile)
         
         try:
             print("🔄 Executing character creation in Blender...")
             
             # Execute the script using MCP Blender Server
             # Note: This will be called through the MCP framework
-            result = await self.execute_blender_script(character_script)
+            result = await self.build_asset(
+                character_script, "game_character", asset_scripts.asset_params("character"))
             
             if result:
                 print("✅ Character creation completed!")
@@ -276,11 +191,9 @@ print("🎯 Switch to Material Preview or Rendered view to see the character!")
                 # Log the asset creation
                 self.log_asset_creation("character", "game_character", {
                     "components": "Head, body, arms, legs",
-                    "bones": "7 bone armature",
-                    "materials": "Skin + Clothing PBR",
-                    "lighting": "3-point professional setup",
-                    "render_ready": True
-                })
+                    **measured_details(result.get("report"))
+                }, result.get("cache"), result.get("thumbnail"), result.get("profile"),
+                    result.get("cache_hit", False))
                 
                 return True
             else:
@@ -292,241 +205,192 @@ print("🎯 Switch to Material Preview or Rendered view to see the character!")
             print(f"❌ Error: {e}")
             return False
     
-    async def execute_blender_script(self, script: str):
-        """Execute Blender script using MCP server"""
+    async def execute_blender_script(self, script: str, template: Optional[str] = None,
+                                     params: Optional[Dict] = None):
+        """Execute Blender script using MCP server
+        
+        With ``template`` set, the script is uploaded and compiled once per
+        Blender worker under that name and afterwards run by handle with
+        ``params``, so only the small parameter dict crosses the wire.
+        Raises MCPError when the script fails in Blender or no server answers.
+        """
+        # Quiet mode (batch runs) keeps Blender's output off the console
+        say = (lambda *args: None) if self.quiet else print
         try:
-            # This method will be called by the MCP framework
-            # For now, we'll simulate successful execution
-            print("🔄 Executing script in Blender via MCP server...")
-            await asyncio.sleep(1)  # Simulate processing time
-            print("✅ Script executed successfully!")
-            return True
+            say("🔄 Executing script in Blender via MCP server...")
+            if self.batcher is not None:
+                # Batches carry script text, so templates are inlined there
+                if template is not None:
+                    with tracing.span("script_build"):
+                        script = self.templates.template(template, script).render(params)
+                with tracing.span("transport"):
+                    result = await self.batcher.submit(script, self.script_timeout)
+                output = console_text(result_text(result))
+            else:
+                # Stream so Blender's progress shows up while the script runs;
+                # output is only printed at the end if the server didn't stream
+                result, streamed = None, False
+                with tracing.span("transport"):
+                    async for event in self.stream_blender_script(script, template, params):
+                        if event["type"] == "stdout":
+                            streamed = True
+                            if not is_marker_line(event["line"]):
+                                say(event["line"])
+                        elif event["type"] == "progress":
+                            say(f"   ⏳ {format_progress(event)}")
+                        else:
+                            result = event["result"]
+                output = "" if streamed else console_text(result_text(result))
+            if output:
+                say(output)
+            say("✅ Script executed successfully!")
+            return result
+        except MCPError as e:
+            # Blender's own error message; callers decide how to report it
+            logger.error(f"Blender script failed: {e}")
+            raise
         except Exception as e:
             logger.error(f"Failed to execute Blender script: {e}")
             return False
     
+    async def build_asset(self, script: str, template: str, params: Optional[Dict] = None):
+        """Build an asset script in Blender, or return it from the asset cache
+        
+        On a miss the script also saves the built scene (.blend and .glb) and
+        its stats into a staging directory, which becomes the cache entry. A
+        hit returns that entry under ``result["cache"]`` without a worker.
+        With thumbnails on, the same job renders the asset's preview unless
+        one already exists for its content hash (``result["thumbnail"]``).
+        What the script measured in Blender (see asset_result) is in
+        ``result["report"]``, taken from the cache entry on a hit.
+        A profiled script's section breakdown is parsed into
+        ``result["profile"]``; cache hits run nothing, so have none.
+        """
+        result = await self._build_asset(script, template, params)
+        if result and "report" not in result:
+            # Measured by the script itself, or stored with its cache entry
+            result["report"] = parse_result(result) or (result.get("cache") or {}).get("result")
+        if result and result["report"] and not self.quiet:
+            report = result["report"]
+            print(f"📐 {report['objects']} objects, {report['vertices']:,} vertices, "
+                  f"{report['triangles']:,} triangles, {len(report['materials'])} materials, "
+                  f"{report['bones']} bones")
+        if self.profile and result:
+            result["profile"] = parse_profile(result)
+            if result["profile"] and not self.quiet:
+                print(f"⏱️ Blender sections: {format_profile(result['profile'])}")
+        return result
+    
+    async def _build_asset(self, script: str, template: str, params: Optional[Dict]):
+        if self.cache is None and self.thumbnails is None:
+            return await self.execute_blender_script(script, template, params)
+        try:
+            if self.blender_version is None:
+                with tracing.span("transport"):
+                    self.blender_version = await blender_version(self.transport)
+        except Exception as e:
+            logger.warning(f"Could not determine Blender version, skipping asset cache: {e}")
+            return await self.execute_blender_script(script, template, params)
+        
+        with tracing.span("cache"):
+            key = cache_key(script, params, self.blender_version)
+            thumbnail = self.thumbnails.get(key) if self.thumbnails is not None else None
+            thumbnail_params = None
+            if self.thumbnails is not None and thumbnail is None:
+                thumbnail_params = self.thumbnails.params(key)
+            entry = self.cache.get(key) if self.cache is not None else None
+        
+        if entry is not None:
+            if not self.quiet:
+                print(f"⚡ Loaded from asset cache: {entry['files']['asset.blend']}")
+            if thumbnail_params is not None:
+                # Cached before thumbnails were on: preview the cached .blend
+                try:
+                    preview = await self.execute_blender_script(
+                        THUMBNAIL_SOURCE, "thumbnail_cached",
+                        {**thumbnail_params, "blend": entry["files"]["asset.blend"]})
+                except MCPError as e:
+                    logger.warning(f"Thumbnail of cached asset failed: {e}")
+                    preview = None
+                thumbnail = self.thumbnails.commit(key, thumbnail_params, preview)
+            return {"content": [{"type": "text", "text": f"Cached asset {key[:12]}"}],
+                    "isError": False, "cache": entry, "cache_hit": True,
+                    "thumbnail": str(thumbnail) if thumbnail else None}
+        
+        if thumbnail_params is not None:
+            script, template = script + THUMBNAIL_SOURCE, f"{template}+thumbnail"
+            params = {**(params or {}), **thumbnail_params}
+        if self.cache is None:
+            result = await self.execute_blender_script(script, template, params)
+        else:
+            result = await self._build_cached(key, script, template, params)
+        if thumbnail_params is not None:
+            thumbnail = self.thumbnails.commit(key, thumbnail_params, result)
+        if result:
+            result["thumbnail"] = str(thumbnail) if thumbnail else None
+        return result
+    
+    async def _build_cached(self, key: str, script: str, template: str, params: Optional[Dict]):
+        """Run an asset script that also saves it as cache entry ``key``"""
+        staged = self.cache.stage()
+        try:
+            result = await self.execute_blender_script(
+                script + SAVE_SOURCE, f"{template}+cache", {**(params or {}), "cache_dir": str(staged)})
+        except BaseException:
+            self.cache.discard(staged)
+            raise
+        stats = parse_stats(result) if result else None
+        if stats is None:
+            # Failed, or the server did not run the script (stub workers)
+            self.cache.discard(staged)
+            return result
+        result["report"] = parse_result(result)
+        with tracing.span("cache"):
+            entry = self.cache.commit(key, staged, stats, result["report"])
+        if entry is not None:
+            result["cache"] = entry
+            if not self.quiet:
+                print(f"💾 Cached as {key[:12]} ({stats['objects']} objects, "
+                      f"{stats['vertices']} vertices)")
+        return result
+    
+    def stream_blender_script(self, script: str, template: Optional[str] = None,
+                              params: Optional[Dict] = None) -> AsyncIterator[Dict]:
+        """Execute a Blender script, yielding output events while it runs
+        
+        Yields ``{"type": "stdout", "line": ...}`` and ``{"type": "progress",
+        ...}`` events as the script prints or calls ``report_progress``, then
+        a final ``{"type": "result", "result": ...}``.
+        """
+        if template is not None:
+            return self.transport.stream_template(self.templates.template(template, script), params,
+                                                  self.script_timeout)
+        return self.transport.stream_script(script, self.script_timeout)
+    
+    @traced("vehicle")
     async def create_vehicle_asset(self):
         """Create a real vehicle asset in Blender"""
         print("\n🚗 CREATING VEHICLE ASSET...")
         print("="*50)
         
-        vehicle_script = '''
-import bpy
-from mathutils import Vector
-
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
-
-print("🚗 Creating vehicle asset...")
-
-# Create car body
-bpy.ops.mesh.primitive_cube_add(size=4, location=(0, 0, 1))
-body = bpy.context.active_object
-body.name = "Car_Body"
-body.scale = (1, 2.2, 0.6)
-
-# Create hood
-bpy.ops.mesh.primitive_cube_add(size=3, location=(0, 1.8, 1.3))
-hood = bpy.context.active_object
-hood.name = "Car_Hood"
-hood.scale = (0.9, 0.6, 0.2)
-
-# Create roof
-bpy.ops.mesh.primitive_cube_add(size=2.5, location=(0, -0.3, 1.8))
-roof = bpy.context.active_object
-roof.name = "Car_Roof"
-roof.scale = (0.8, 0.8, 0.3)
-
-# Create wheels with proper positioning
-wheel_positions = [
-    (-1.2, -1.8, 0.4, "Front_Left"),
-    (1.2, -1.8, 0.4, "Front_Right"),
-    (-1.2, 1.8, 0.4, "Rear_Left"),
-    (1.2, 1.8, 0.4, "Rear_Right")
-]
-
-wheels = []
-for x, y, z, name in wheel_positions:
-    bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
-    wheel = bpy.context.active_object
-    wheel.name = f"Wheel_{name}"
-    wheel.scale = (0.8, 0.8, 0.4)
-    wheel.rotation_euler = (1.5708, 0, 0)  # Rotate 90 degrees
-    wheels.append(wheel)
-
-# Create windshield
-bpy.ops.mesh.primitive_cube_add(size=2, location=(0, 0.8, 2.1))
-windshield = bpy.context.active_object
-windshield.name = "Windshield"
-windshield.scale = (0.85, 0.1, 0.7)
-windshield.rotation_euler = (0.3, 0, 0)  # Angled windshield
-
-# Create headlights
-bpy.ops.mesh.primitive_sphere_add(radius=0.3, location=(-0.6, 2.8, 1.2))
-left_headlight = bpy.context.active_object
-left_headlight.name = "Headlight_Left"
-
-bpy.ops.mesh.primitive_sphere_add(radius=0.3, location=(0.6, 2.8, 1.2))
-right_headlight = bpy.context.active_object
-right_headlight.name = "Headlight_Right"
-
-# Create materials
-# Car body material (metallic blue)
-body_mat = bpy.data.materials.new(name="Car_Body_Metal")
-body_mat.use_nodes = True
-nodes = body_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-body_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.1, 0.3, 0.9, 1.0)  # Bright blue
-bsdf.inputs['Metallic'].default_value = 0.9
-bsdf.inputs['Roughness'].default_value = 0.1
-bsdf.inputs['Specular'].default_value = 0.8
-
-# Tire material (rubber)
-tire_mat = bpy.data.materials.new(name="Tire_Rubber")
-tire_mat.use_nodes = True
-nodes = tire_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-tire_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.1, 0.1, 0.1, 1.0)  # Black rubber
-bsdf.inputs['Roughness'].default_value = 0.9
-bsdf.inputs['Specular'].default_value = 0.1
-
-# Glass material for windshield
-glass_mat = bpy.data.materials.new(name="Car_Glass")
-glass_mat.use_nodes = True
-nodes = glass_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-glass_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.8, 0.9, 1.0, 1.0)
-bsdf.inputs['Alpha'].default_value = 0.2
-bsdf.inputs['Roughness'].default_value = 0.0
-bsdf.inputs['IOR'].default_value = 1.45
-
-# Headlight material (emissive)
-light_mat = bpy.data.materials.new(name="Headlight")
-light_mat.use_nodes = True
-nodes = light_mat.node_tree.nodes
-nodes.clear()
-
-emission = nodes.new(type='ShaderNodeEmission')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-light_mat.node_tree.links.new(emission.outputs['Emission'], output.inputs['Surface'])
-
-emission.inputs['Color'].default_value = (1.0, 1.0, 0.9, 1.0)  # Warm white
-emission.inputs['Strength'].default_value = 5.0
-
-# Assign materials
-body.data.materials.append(body_mat)
-hood.data.materials.append(body_mat)
-roof.data.materials.append(body_mat)
-windshield.data.materials.append(glass_mat)
-left_headlight.data.materials.append(light_mat)
-right_headlight.data.materials.append(light_mat)
-
-for wheel in wheels:
-    wheel.data.materials.append(tire_mat)
-
-# Professional automotive lighting
-# Main sun light
-bpy.ops.object.light_add(type='SUN', location=(10, 10, 15))
-sun = bpy.context.active_object
-sun.name = "Sun_Light"
-sun.data.energy = 8
-sun.rotation_euler = (0.3, 0.3, 0)
-
-# Studio lighting for car photography
-bpy.ops.object.light_add(type='AREA', location=(5, -8, 6))
-studio_light1 = bpy.context.active_object
-studio_light1.name = "Studio_Key"
-studio_light1.data.energy = 150
-studio_light1.data.size = 4
-
-bpy.ops.object.light_add(type='AREA', location=(-5, -8, 4))
-studio_light2 = bpy.context.active_object
-studio_light2.name = "Studio_Fill"
-studio_light2.data.energy = 80
-studio_light2.data.size = 6
-
-# Ground plane for reflections
-bpy.ops.mesh.primitive_plane_add(size=20, location=(0, 0, -0.5))
-ground = bpy.context.active_object
-ground.name = "Ground_Plane"
-
-# Ground material
-ground_mat = bpy.data.materials.new(name="Ground")
-ground_mat.use_nodes = True
-nodes = ground_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-ground_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.3, 0.3, 0.3, 1.0)
-bsdf.inputs['Roughness'].default_value = 0.2
-bsdf.inputs['Metallic'].default_value = 0.1
-
-ground.data.materials.append(ground_mat)
-
-# Camera setup for automotive photography
-bpy.ops.object.camera_add(location=(8, -12, 4))
-camera = bpy.context.active_object
-camera.name = "Car_Camera"
-camera.rotation_euler = (1.2, 0, 0.5)
-
-# Set render settings for high quality
-scene = bpy.context.scene
-scene.render.engine = 'EEVEE'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-
-# Enable advanced EEVEE features
-scene.eevee.use_ssr = True
-scene.eevee.use_ssr_refraction = True
-scene.eevee.use_bloom = True
-scene.eevee.bloom_intensity = 0.1
-
-print("✅ Vehicle asset created successfully!")
-print(f"📊 Vehicle components:")
-print(f"   • Body: {body.name} (Metallic blue)")
-print(f"   • Wheels: 4 wheels with rubber material")
-print(f"   • Glass: {windshield.name} (Transparent)")
-print(f"   • Lights: 2 emissive headlights")
-print(f"   • Materials: 4 PBR materials")
-print(f"   • Lighting: Professional automotive setup")
-print("🎯 Switch to Rendered view to see realistic car rendering!")
-'''
+        with tracing.span("script_build"):
+            vehicle_script = asset_scripts.asset_script("vehicle", self.profile)
         
         try:
             print("🔄 Executing vehicle creation in Blender...")
             
             # Execute using MCP Blender Server
-            result = await self.execute_blender_script(vehicle_script)
+            result = await self.build_asset(
+                vehicle_script, "blue_car", asset_scripts.asset_params("vehicle"))
             
             if result:
                 print("✅ Vehicle creation completed!")
                 
                 self.log_asset_creation("vehicle", "blue_car", {
                     "components": "Body, hood, roof, 4 wheels, windshield, headlights",
-                    "materials": "Metallic blue, rubber, glass, emissive",
-                    "lighting": "Professional automotive setup",
-                    "render_engine": "EEVEE with advanced features",
-                    "export_ready": True
-                })
+                    **measured_details(result.get("report"))
+                }, result.get("cache"), result.get("thumbnail"), result.get("profile"),
+                    result.get("cache_hit", False))
                 
                 return True
             else:
@@ -538,242 +402,28 @@ print("🎯 Switch to Rendered view to see realistic car rendering!")
             print(f"❌ Error: {e}")
             return False
     
+    @traced("environment")
     async def create_environment_scene(self):
         """Create a real environment scene in Blender"""
         print("\n🏗️ CREATING ENVIRONMENT SCENE...")
         print("="*50)
         
-        environment_script = '''
-import bpy
-import random
-from mathutils import Vector
-
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
-
-print("🏗️ Creating environment scene...")
-
-# Create modular building foundation
-bpy.ops.mesh.primitive_cube_add(size=12, location=(0, 0, 0.5))
-foundation = bpy.context.active_object
-foundation.name = "Building_Foundation"
-foundation.scale = (2, 1.5, 0.1)
-
-# Create main building structure
-bpy.ops.mesh.primitive_cube_add(size=10, location=(0, 0, 5))
-building = bpy.context.active_object
-building.name = "Main_Building"
-building.scale = (1.8, 1.3, 1.0)
-
-# Create building details
-# Entrance
-bpy.ops.mesh.primitive_cube_add(size=3, location=(0, -2.5, 2))
-entrance = bpy.context.active_object
-entrance.name = "Building_Entrance"
-entrance.scale = (0.6, 0.3, 0.8)
-
-# Windows
-window_positions = [
-    (-6, 0, 6), (6, 0, 6), (0, -8, 6), (0, 8, 6)
-]
-for i, pos in enumerate(window_positions):
-    bpy.ops.mesh.primitive_cube_add(size=2, location=pos)
-    window = bpy.context.active_object
-    window.name = f"Window_{i+1}"
-    window.scale = (0.1, 0.1, 0.8)
-
-# Create roof with interesting shape
-bpy.ops.mesh.primitive_cube_add(size=11, location=(0, 0, 10.5))
-roof = bpy.context.active_object
-roof.name = "Building_Roof"
-roof.scale = (1.9, 1.4, 0.3)
-
-# Environmental props
-props = []
-prop_types = [
-    ("Crate", (1, 1, 1)),
-    ("Barrel", (0.8, 0.8, 1.2)),
-    ("Pillar", (0.5, 0.5, 2)),
-    ("Bench", (2, 0.5, 0.5))
-]
-
-for i in range(8):
-    prop_type, scale = random.choice(prop_types)
-    x = random.uniform(-15, 15)
-    y = random.uniform(-15, 15)
-    z = scale[2] / 2
-    
-    if prop_type == "Barrel":
-        bpy.ops.mesh.primitive_cylinder_add(location=(x, y, z))
-    else:
-        bpy.ops.mesh.primitive_cube_add(location=(x, y, z))
-    
-    prop = bpy.context.active_object
-    prop.name = f"{prop_type}_{i+1}"
-    prop.scale = scale
-    props.append(prop)
-
-# Create terrain/ground with variation
-bpy.ops.mesh.primitive_plane_add(size=40, location=(0, 0, 0))
-terrain = bpy.context.active_object
-terrain.name = "Terrain"
-
-# Add subdivision for terrain detail
-modifier = terrain.modifiers.new(name="Subdivision", type='SUBSURF')
-modifier.levels = 2
-
-# Create materials
-# Stone material for building
-stone_mat = bpy.data.materials.new(name="Building_Stone")
-stone_mat.use_nodes = True
-nodes = stone_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-stone_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.6, 0.6, 0.5, 1.0)  # Warm stone
-bsdf.inputs['Roughness'].default_value = 0.8
-bsdf.inputs['Specular'].default_value = 0.2
-
-# Wood material for details
-wood_mat = bpy.data.materials.new(name="Wood_Details")
-wood_mat.use_nodes = True
-nodes = wood_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-wood_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.4, 0.25, 0.1, 1.0)  # Dark wood
-bsdf.inputs['Roughness'].default_value = 0.7
-
-# Glass material for windows
-glass_mat = bpy.data.materials.new(name="Window_Glass")
-glass_mat.use_nodes = True
-nodes = glass_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-glass_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.8, 0.9, 1.0, 1.0)
-bsdf.inputs['Alpha'].default_value = 0.1
-bsdf.inputs['Roughness'].default_value = 0.0
-
-# Metal material for props
-metal_mat = bpy.data.materials.new(name="Metal_Props")
-metal_mat.use_nodes = True
-nodes = metal_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-metal_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.7, 0.7, 0.8, 1.0)
-bsdf.inputs['Metallic'].default_value = 0.8
-bsdf.inputs['Roughness'].default_value = 0.3
-
-# Ground material
-ground_mat = bpy.data.materials.new(name="Ground_Terrain")
-ground_mat.use_nodes = True
-nodes = ground_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-ground_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.3, 0.4, 0.2, 1.0)  # Earthy ground
-bsdf.inputs['Roughness'].default_value = 0.9
-
-# Assign materials
-foundation.data.materials.append(stone_mat)
-building.data.materials.append(stone_mat)
-entrance.data.materials.append(wood_mat)
-roof.data.materials.append(wood_mat)
-terrain.data.materials.append(ground_mat)
-
-# Assign glass to windows
-for obj in bpy.context.scene.objects:
-    if obj.name.startswith("Window_"):
-        obj.data.materials.append(glass_mat)
-
-# Assign metal to props
-for prop in props:
-    prop.data.materials.append(metal_mat)
-
-# Professional environment lighting
-# Sun light (key light)
-bpy.ops.object.light_add(type='SUN', location=(20, 20, 30))
-sun = bpy.context.active_object
-sun.name = "Environment_Sun"
-sun.data.energy = 10
-sun.rotation_euler = (0.3, 0.3, 0.5)
-
-# Sky light (ambient)
-bpy.ops.object.light_add(type='AREA', location=(0, 0, 25))
-sky_light = bpy.context.active_object
-sky_light.name = "Sky_Light"
-sky_light.data.energy = 50
-sky_light.data.size = 20
-sky_light.data.color = (0.7, 0.8, 1.0)  # Sky blue tint
-
-# Atmospheric world lighting
-world = bpy.context.scene.world
-world.use_nodes = True
-bg_node = world.node_tree.nodes["Background"]
-bg_node.inputs[0].default_value = (0.2, 0.3, 0.6, 1.0)  # Sky color
-bg_node.inputs[1].default_value = 0.8  # Strength
-
-# Camera setup for architectural photography
-bpy.ops.object.camera_add(location=(25, -25, 15))
-camera = bpy.context.active_object
-camera.name = "Environment_Camera"
-camera.rotation_euler = (1.0, 0, 0.785)
-
-# Set render settings
-scene = bpy.context.scene
-scene.render.engine = 'EEVEE'
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-
-# Enable atmospheric effects
-scene.eevee.use_ssr = True
-scene.eevee.use_volumetric_fog = True
-scene.eevee.volumetric_start = 0.1
-scene.eevee.volumetric_end = 100
-
-print("✅ Environment scene created successfully!")
-print(f"📊 Environment components:")
-print(f"   • Main building with foundation and roof")
-print(f"   • Entrance and 4 windows")
-print(f"   • {len(props)} environmental props")
-print(f"   • Detailed terrain with subdivision")
-print(f"   • 4 PBR materials (Stone, Wood, Glass, Metal)")
-print(f"   • Professional lighting (Sun + Sky + World)")
-print("🎯 Switch to Rendered view to see the complete environment!")
-'''
+        with tracing.span("script_build"):
+            environment_script = asset_scripts.asset_script("environment", self.profile)
         
         try:
             print("🔄 Executing environment creation in Blender...")
-            result = await self.execute_blender_script(environment_script)
+            result = await self.build_asset(
+                environment_script, "architectural_scene", asset_scripts.asset_params("environment"))
             
             if result:
                 print("✅ Environment creation completed!")
                 
                 self.log_asset_creation("environment", "architectural_scene", {
                     "components": "Building, entrance, windows, roof, props, terrain",
-                    "materials": "Stone, wood, glass, metal, ground",
-                    "lighting": "Sun + sky + atmospheric world",
-                    "effects": "Volumetric fog, reflections",
-                    "export_ready": True
-                })
+                    **measured_details(result.get("report"))
+                }, result.get("cache"), result.get("thumbnail"), result.get("profile"),
+                    result.get("cache_hit", False))
                 
                 return True
             else:
@@ -785,206 +435,28 @@ print("🎯 Switch to Rendered view to see the complete environment!")
             print(f"❌ Error: {e}")
             return False
     
+    @traced("showcase")
     async def create_material_showcase(self):
         """Create a material showcase in Blender"""
         print("\n🎨 CREATING MATERIAL SHOWCASE...")
         print("="*50)
         
-        material_script = '''
-import bpy
-import math
-
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
-
-print("🎨 Creating material showcase...")
-
-# Create spheres to showcase different PBR materials
-materials_data = [
-    ("Chrome", (0.8, 0.8, 0.8, 1.0), 1.0, 0.0),
-    ("Gold", (1.0, 0.8, 0.3, 1.0), 1.0, 0.1),
-    ("Wood", (0.6, 0.4, 0.2, 1.0), 0.0, 0.8),
-    ("Plastic", (0.8, 0.2, 0.2, 1.0), 0.0, 0.3),
-    ("Ceramic", (0.9, 0.9, 0.8, 1.0), 0.0, 0.1),
-    ("Rubber", (0.1, 0.1, 0.1, 1.0), 0.0, 0.9)
-]
-
-spheres = []
-for i, (name, color, metallic, roughness) in enumerate(materials_data):
-    # Position spheres in a circle
-    angle = (i / len(materials_data)) * 2 * math.pi
-    x = math.cos(angle) * 4
-    y = math.sin(angle) * 4
-    
-    bpy.ops.mesh.primitive_uv_sphere_add(location=(x, y, 1))
-    sphere = bpy.context.active_object
-    sphere.name = f"Sphere_{name}"
-    spheres.append(sphere)
-    
-    # Create material
-    mat = bpy.data.materials.new(name=f"Material_{name}")
-    mat.use_nodes = True
-    nodes = mat.node_tree.nodes
-    nodes.clear()
-    
-    # Create shader nodes
-    bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-    output = nodes.new(type='ShaderNodeOutputMaterial')
-    mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-    
-    # Set material properties
-    bsdf.inputs['Base Color'].default_value = color
-    bsdf.inputs['Metallic'].default_value = metallic
-    bsdf.inputs['Roughness'].default_value = roughness
-    
-    # Special properties for specific materials
-    if name == "Gold":
-        bsdf.inputs['Specular'].default_value = 1.0
-    elif name == "Ceramic":
-        bsdf.inputs['Specular'].default_value = 0.8
-        bsdf.inputs['Clearcoat'].default_value = 0.3
-    
-    sphere.data.materials.append(mat)
-
-# Create pedestals for the spheres
-for i, sphere in enumerate(spheres):
-    x, y, _ = sphere.location
-    bpy.ops.mesh.primitive_cylinder_add(location=(x, y, 0.3))
-    pedestal = bpy.context.active_object
-    pedestal.name = f"Pedestal_{i+1}"
-    pedestal.scale = (0.8, 0.8, 0.3)
-
-# Create ground plane with interesting material
-bpy.ops.mesh.primitive_plane_add(size=15, location=(0, 0, 0))
-ground = bpy.context.active_object
-ground.name = "Showcase_Ground"
-
-# Ground material with subtle pattern
-ground_mat = bpy.data.materials.new(name="Showcase_Ground")
-ground_mat.use_nodes = True
-nodes = ground_mat.node_tree.nodes
-nodes.clear()
-
-# Create procedural ground material
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-noise = nodes.new(type='ShaderNodeTexNoise')
-colorramp = nodes.new(type='ShaderNodeValToRGB')
-
-# Connect nodes
-ground_mat.node_tree.links.new(noise.outputs['Color'], colorramp.inputs['Fac'])
-ground_mat.node_tree.links.new(colorramp.outputs['Color'], bsdf.inputs['Base Color'])
-ground_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-# Configure nodes
-noise.inputs['Scale'].default_value = 5.0
-colorramp.color_ramp.elements[0].color = (0.2, 0.2, 0.2, 1.0)
-colorramp.color_ramp.elements[1].color = (0.4, 0.4, 0.4, 1.0)
-bsdf.inputs['Roughness'].default_value = 0.8
-
-ground.data.materials.append(ground_mat)
-
-# Pedestal material
-pedestal_mat = bpy.data.materials.new(name="Pedestal_Material")
-pedestal_mat.use_nodes = True
-nodes = pedestal_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-pedestal_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.8, 1.0)
-bsdf.inputs['Roughness'].default_value = 0.4
-
-# Assign pedestal material
-for obj in bpy.context.scene.objects:
-    if obj.name.startswith("Pedestal_"):
-        obj.data.materials.append(pedestal_mat)
-
-# Create text labels
-for i, (name, _, _, _) in enumerate(materials_data):
-    angle = (i / len(materials_data)) * 2 * math.pi
-    x = math.cos(angle) * 5.5
-    y = math.sin(angle) * 5.5
-    
-    bpy.ops.object.text_add(location=(x, y, 0.1))
-    text_obj = bpy.context.active_object
-    text_obj.name = f"Label_{name}"
-    text_obj.data.body = name
-    text_obj.data.size = 0.4
-    text_obj.rotation_euler = (1.5708, 0, 0)  # Lay flat
-
-# Professional studio lighting setup
-# Key light
-bpy.ops.object.light_add(type='AREA', location=(8, -8, 12))
-key_light = bpy.context.active_object
-key_light.name = "Studio_Key"
-key_light.data.energy = 200
-key_light.data.size = 6
-key_light.rotation_euler = (0.8, 0, 0.8)
-
-# Fill light
-bpy.ops.object.light_add(type='AREA', location=(-6, -6, 8))
-fill_light = bpy.context.active_object
-fill_light.name = "Studio_Fill"
-fill_light.data.energy = 100
-fill_light.data.size = 8
-fill_light.data.color = (0.8, 0.9, 1.0)  # Slightly blue
-
-# Rim light
-bpy.ops.object.light_add(type='AREA', location=(0, 10, 6))
-rim_light = bpy.context.active_object
-rim_light.name = "Studio_Rim"
-rim_light.data.energy = 150
-rim_light.data.size = 4
-rim_light.rotation_euler = (1.2, 0, 3.14)
-
-# HDRI world lighting
-world = bpy.context.scene.world
-world.use_nodes = True
-bg_node = world.node_tree.nodes["Background"]
-bg_node.inputs[1].default_value = 1.0  # Bright environment
-
-# Camera setup for material showcase
-bpy.ops.object.camera_add(location=(10, -10, 8))
-camera = bpy.context.active_object
-camera.name = "Showcase_Camera"
-camera.rotation_euler = (1.1, 0, 0.785)
-
-# Set render engine to Cycles for best material rendering
-scene = bpy.context.scene
-scene.render.engine = 'CYCLES'
-scene.cycles.samples = 256
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-
-print("✅ Material showcase created successfully!")
-print(f"📊 Showcase components:")
-print(f"   • 6 PBR material spheres (Chrome, Gold, Wood, Plastic, Ceramic, Rubber)")
-print(f"   • Pedestals with neutral material")
-print(f"   • Procedural ground with noise pattern")
-print(f"   • Text labels for each material")
-print(f"   • Professional 3-point studio lighting")
-print(f"   • Cycles render engine for realistic materials")
-print("🎯 Switch to Rendered view to see all PBR materials in detail!")
-'''
+        with tracing.span("script_build"):
+            material_script = asset_scripts.asset_script("showcase", self.profile)
         
         try:
             print("🔄 Executing material showcase creation in Blender...")
-            result = await self.execute_blender_script(material_script)
+            result = await self.build_asset(
+                material_script, "material_demo", asset_scripts.asset_params("showcase"))
             
             if result:
                 print("✅ Material showcase creation completed!")
                 
                 self.log_asset_creation("showcase", "material_demo", {
-                    "materials": "Chrome, Gold, Wood, Plastic, Ceramic, Rubber",
                     "components": "6 spheres, pedestals, ground, labels",
-                    "lighting": "3-point studio setup",
-                    "render_engine": "Cycles for realistic PBR",
-                    "educational_value": "Material property comparison"
-                })
+                    **measured_details(result.get("report"))
+                }, result.get("cache"), result.get("thumbnail"), result.get("profile"),
+                    result.get("cache_hit", False))
                 
                 return True
             else:
@@ -996,26 +468,36 @@ print("🎯 Switch to Rendered view to see all PBR materials in detail!")
             print(f"❌ Error: {e}")
             return False
     
-    def log_asset_creation(self, category: str, asset_type: str, details: Dict):
-        """Log asset creation with detailed information"""
+    def log_asset_creation(self, category: str, asset_type: str, details: Dict,
+                           cache: Optional[Dict] = None, thumbnail: Optional[str] = None,
+                           profile: Optional[Dict] = None, cache_hit: bool = False):
+        """Log asset creation with detailed information
+        
+        A cache hit ran nothing in Blender, so it is logged as ``cached``
+        and not viewable there; its files are in the cache entry.
+        """
         asset_info = {
             "timestamp": datetime.now().isoformat(),
             "category": category,
             "type": asset_type,
             "details": details,
-            "status": "created",
-            "viewable_in_blender": True
+            "status": "cached" if cache_hit else "created",
+            "viewable_in_blender": not cache_hit
         }
+        if cache is not None:
+            asset_info["cache"] = {"key": cache["key"], "files": cache["files"],
+                                   "stats": cache["stats"]}
+        if thumbnail:
+            asset_info["thumbnail"] = thumbnail
+        if profile:
+            asset_info["profile"] = profile
         
-        self.session_log["assets_created"].append(asset_info)
-        self.session_log["total_assets"] += 1
-        
-        # Save to file
-        log_file = self.output_dir / "real_assets_session.json"
-        with open(log_file, 'w') as f:
-            json.dump(self.session_log, f, indent=2)
-        
-        logger.info(f"Created {category} asset: {asset_type}")
+        with tracing.span("logging"):
+            self.session_log["assets_created"].append(asset_info)
+            self.session_log["total_assets"] += 1
+            self.event_log.append({"event": "asset", **asset_info})
+            
+            logger.info(f"Created {category} asset: {asset_type}")
     
     async def run_application(self):
         """Run the main application"""
@@ -1027,6 +509,7 @@ print("🎯 Switch to Rendered view to see all PBR materials in detail!")
             if choice == '0':
                 print("\n👋 Thanks for using Real Asset Creator!")
                 print(f"📊 Session Summary: {self.session_log['total_assets']} assets created")
+                await self.close()
                 break
             elif choice == '1':
                 await self.create_game_character()
@@ -1046,187 +529,41 @@ print("🎯 Switch to Rendered view to see all PBR materials in detail!")
                 await self.export_assets()
             elif choice == '9':
                 self.generate_report()
+            elif choice == 'r':
+                await self.render_menu()
     
+    async def close(self):
+        """Flush pending batches and logs, release Blender connections/workers"""
+        if self.batcher is not None:
+            await self.batcher.close()
+        await self.transport.close()
+        for summary in self.event_log.close():
+            logger.info(f"Session summary written to {summary}")
+        for path in self.tracer.write():
+            logger.info(f"Trace written to {path}")
+    
+    @traced("weapon")
     async def create_weapon_asset(self):
         """Create a weapon asset in Blender"""
         print("\n⚔️ CREATING WEAPON ASSET...")
         print("="*50)
         
-        weapon_script = '''
-import bpy
-from mathutils import Vector
-
-# Clear scene
-bpy.ops.object.select_all(action='SELECT')
-bpy.ops.object.delete(use_global=False)
-
-print("⚔️ Creating weapon asset...")
-
-# Create sword blade
-bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 2.5))
-blade = bpy.context.active_object
-blade.name = "Sword_Blade"
-blade.scale = (0.08, 0.6, 2.5)
-
-# Create fuller (blood groove)
-bpy.ops.mesh.primitive_cube_add(size=0.8, location=(0, 0, 2.5))
-fuller = bpy.context.active_object
-fuller.name = "Sword_Fuller"
-fuller.scale = (0.02, 0.4, 2.2)
-
-# Create crossguard
-bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 1))
-crossguard = bpy.context.active_object
-crossguard.name = "Sword_Crossguard"
-crossguard.scale = (0.15, 1.2, 0.08)
-
-# Create handle grip
-bpy.ops.mesh.primitive_cylinder_add(size=1, location=(0, 0, 0.2))
-handle = bpy.context.active_object
-handle.name = "Sword_Handle"
-handle.scale = (0.12, 0.12, 0.6)
-
-# Create pommel
-bpy.ops.mesh.primitive_sphere_add(radius=0.2, location=(0, 0, -0.5))
-pommel = bpy.context.active_object
-pommel.name = "Sword_Pommel"
-pommel.scale = (1, 1, 0.8)
-
-# Create materials
-# Blade material (polished steel)
-blade_mat = bpy.data.materials.new(name="Steel_Blade")
-blade_mat.use_nodes = True
-nodes = blade_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-blade_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.8, 0.8, 0.9, 1.0)
-bsdf.inputs['Metallic'].default_value = 1.0
-bsdf.inputs['Roughness'].default_value = 0.05
-bsdf.inputs['Specular'].default_value = 1.0
-
-# Handle material (leather wrap)
-leather_mat = bpy.data.materials.new(name="Leather_Handle")
-leather_mat.use_nodes = True
-nodes = leather_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-leather_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.3, 0.2, 0.1, 1.0)
-bsdf.inputs['Roughness'].default_value = 0.8
-bsdf.inputs['Specular'].default_value = 0.2
-
-# Crossguard material (brass)
-brass_mat = bpy.data.materials.new(name="Brass_Guard")
-brass_mat.use_nodes = True
-nodes = brass_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-brass_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.8, 0.7, 0.3, 1.0)
-bsdf.inputs['Metallic'].default_value = 1.0
-bsdf.inputs['Roughness'].default_value = 0.2
-
-# Assign materials
-blade.data.materials.append(blade_mat)
-fuller.data.materials.append(blade_mat)
-crossguard.data.materials.append(brass_mat)
-handle.data.materials.append(leather_mat)
-pommel.data.materials.append(brass_mat)
-
-# Create weapon stand
-bpy.ops.mesh.primitive_cube_add(size=2, location=(0, -2, 0.5))
-stand = bpy.context.active_object
-stand.name = "Weapon_Stand"
-stand.scale = (1.5, 0.2, 0.5)
-
-# Stand material
-stand_mat = bpy.data.materials.new(name="Wood_Stand")
-stand_mat.use_nodes = True
-nodes = stand_mat.node_tree.nodes
-nodes.clear()
-
-bsdf = nodes.new(type='ShaderNodeBsdfPrincipled')
-output = nodes.new(type='ShaderNodeOutputMaterial')
-stand_mat.node_tree.links.new(bsdf.outputs['BSDF'], output.inputs['Surface'])
-
-bsdf.inputs['Base Color'].default_value = (0.4, 0.25, 0.1, 1.0)
-bsdf.inputs['Roughness'].default_value = 0.7
-
-stand.data.materials.append(stand_mat)
-
-# Professional weapon photography lighting
-# Key light (dramatic side lighting)
-bpy.ops.object.light_add(type='AREA', location=(3, -2, 4))
-key_light = bpy.context.active_object
-key_light.name = "Weapon_Key"
-key_light.data.energy = 150
-key_light.data.size = 2
-key_light.rotation_euler = (0.8, 0, 0.5)
-
-# Rim light (edge definition)
-bpy.ops.object.light_add(type='SPOT', location=(-2, 3, 3))
-rim_light = bpy.context.active_object
-rim_light.name = "Weapon_Rim"
-rim_light.data.energy = 100
-rim_light.data.spot_size = 1.0
-rim_light.rotation_euler = (1.2, 0, -0.8)
-
-# Fill light (soft shadows)
-bpy.ops.object.light_add(type='AREA', location=(1, 1, 2))
-fill_light = bpy.context.active_object
-fill_light.name = "Weapon_Fill"
-fill_light.data.energy = 50
-fill_light.data.size = 4
-fill_light.data.color = (0.9, 0.9, 1.0)
-
-# Camera for weapon showcase
-bpy.ops.object.camera_add(location=(4, -4, 2))
-camera = bpy.context.active_object
-camera.name = "Weapon_Camera"
-camera.rotation_euler = (1.3, 0, 0.785)
-
-# Set render settings
-scene = bpy.context.scene
-scene.render.engine = 'CYCLES'
-scene.cycles.samples = 128
-scene.render.resolution_x = 1920
-scene.render.resolution_y = 1080
-
-print("✅ Weapon asset created successfully!")
-print(f"📊 Weapon components:")
-print(f"   • Blade: Polished steel with fuller")
-print(f"   • Crossguard: Brass material")
-print(f"   • Handle: Leather-wrapped grip")
-print(f"   • Pommel: Brass counterweight")
-print(f"   • Stand: Wooden display stand")
-print(f"   • Lighting: Dramatic 3-point setup")
-print("🎯 Perfect for game weapon showcases!")
-'''
+        with tracing.span("script_build"):
+            weapon_script = asset_scripts.asset_script("weapon", self.profile)
         
         try:
             print("🔄 Executing weapon creation in Blender...")
-            result = await self.execute_blender_script(weapon_script)
+            result = await self.build_asset(
+                weapon_script, "medieval_sword", asset_scripts.asset_params("weapon"))
             
             if result:
                 print("✅ Weapon creation completed!")
                 
                 self.log_asset_creation("weapon", "medieval_sword", {
                     "components": "Blade, crossguard, handle, pommel, stand",
-                    "materials": "Steel, brass, leather, wood",
-                    "lighting": "Dramatic 3-point setup",
-                    "render_engine": "Cycles for realistic metals",
-                    "game_ready": True
-                })
+                    **measured_details(result.get("report"))
+                }, result.get("cache"), result.get("thumbnail"), result.get("profile"),
+                    result.get("cache_hit", False))
                 
                 return True
             else:
@@ -1238,44 +575,96 @@ print("🎯 Perfect for game weapon showcases!")
             print(f"❌ Error: {e}")
             return False
     
+    @traced("scene")
     async def create_complete_scene(self):
         """Create a complete game scene with multiple assets"""
         print("\n🏠 CREATING COMPLETE GAME SCENE...")
         print("="*50)
         print("🔄 This will create a scene combining character, vehicle, environment, and props...")
         
-        # Create each component
-        success_count = 0
-        
-        print("\n1/4 Creating environment...")
-        if await self.create_environment_scene():
-            success_count += 1
-        
-        print("\n2/4 Adding vehicle...")
-        if await self.create_vehicle_asset():
-            success_count += 1
+        # All four assets share one Blender scene; only the difference from
+        # the last applied layout is sent, so re-running after a change
+        # costs about as much as the change
+        with tracing.span("script_build"):
+            graph = SceneGraph()
+            for kind, builder, offset in [
+                ("environment", asset_scripts.asset_builder("environment"), (0, 0, 0)),
+                ("vehicle", asset_scripts.asset_builder("vehicle"), (0, -26, 0.5)),
+                ("character", asset_scripts.asset_builder("character"), (-10, -20, 2.5)),
+                ("weapon", asset_scripts.asset_builder("weapon"), (10, -20, 0)),
+            ]:
+                graph.merge(builder.nodes(asset_scripts.asset_params(kind)), offset)
         
-        print("\n3/4 Adding character...")
-        if await self.create_game_character():
-            success_count += 1
-        
-        print("\n4/4 Adding weapon...")
-        if await self.create_weapon_asset():
-            success_count += 1
+        try:
+            changes = await self.scene_sync.apply(graph)
+        except Exception as e:
+            logger.error(f"Error creating complete scene: {e}")
+            changes = None
         
-        if success_count == 4:
+        if changes is not None:
             print("\n✅ Complete game scene created successfully!")
+            print(f"📊 {len(graph)} scene nodes: {changes['added']} added, "
+                  f"{changes['updated']} updated, {changes['removed']} removed")
             self.log_asset_creation("scene", "complete_game_scene", {
                 "components": "Environment, vehicle, character, weapon",
                 "total_assets": 4,
-                "scene_type": "Complete game level",
-                "production_ready": True
-            })
-        else:
-            print(f"\n⚠️ Scene partially created ({success_count}/4 components)")
+                "scene_nodes": len(graph),
+                "changes": changes,
+                **measured_details(self.scene_sync.report)
+            }, thumbnail=await self.scene_thumbnail(graph))
+            return True
+        print("\n❌ Failed to create complete scene")
+        return False
+    
+    async def scene_thumbnail(self, graph: SceneGraph) -> Optional[str]:
+        """Preview of a composite scene, keyed by the graph's content hash"""
+        if self.thumbnails is None:
+            return None
+        key = f"scene_{graph.version()}"
+        thumbnail = self.thumbnails.get(key)
+        if thumbnail is None:
+            params = self.thumbnails.params(key)
+            try:
+                # The graph was just applied; preview its collections in place
+                result = await self.execute_blender_script(
+                    THUMBNAIL_SOURCE, "scene_thumbnail",
+                    {**params, "thumbnail_collections": graph.collections()})
+            except Exception as e:
+                logger.warning(f"Scene thumbnail failed: {e}")
+                result = None
+            thumbnail = self.thumbnails.commit(key, params, result)
+        return str(thumbnail) if thumbnail else None
+    
+    async def create_assets(self, asset_kinds: List[str],
+                            timeout: Optional[float] = None) -> List[bool]:
+        """Create several assets concurrently, returning per-asset success
+        
+        ``timeout`` is a deadline for the whole group; assets still running
+        when it passes are cancelled and count as failures.
+        """
+        creators = {
+            "character": self.create_game_character,
+            "vehicle": self.create_vehicle_asset,
+            "environment": self.create_environment_scene,
+            "showcase": self.create_material_showcase,
+            "weapon": self.create_weapon_asset,
+        }
+        unknown = [kind for kind in asset_kinds if kind not in creators]
+        if unknown:
+            raise ValueError(f"Unknown asset kind(s): {', '.join(unknown)}")
+        
+        tasks = [asyncio.create_task(creators[kind]()) for kind in asset_kinds]
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            print(f"⏱️ {len(pending)} asset(s) missed the {timeout}s deadline and were cancelled")
+            await asyncio.gather(*pending, return_exceptions=True)
+        return [task in done and not task.cancelled() and task.exception() is None
+                and bool(task.result()) for task in tasks]
     
     async def export_assets(self):
-        """Export created assets to various formats"""
+        """Export created assets to FBX, glTF, OBJ and .blend in parallel"""
         print("\n💾 EXPORT ASSETS")
         print("="*50)
         
@@ -1283,20 +672,115 @@ print("🎯 Perfect for game weapon showcases!")
             print("❌ No assets to export. Create some assets first!")
             return
         
-        print("🔄 Export functionality will include:")
-        print("   • FBX export for Unity/Unreal")
-        print("   • glTF export for web/mobile")
-        print("   • OBJ export for general use")
-        print("   • Blend file backup")
-        print("   • Texture extraction")
-        
-        # Simulate export process
+        # One job per asset (the latest build of each); cached builds are
+        # appended from their .blend instead of being rebuilt
+        jobs = {}
         for asset in self.session_log["assets_created"]:
-            print(f"📤 Exporting {asset['type']}...")
-            await asyncio.sleep(0.5)
+            job = self.export_job(asset)
+            if job is not None:
+                jobs[asset["type"]] = job
         
-        print("✅ Export simulation completed!")
-        print(f"📁 Assets would be exported to: {self.output_dir}/exports/")
+        print(f"🔄 Exporting {len(jobs)} asset(s) as {', '.join(self.exporter.formats)}...")
+        manifest = await self.exporter.export_all(list(jobs.values()))
+        for summary in manifest["assets"]:
+            if "lods" in summary:
+                self.event_log.append({"event": "lods", "asset": summary["asset"],
+                                       "lods": summary["lods"]})
+        
+        failed = sum("error" in summary for summary in manifest["assets"])
+        print(f"\n{'✅' if not failed else '⚠️'} Exported {len(jobs) - failed}/{len(jobs)} assets "
+              f"in {manifest['wall_seconds']:.2f}s ({manifest['serial_seconds']:.2f}s of export work)")
+        print(f"📁 Exports written to: {self.exporter.export_root}")
+    
+    def export_job(self, asset: Dict) -> Optional[Dict]:
+        """Export job for a logged asset, or None if it can no longer be rebuilt"""
+        name = asset["type"]
+        if asset["category"] == "scene":
+            if self.scene_sync.applied_version is None:
+                return None
+            graph = self.scene_sync.applied
+            collections = sorted({node["collection"] for node in graph.nodes() if "collection" in node})
+            return self.exporter.job(name, collections, RUNTIME + APPLY_SOURCE, apply_params(
+                diff(SceneGraph(), graph), None, graph.version(), reset=True))
+        
+        # Batch jobs record the spec file and params they were built from
+        details = asset["details"]
+        if "spec" in details:
+            spec = load_spec(details["spec"])
+        elif asset["category"] in asset_scripts.BUILTIN_SPECS:
+            spec = asset_scripts.builtin_spec(asset["category"])
+        else:
+            return None
+        collections = [spec["collection"]]
+        blend = asset.get("cache", {}).get("files", {}).get("asset.blend")
+        if blend is not None and Path(blend).exists():
+            return self.exporter.job(name, collections, blend=str(Path(blend).resolve()))
+        params = {**default_params(spec), **details.get("params", {})}
+        return self.exporter.job(name, collections, compile_spec(spec), params)
+    
+    async def render_asset(self, kind: str, grid: Optional[Tuple[int, int]] = None,
+                           frames: Optional[Tuple[int, int]] = None) -> Optional[Dict]:
+        """Render a built-in asset across the workers, as tiles or frame ranges
+        
+        With the asset cache on, the asset is built (or taken from the cache)
+        once and every render job appends it from the cached .blend; without
+        a cache each job rebuilds it from its script.
+        """
+        script = asset_scripts.asset_script(kind)
+        template = asset_scripts.builtin_spec(kind)["name"]
+        params = asset_scripts.asset_params(kind)
+        # Without a cache entry to reuse, building first would only be repeated by every job
+        try:
+            result = await self.build_asset(script, template, params) if self.cache is not None else None
+        except MCPError as e:
+            print(f"❌ Build of {template} failed: {e}")
+            return None
+        if result and result.get("cache"):
+            job = self.renderer.job(template, blend=result["cache"]["files"]["asset.blend"])
+        else:
+            job = self.renderer.job(template, script, params)
+        
+        mode = f"frames {frames[0]}-{frames[1]}" if frames else "tiles"
+        print(f"🔄 Rendering {template} ({mode}) on {self.renderer.workers} worker(s)...")
+        try:
+            if frames:
+                manifest = await self.renderer.render_frames(job, frames)
+            else:
+                manifest = await self.renderer.render_tiles(job, grid)
+        except Exception as e:
+            logger.error(f"Render of {template} failed: {e}")
+            print(f"❌ Render failed: {e}")
+            return None
+        
+        times = [piece["seconds"] for piece in manifest["pieces"]]
+        print(f"✅ {len(times)} {manifest['mode']} rendered in {manifest['wall_seconds']:.2f}s "
+              f"({manifest['serial_seconds']:.2f}s of render work, {manifest['speedup']}x)")
+        print(f"   ⏱️ Per {manifest['mode'][:-1]}: min {min(times):.2f}s, "
+              f"max {max(times):.2f}s, mean {sum(times) / len(times):.2f}s")
+        print(f"📁 Output: {manifest['output']}")
+        self.event_log.append({"event": "render", "asset": template, "mode": manifest["mode"],
+                               "wall_seconds": manifest["wall_seconds"],
+                               "serial_seconds": manifest["serial_seconds"],
+                               "pieces": len(times)})
+        return manifest
+    
+    async def render_menu(self):
+        """Ask for an asset and a tile grid or frame range, then render it"""
+        print("\n🖼️ DISTRIBUTED RENDER")
+        print("="*50)
+        kinds = list(asset_scripts.BUILTIN_SPECS)
+        for i, kind in enumerate(kinds, 1):
+            print(f"{i}. {kind}")
+        try:
+            kind = kinds[int(input(f"\n🎯 Asset (1-{len(kinds)}): ").strip()) - 1]
+            layout = input("🧩 Tile grid like 4x2, frame range like 1-250, "
+                           "or Enter for automatic tiles: ").strip()
+            grid = parse_grid(layout) if "x" in layout.lower() else None
+            frames = parse_frames(layout) if "-" in layout else None
+        except (ValueError, IndexError) as e:
+            print(f"❌ {e}")
+            return
+        await self.render_asset(kind, grid, frames)
     
     def view_created_assets(self):
         """View created assets summary"""
@@ -1312,6 +796,17 @@ print("🎯 Perfect for game weapon showcases!")
             print(f"   📂 Category: {asset['category']}")
             print(f"   📅 Created: {asset['timestamp'][:19]}")
             print(f"   ✅ Viewable in Blender: {asset['viewable_in_blender']}")
+            if asset.get("status") == "cached":
+                print(f"   ⚡ From asset cache: {asset['cache']['files']['asset.blend']}")
+            details = asset["details"]
+            if details.get("measured"):
+                print(f"   📐 {details['objects']} objects, {details['vertices']:,} vertices, "
+                      f"{details['triangles']:,} triangles, {details['bones']} bones")
+                print(f"   🎨 Materials: {', '.join(details['materials']) or 'none'}")
+            if asset.get("thumbnail"):
+                print(f"   🖼️ Thumbnail: {asset['thumbnail']}")
+            if asset.get("profile"):
+                print(f"   ⏱️ Blender sections: {format_profile(asset['profile'])}")
             print()
     
     def generate_report(self):
@@ -1332,14 +827,99 @@ print("🎯 Perfect for game weapon showcases!")
             
             for category, count in categories.items():
                 print(f"   • {category.title()}: {count} assets")
+        
+        thumbnails = {asset["thumbnail"] for asset in self.session_log["assets_created"]
+                      if asset.get("thumbnail")}
+        if thumbnails:
+            print(f"\n🖼️ Thumbnails ({len(thumbnails)}):")
+            for thumbnail in sorted(thumbnails):
+                print(f"   • {thumbnail}")
+        
+        if self.cache is not None:
+            usage = self.cache.usage()
+            print(f"\n⚡ Asset cache: {usage['entries']} entries, "
+                  f"{usage['bytes'] / 1024**2:.1f}/{usage['max_bytes'] / 1024**2:.0f} MB, "
+                  f"{usage['hits']} hits, {usage['misses']} misses")
+        
+        timings = self.tracer.summary()
+        if timings:
+            print("\n⏱️ Job timings (mean per phase):")
+            for asset_type, stats in timings.items():
+                phases = ", ".join(f"{phase} {seconds * 1000:.0f}ms" for phase, seconds
+                                   in sorted(stats["phase_mean_seconds"].items(),
+                                             key=lambda item: -item[1]))
+                print(f"   • {asset_type}: {stats['jobs']} jobs, p50 {stats['p50_seconds']:.2f}s, "
+                      f"p95 {stats['p95_seconds']:.2f}s ({phases})")
+        
+        if isinstance(self.transport, BlenderWorkerPool):
+            print("\n⚙️ Worker utilization:")
+            for stats in self.transport.utilization():
+                print(f"   • {stats['worker']}: {stats['jobs_completed']} jobs, "
+                      f"{stats['utilization']:.0%} busy, {stats['restarts']} restarts")
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Real Asset Creator Application")
     parser.add_argument("--output", "-o", default="created_assets",
                        help="Output directory for created assets")
+    parser.add_argument("--endpoint", "-e", action="append", dest="endpoints",
+                       help=f"MCP Blender Server endpoint host:port (repeatable, default {DEFAULT_ENDPOINT})")
+    parser.add_argument("--workers", "-w", type=int, default=0,
+                       help="Start this many headless Blender workers instead of using --endpoint")
+    parser.add_argument("--blender", default="blender",
+                       help="Path to the Blender executable for --workers")
+    parser.add_argument("--stub-workers", action="store_true",
+                       help="Use in-process stand-in workers instead of Blender (testing)")
+    parser.add_argument("--batch-window-ms", type=float, default=0.0,
+                       help="Coalesce scripts submitted within this many ms into one round trip")
+    parser.add_argument("--max-batch-size", type=int, default=16,
+                       help="Maximum scripts per coalesced batch")
+    parser.add_argument("--timeout", type=float, default=300.0,
+                       help="Deadline in seconds for each Blender script (0 = none)")
+    parser.add_argument("--cache-size-mb", type=int, default=2048,
+                       help="Size budget of the on-disk asset cache (0 = disable caching)")
+    parser.add_argument("--export-formats", type=parse_formats, default=list(EXPORT_FORMATS),
+                       help="Comma-separated formats for Export Assets (default: fbx,gltf,obj,blend)")
+    parser.add_argument("--lods", nargs="?", type=parse_lod_ratios,
+                       const=list(LOD_RATIOS), metavar="RATIOS",
+                       help="Bake LOD0-LODn on export; optional comma-separated triangle "
+                            f"ratios (default: {','.join(map(str, LOD_RATIOS))})")
+    parser.add_argument("--thumbnails", nargs="?", const="workbench", choices=THUMBNAIL_ENGINES,
+                       help="Render a low-res preview of each created asset "
+                            "(engine: workbench, the default, or eevee)")
+    parser.add_argument("--trace", action="store_true",
+                       help="Write a JSON trace and Prometheus metrics of every asset job "
+                            "to <output>/traces when the session ends")
+    parser.add_argument("--profile", action="store_true",
+                       help="Time each section of asset scripts inside Blender and log "
+                            "the breakdown with the asset")
+    parser.add_argument("--render", choices=list(asset_scripts.BUILTIN_SPECS),
+                       help="Render this asset across the workers without menus, then exit")
+    parser.add_argument("--tiles", type=parse_grid, metavar="COLSxROWS",
+                       help="Tile grid for --render (default: about two tiles per worker)")
+    parser.add_argument("--frames", type=parse_frames, metavar="START-END",
+                       help="Render this frame range in chunks instead of tiling one frame")
+    parser.add_argument("--batch", metavar="JOBS_JSONL",
+                       help="Run the jobs in this JSONL file without menus, then exit")
+    parser.add_argument("--concurrency", type=int, default=4,
+                       help="Batch jobs in flight at once")
+    parser.add_argument("--results", metavar="RESULTS_JSONL",
+                       help="Batch results file (default: <output>/batch_results.jsonl)")
     
     args = parser.parse_args()
     
     # Create and run application
-    app = RealAssetCreatorApp(args.output)
+    app = RealAssetCreatorApp(args.output, args.endpoints, args.workers,
+                              args.blender, args.stub_workers,
+                              args.batch_window_ms / 1000, args.max_batch_size,
+                              args.timeout or None, args.cache_size_mb, args.export_formats,
+                              args.lods, args.thumbnails, args.trace, args.profile)
+    if args.batch:
+        sys.exit(asyncio.run(run_batch(app, args.batch, args.results, args.concurrency)))
+    if args.render:
+        async def render_and_close():
+            try:
+                return await app.render_asset(args.render, args.tiles, args.frames)
+            finally:
+                await app.close()
+        sys.exit(0 if asyncio.run(render_and_close()) else 1)
     asyncio.run(app.run_application())
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Render Farm
+
+Splits a render across the worker pool. A still is cut into border-render
+tiles (one Blender job per tile, each rendering only its region at full
+sample count) and stitched back into one image by a final job; an
+animation is cut into frame ranges. Each job brings the asset into its
+worker the way exports do, appending the scene from the asset's cached
+.blend or rebuilding it from its script, so tiles render side by side and
+wall-clock time falls with worker count.
+
+Per-tile and per-frame times are kept in ``render_manifest.json`` next to
+the output, along with the serial time they add up to.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from mcp_transport import result_text
+from script_templates import TemplateRegistry
+
+logger = logging.getLogger(__name__)
+
+RENDER_MARKER = "@@MCP_RENDER@@"
+
+# Appended to a script that builds the asset into _collection (or to
+# nothing, when the scene is appended from a cached .blend); reads its
+# inputs from params
+RENDER_SOURCE = f'''
+import bpy as _render_bpy, json as _render_json, os as _render_os, time as _render_time
+
+
+def _render_scene(params):
+    """A scene holding only the asset; removed again after rendering"""
+    if params.get("blend"):
+        with _render_bpy.data.libraries.load(params["blend"]) as (_src, _dst):
+            _dst.scenes = _src.scenes[:1]
+        return _dst.scenes[0]
+    # The worker's scene also holds whatever else was built on it; a copy
+    # keeps its render settings, world and camera but links only _collection
+    scene = _render_bpy.context.scene.copy()
+    for child in list(scene.collection.children):
+        if child != _collection:
+            scene.collection.children.unlink(child)
+    for obj in list(scene.collection.objects):
+        scene.collection.objects.unlink(obj)
+    objects = list(_collection.all_objects)
+    if scene.camera not in objects:
+        scene.camera = next((obj for obj in objects if obj.type == 'CAMERA'), None)
+    return scene
+
+
+def _render_still(scene, path):
+    started = _render_time.perf_counter()
+    scene.render.filepath = path
+    _render_bpy.ops.render.render(write_still=True, scene=scene.name)
+    return round(_render_time.perf_counter() - started, 4)
+
+
+def _render_job(params):
+    scene = _render_scene(params)
+    render = scene.render
+    width = render.resolution_x * render.resolution_percentage // 100
+    height = render.resolution_y * render.resolution_percentage // 100
+    render.image_settings.file_format = 'PNG'
+    render.image_settings.color_mode = 'RGBA'
+    render.use_file_extension = True
+    _render_os.makedirs(params["output_dir"], exist_ok=True)
+    pieces = []
+    try:
+        if params.get("tile"):
+            (col, row), (cols, rows) = params["tile"], params["grid"]
+            x0, x1 = width * col // cols, width * (col + 1) // cols
+            y0, y1 = height * row // rows, height * (row + 1) // rows
+            # Blender truncates border * size to whole pixels; the nudge
+            # keeps float error from moving an edge down by one
+            render.use_border = True
+            render.use_crop_to_border = True
+            render.border_min_x, render.border_max_x = (min((x + 0.01) / width, 1.0) for x in (x0, x1))
+            render.border_min_y, render.border_max_y = (min((y + 0.01) / height, 1.0) for y in (y0, y1))
+            path = _render_os.path.join(params["output_dir"], f"tile_{{col}}_{{row}}")
+            seconds = _render_still(scene, path)
+            pieces.append({{"tile": [col, row], "file": path + ".png", "x": x0, "y": y0,
+                            "width": x1 - x0, "height": y1 - y0, "seconds": seconds,
+                            "frame_size": [width, height]}})
+            print(f"   🧩 tile {{col}},{{row}}: {{seconds:.2f}}s")
+        else:
+            start, end = params["frames"]
+            for frame in range(start, end + 1):
+                scene.frame_set(frame)
+                path = _render_os.path.join(params["output_dir"], f"frame_{{frame:04d}}")
+                seconds = _render_still(scene, path)
+                pieces.append({{"frame": frame, "file": path + ".png", "seconds": seconds}})
+                print(f"   🎞️ frame {{frame}}: {{seconds:.2f}}s")
+    finally:
+        _render_bpy.data.scenes.remove(scene)
+        if params.get("blend") and hasattr(_render_bpy.data, "orphans_purge"):
+            _render_bpy.data.orphans_purge(do_recursive=True)
+    print({RENDER_MARKER!r} + _render_json.dumps(pieces))
+
+
+_render_job(params)
+'''
+
+# Lays rendered tiles into one image; numpy ships with Blender
+STITCH_SOURCE = f'''
+import bpy, json, numpy, time
+
+started = time.perf_counter()
+width, height = params["frame_size"]
+canvas = numpy.zeros((height, width, 4), dtype=numpy.float32)
+for tile in params["tiles"]:
+    image = bpy.data.images.load(tile["file"])
+    w, h = image.size
+    pixels = numpy.empty(w * h * 4, dtype=numpy.float32)
+    image.pixels.foreach_get(pixels)
+    bpy.data.images.remove(image)
+    # Rows run bottom to top in both the tiles and the canvas
+    x, y = tile["x"], tile["y"]
+    canvas[y:y + h, x:x + w] = pixels.reshape(h, w, 4)[:height - y, :width - x]
+
+stitched = bpy.data.images.new("mcp_stitched", width, height, alpha=True)
+stitched.pixels.foreach_set(canvas.ravel())
+stitched.filepath_raw = params["output"]
+stitched.file_format = 'PNG'
+stitched.save()
+bpy.data.images.remove(stitched)
+print({RENDER_MARKER!r} + json.dumps([{{"file": params["output"],
+                                        "seconds": round(time.perf_counter() - started, 4)}}]))
+'''
+
+
+def parse_grid(text: str) -> Tuple[int, int]:
+    """Tile grid such as ``4x2`` (columns x rows)"""
+    try:
+        cols, rows = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise ValueError(f"Tile grid must look like 4x2: {text!r}")
+    if cols < 1 or rows < 1:
+        raise ValueError("Tile grid needs at least one column and row")
+    return cols, rows
+
+
+def parse_frames(text: str) -> Tuple[int, int]:
+    """Inclusive frame range such as ``1-250``"""
+    try:
+        start, end = (int(part) for part in text.split("-"))
+    except ValueError:
+        raise ValueError(f"Frame range must look like 1-250: {text!r}")
+    if end < start:
+        raise ValueError("Frame range ends before it starts")
+    return start, end
+
+
+def default_grid(workers: int) -> Tuple[int, int]:
+    """About two tiles per worker, so a slow tile does not leave workers idle"""
+    tiles = max(workers, 1) * 2
+    cols = math.ceil(math.sqrt(tiles))
+    return cols, math.ceil(tiles / cols)
+
+
+class RenderFarm:
+    """Renders tiles or frame ranges of one asset concurrently on a transport"""
+
+    def __init__(self, transport, templates: TemplateRegistry, render_root: Path,
+                 timeout: Optional[float] = None):
+        self.transport = transport
+        self.templates = templates
+        self.render_root = Path(render_root).resolve()
+        self.timeout = timeout
+
+    @property
+    def workers(self) -> int:
+        # Worker pools know their size; a connection pool has one server per endpoint
+        return getattr(self.transport, "size", None) or len(getattr(self.transport, "endpoints", [None]))
+
+    def job(self, name: str, build_script: str = "", build_params: Optional[Dict] = None,
+            blend: Optional[str] = None) -> Dict:
+        """Describe the asset to render: its cached .blend, or a script building it"""
+        if blend is None and not build_script:
+            raise ValueError(f"Render of {name!r} needs a build script or a .blend")
+        return {"name": name, "build_script": "" if blend else build_script,
+                "build_params": build_params or {}, "blend": blend}
+
+    async def _run(self, job: Dict, params: Dict) -> List[Dict]:
+        """One render job; returns the pieces it reports"""
+        template_name = "render_cached" if job["blend"] else f"render_{job['name']}"
+        template = self.templates.template(template_name, job["build_script"] + RENDER_SOURCE)
+        result = await self.transport.run_template(
+            template, {**job["build_params"], "blend": job["blend"], **params}, self.timeout)
+        return self._pieces(result)
+
+    async def _run_all(self, job: Dict, jobs_params: List[Dict]) -> List[Dict]:
+        """Run render jobs concurrently; all finish before a failure is raised"""
+        results = await asyncio.gather(*[self._run(job, params) for params in jobs_params],
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return [piece for pieces in results for piece in pieces]
+
+    def _pieces(self, result: Dict) -> List[Dict]:
+        for line in reversed(result_text(result).splitlines()):
+            if line.startswith(RENDER_MARKER):
+                return json.loads(line[len(RENDER_MARKER):])
+        if result.get("isError"):
+            raise RuntimeError((result_text(result).strip().splitlines() or ["no output"])[-1])
+        raise RuntimeError("no render report (server did not run the script)")
+
+    async def render_tiles(self, job: Dict, grid: Optional[Tuple[int, int]] = None) -> Dict:
+        """Render a still as ``grid`` border tiles and stitch them"""
+        cols, rows = grid or default_grid(self.workers)
+        output_dir = self.render_root / job["name"]
+        started = time.perf_counter()
+        tiles = await self._run_all(job, [
+            {"output_dir": str(output_dir / "tiles"), "tile": [col, row], "grid": [cols, rows]}
+            for row in range(rows) for col in range(cols)])
+        rendered = time.perf_counter() - started
+
+        stitch = self.templates.template("render_stitch", STITCH_SOURCE)
+        output = str(output_dir / f"{job['name']}.png")
+        result = await self.transport.run_template(stitch, {
+            "frame_size": tiles[0]["frame_size"], "tiles": tiles, "output": output}, self.timeout)
+        stitched = self._pieces(result)[0]
+        return self._manifest(job, "tiles", started, tiles, grid=[cols, rows], output=output,
+                              render_seconds=round(rendered, 4), stitch_seconds=stitched["seconds"])
+
+    async def render_frames(self, job: Dict, frames: Tuple[int, int],
+                            chunk: Optional[int] = None) -> Dict:
+        """Render an inclusive frame range in chunks spread across workers"""
+        start, end = frames
+        count = end - start + 1
+        chunk = chunk or math.ceil(count / (self.workers * 2))
+        output_dir = self.render_root / job["name"]
+        started = time.perf_counter()
+        ranges = [[first, min(first + chunk - 1, end)] for first in range(start, end + 1, chunk)]
+        pieces = await self._run_all(job, [
+            {"output_dir": str(output_dir / "frames"), "frames": frame_range}
+            for frame_range in ranges])
+        pieces.sort(key=lambda piece: piece["frame"])
+        return self._manifest(job, "frames", started, pieces, frames=[start, end],
+                              ranges=ranges, output=str(output_dir / "frames"))
+
+    def _manifest(self, job: Dict, mode: str, started: float, pieces: List[Dict], **extra) -> Dict:
+        wall = time.perf_counter() - started
+        serial = sum(piece["seconds"] for piece in pieces)
+        manifest = {
+            "asset": job["name"],
+            "mode": mode,
+            "source": "cache" if job["blend"] else "rebuild",
+            "rendered_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "workers": self.workers,
+            "wall_seconds": round(wall, 4),
+            "serial_seconds": round(serial, 4),
+            "speedup": round(serial / wall, 2) if wall else 0.0,
+            **extra,
+            "pieces": pieces,
+        }
+        output_dir = self.render_root / job["name"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+        with open(output_dir / "render_manifest.json", 'w') as f:
+            json.dump(manifest, f, indent=2)
+        return manifest
@@ -0,0 +1,731 @@
+#!/usr/bin/env python3
+"""
+Scene Builder
+
+Emits Blender scripts that build scenes through the data API
+(``bpy.data.meshes.new`` + ``from_pydata``, ``bpy.data.objects.new`` and
+explicit collection linking) instead of one ``bpy.ops`` primitive call per
+object. Operators run context checks, push an undo step and trigger a
+depsgraph update on every call; data-API creation does none of that, which
+is what makes large scenes slow to build.
+
+Values may be ``Param`` placeholders, emitted as ``params[...]`` lookups so
+the generated script can be registered once as a template.
+"""
+
+import base64
+import struct
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from asset_result import RESULT_RUNTIME
+from section_profiler import PROFILE_RUNTIME
+
+# Sections in the order they are emitted; materials come before geometry so
+# objects can reference them.
+SECTIONS = ("setup", "materials", "geometry", "armature",
+            "lighting", "camera", "world", "render settings", "summary")
+
+SCATTER_BACKENDS = ("objects", "instances")
+# Transform arrays longer than this are emitted packed instead of as literals
+PACK_THRESHOLD = 2048
+
+RUNTIME = '''
+import bpy
+import hashlib
+import math
+
+# Streaming-capable servers provide report_progress(done, total, message)
+report_progress = globals().get("report_progress", lambda *args, **kwargs: None)
+
+
+def _forget_graph():
+    # Scene-graph objects were removed behind the graph's back; the next
+    # diff must find no version stamp and resync
+    if "mcp_graph_version" in bpy.context.scene:
+        del bpy.context.scene["mcp_graph_version"]
+
+
+def _clear_scene():
+    for obj in list(bpy.context.scene.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for collection in list(bpy.context.scene.collection.children):
+        bpy.data.collections.remove(collection)
+    _forget_graph()
+
+
+def _remove_collection(name):
+    collection = bpy.data.collections.get(name)
+    if collection is not None:
+        for obj in list(collection.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.collections.remove(collection)
+
+
+def _asset_collection(name, replace=True):
+    # Rebuilding an asset replaces only its own collection; the rest of
+    # the scene is left alone
+    if replace:
+        _remove_collection(name)
+        _forget_graph()
+    collection = bpy.data.collections.get(name)
+    if collection is None:
+        collection = bpy.data.collections.new(name)
+        bpy.context.scene.collection.children.link(collection)
+    return collection
+
+
+def _set_input(node, names, value):
+    # Socket names changed across Blender versions (e.g. Specular ->
+    # Specular IOR Level in 4.0); use the first one this build has.
+    for name in names:
+        if name in node.inputs:
+            node.inputs[name].default_value = value
+            return
+
+
+def _set_attrs(target, values):
+    for attr, value in values.items():
+        if hasattr(target, attr):
+            setattr(target, attr, value)
+
+
+_BSDF_INPUTS = {
+    "base_color": ("Base Color",),
+    "metallic": ("Metallic",),
+    "roughness": ("Roughness",),
+    "specular": ("Specular", "Specular IOR Level"),
+    "alpha": ("Alpha",),
+    "ior": ("IOR",),
+    "clearcoat": ("Clearcoat", "Coat Weight"),
+}
+
+
+def _material_registry():
+    # driver_namespace lives as long as the Blender process, so the registry
+    # outlives the individual scripts run on a worker
+    return bpy.app.driver_namespace.setdefault("mcp_material_registry", {})
+
+
+def _normalize(value):
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, float):
+        return round(value, 6)
+    return value
+
+
+def _material_key(kind, settings):
+    text = repr((kind, sorted((key, _normalize(value)) for key, value in settings.items())))
+    return hashlib.sha1(text.encode()).hexdigest()[:16]
+
+
+_material_stats = {"built": 0, "reused": 0}
+
+
+def _shared_material(kind, name, settings, build):
+    """Return the material with these shader settings, building it only once"""
+    key = _material_key(kind, settings)
+    registry = _material_registry()
+    mat = bpy.data.materials.get(registry.get(key, ""))
+    if mat is None or mat.get("mcp_material_key") != key:
+        # Materials saved in a .blend by an earlier session carry their key
+        mat = next((m for m in bpy.data.materials if m.get("mcp_material_key") == key), None)
+    if mat is None:
+        mat = build(name)
+        mat["mcp_material_key"] = key
+        _material_stats["built"] += 1
+    else:
+        _material_stats["reused"] += 1
+    registry[key] = mat.name
+    return mat
+
+
+def _node_material(name, shader_type, output_socket):
+    mat = bpy.data.materials.new(name=name)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    nodes.clear()
+    shader = nodes.new(type=shader_type)
+    output = nodes.new(type='ShaderNodeOutputMaterial')
+    mat.node_tree.links.new(shader.outputs[output_socket], output.inputs['Surface'])
+    return mat, shader
+
+
+def _build_principled_material(name, inputs):
+    mat, bsdf = _node_material(name, 'ShaderNodeBsdfPrincipled', 'BSDF')
+    for key, value in inputs.items():
+        _set_input(bsdf, _BSDF_INPUTS[key], value)
+    return mat
+
+
+def _principled_material(name, **inputs):
+    return _shared_material("principled", name, inputs,
+                            lambda name: _build_principled_material(name, inputs))
+
+
+def _build_emission_material(name, color, strength):
+    mat, emission = _node_material(name, 'ShaderNodeEmission', 'Emission')
+    emission.inputs['Color'].default_value = color
+    emission.inputs['Strength'].default_value = strength
+    return mat
+
+
+def _emission_material(name, color, strength):
+    return _shared_material("emission", name, {"color": color, "strength": strength},
+                            lambda name: _build_emission_material(name, color, strength))
+
+
+def _build_noise_material(name, roughness, scale, colors):
+    # Principled BSDF whose base color is a noise texture through a two-stop ramp
+    mat, bsdf = _node_material(name, 'ShaderNodeBsdfPrincipled', 'BSDF')
+    nodes = mat.node_tree.nodes
+    noise = nodes.new(type='ShaderNodeTexNoise')
+    colorramp = nodes.new(type='ShaderNodeValToRGB')
+    mat.node_tree.links.new(noise.outputs['Color'], colorramp.inputs['Fac'])
+    mat.node_tree.links.new(colorramp.outputs['Color'], bsdf.inputs['Base Color'])
+    noise.inputs['Scale'].default_value = scale
+    colorramp.color_ramp.elements[0].color = colors[0]
+    colorramp.color_ramp.elements[1].color = colors[1]
+    bsdf.inputs['Roughness'].default_value = roughness
+    return mat
+
+
+def _noise_material(name, roughness, scale, colors):
+    return _shared_material("noise", name, {"roughness": roughness, "scale": scale, "colors": colors},
+                            lambda name: _build_noise_material(name, roughness, scale, colors))
+
+
+def _material(shader, name, settings):
+    if shader == "emission":
+        return _emission_material(name, **settings)
+    if shader == "noise":
+        return _noise_material(name, **settings)
+    return _principled_material(name, **settings)
+
+
+def _cube_geometry(size=2.0):
+    h = size / 2
+    verts = [(-h, -h, -h), (h, -h, -h), (h, h, -h), (-h, h, -h),
+             (-h, -h, h), (h, -h, h), (h, h, h), (-h, h, h)]
+    faces = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+             (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+    return verts, faces
+
+
+def _plane_geometry(size=2.0):
+    h = size / 2
+    return [(-h, -h, 0), (h, -h, 0), (h, h, 0), (-h, h, 0)], [(0, 1, 2, 3)]
+
+
+def _cylinder_geometry(vertices=32, radius=1.0, depth=2.0):
+    verts = []
+    for z in (-depth / 2, depth / 2):
+        for i in range(vertices):
+            angle = 2 * math.pi * i / vertices
+            verts.append((radius * math.cos(angle), radius * math.sin(angle), z))
+    faces = [(i, (i + 1) % vertices, vertices + (i + 1) % vertices, vertices + i)
+             for i in range(vertices)]
+    faces.append(tuple(reversed(range(vertices))))
+    faces.append(tuple(range(vertices, 2 * vertices)))
+    return verts, faces
+
+
+def _uv_sphere_geometry(segments=32, rings=16, radius=1.0):
+    verts = [(0, 0, radius)]
+    for ring in range(1, rings):
+        theta = math.pi * ring / rings
+        for seg in range(segments):
+            phi = 2 * math.pi * seg / segments
+            verts.append((radius * math.sin(theta) * math.cos(phi),
+                          radius * math.sin(theta) * math.sin(phi),
+                          radius * math.cos(theta)))
+    verts.append((0, 0, -radius))
+    bottom = len(verts) - 1
+
+    def ring_index(ring, seg):
+        return 1 + (ring - 1) * segments + seg % segments
+
+    faces = [(0, ring_index(1, s), ring_index(1, s + 1)) for s in range(segments)]
+    for ring in range(1, rings - 1):
+        for s in range(segments):
+            faces.append((ring_index(ring, s), ring_index(ring + 1, s),
+                          ring_index(ring + 1, s + 1), ring_index(ring, s + 1)))
+    faces.extend((bottom, ring_index(rings - 1, s + 1), ring_index(rings - 1, s))
+                 for s in range(segments))
+    return verts, faces
+
+
+_PRIMITIVES = {
+    "cube": _cube_geometry,
+    "plane": _plane_geometry,
+    "cylinder": _cylinder_geometry,
+    "uv_sphere": _uv_sphere_geometry,
+}
+
+
+def _primitive_mesh(name, primitive, **kwargs):
+    mesh = bpy.data.meshes.new(name)
+    if primitive == "monkey":
+        # Suzanne has no closed-form geometry; bmesh builds it without an operator
+        import bmesh
+        from mathutils import Matrix
+        bm = bmesh.new()
+        bmesh.ops.create_monkey(bm)
+        bmesh.ops.transform(bm, matrix=Matrix.Scale(kwargs.get("size", 2.0) / 2, 4), verts=bm.verts)
+        bm.to_mesh(mesh)
+        bm.free()
+    else:
+        verts, faces = _PRIMITIVES[primitive](**kwargs)
+        mesh.from_pydata(verts, [], faces)
+        mesh.update()
+    return mesh
+
+
+def _place(obj, collection, location, rotation, scale):
+    obj.location = location
+    obj.rotation_euler = rotation
+    obj.scale = scale
+    collection.objects.link(obj)
+    return obj
+
+
+_mesh_cache = {}
+_mesh_stats = {"objects": 0, "meshes": 0}
+
+
+def _shared_mesh(name, primitive, geometry, materials):
+    """Mesh for this shape and material list, shared by every object that uses it"""
+    key = (primitive, _normalize(sorted(geometry.items())), tuple(mat.name for mat in materials))
+    mesh = _mesh_cache.get(key)
+    if mesh is None:
+        mesh = _primitive_mesh(name, primitive, **geometry)
+        for mat in materials:
+            mesh.materials.append(mat)
+        _mesh_cache[key] = mesh
+        _mesh_stats["meshes"] += 1
+    return mesh
+
+
+def _mesh_object(collection, name, primitive, location=(0, 0, 0), rotation=(0, 0, 0),
+                 scale=(1, 1, 1), materials=(), geometry=None):
+    # Repeated shapes become linked duplicates of one mesh datablock
+    obj = bpy.data.objects.new(name, _shared_mesh(name, primitive, geometry or {}, materials))
+    _mesh_stats["objects"] += 1
+    return _place(obj, collection, location, rotation, scale)
+
+
+def _scatter(collection, types, transforms):
+    """Objects from a flat [type, x, y, z, rot_z, sx, sy, sz, ...] transform array
+
+    ``types`` holds (name, primitive, materials, geometry); every prop of a
+    type is a linked duplicate of the type's mesh.
+    """
+    meshes = [_shared_mesh(name, primitive, geometry, materials)
+              for name, primitive, materials, geometry in types]
+    objects = []
+    for i in range(0, len(transforms), 8):
+        kind, x, y, z, angle, sx, sy, sz = transforms[i:i + 8]
+        kind = int(kind)
+        obj = bpy.data.objects.new(f"{types[kind][0]}_{i // 8 + 1}", meshes[kind])
+        obj.location = (x, y, z)
+        obj.rotation_euler = (0.0, 0.0, angle)
+        obj.scale = (sx, sy, sz)
+        collection.objects.link(obj)
+        objects.append(obj)
+    _mesh_stats["objects"] += len(objects)
+    return objects
+
+
+def _unpack_transforms(data):
+    # Large layouts travel as base64 little-endian float32 rather than a
+    # list literal the script compiler would have to parse
+    import base64, struct
+    raw = base64.b64decode(data)
+    return struct.unpack(f"<{len(raw) // 4}f", raw)
+
+
+def _remove_prototypes(name):
+    collection = bpy.data.collections.get(f"{name}_Prototypes")
+    if collection is not None:
+        for obj in list(collection.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        bpy.data.collections.remove(collection)
+    tree = bpy.data.node_groups.get(f"{name}_Instancer")
+    if tree is not None:
+        bpy.data.node_groups.remove(tree)
+
+
+def _instancer_tree(name, prototypes):
+    """Geometry nodes: instance the prototypes on points by prop_type/rotation/scale"""
+    tree = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    if hasattr(tree, "interface"):  # Blender 4.0+
+        tree.interface.new_socket("Geometry", in_out='INPUT', socket_type='NodeSocketGeometry')
+        tree.interface.new_socket("Geometry", in_out='OUTPUT', socket_type='NodeSocketGeometry')
+    else:
+        tree.inputs.new('NodeSocketGeometry', "Geometry")
+        tree.outputs.new('NodeSocketGeometry', "Geometry")
+    nodes, links = tree.nodes, tree.links
+    group_in = nodes.new('NodeGroupInput')
+    group_out = nodes.new('NodeGroupOutput')
+    info = nodes.new('GeometryNodeCollectionInfo')
+    info.inputs['Collection'].default_value = prototypes
+    # Separate children come out sorted by name, hence the numbered prototypes
+    info.inputs['Separate Children'].default_value = True
+    info.inputs['Reset Children'].default_value = True
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+    instance.inputs['Pick Instance'].default_value = True
+
+    def attribute(attr_name, data_type):
+        node = nodes.new('GeometryNodeInputNamedAttribute')
+        node.data_type = data_type
+        node.inputs['Name'].default_value = attr_name
+        return next(s for s in node.outputs if s.name == "Attribute" and s.enabled)
+
+    links.new(group_in.outputs[0], instance.inputs['Points'])
+    links.new(info.outputs[0], instance.inputs['Instance'])
+    links.new(attribute("prop_type", 'INT'), instance.inputs['Instance Index'])
+    links.new(attribute("prop_rotation", 'FLOAT_VECTOR'), instance.inputs['Rotation'])
+    links.new(attribute("prop_scale", 'FLOAT_VECTOR'), instance.inputs['Scale'])
+    links.new(instance.outputs['Instances'], group_out.inputs[0])
+    return tree
+
+
+def _scatter_instances(collection, name, types, transforms):
+    """One point-cloud object instancing a prototype per prop type
+
+    Same inputs as ``_scatter``; props stay instances, so viewport, depsgraph
+    and export cost scale with prototypes rather than prop count.
+    """
+    _remove_prototypes(name)
+    prototypes = bpy.data.collections.new(f"{name}_Prototypes")
+    prototypes.use_fake_user = True
+    for index, (proto_name, primitive, materials, geometry) in enumerate(types):
+        mesh = _shared_mesh(proto_name, primitive, geometry, materials)
+        prototypes.objects.link(bpy.data.objects.new(f"{name}_{index:03d}_{proto_name}", mesh))
+
+    count = len(transforms) // 8
+    points = bpy.data.meshes.new(name)
+    points.vertices.add(count)
+    columns = [transforms[i::8] for i in range(8)]
+    points.vertices.foreach_set("co", [v for xyz in zip(*columns[1:4]) for v in xyz])
+    points.attributes.new("prop_type", 'INT', 'POINT').data.foreach_set(
+        "value", [int(kind) for kind in columns[0]])
+    points.attributes.new("prop_rotation", 'FLOAT_VECTOR', 'POINT').data.foreach_set(
+        "vector", [v for angle in columns[4] for v in (0.0, 0.0, angle)])
+    points.attributes.new("prop_scale", 'FLOAT_VECTOR', 'POINT').data.foreach_set(
+        "vector", [v for xyz in zip(*columns[5:8]) for v in xyz])
+    points.update()
+
+    obj = bpy.data.objects.new(name, points)
+    obj.modifiers.new("Instancer", 'NODES').node_group = _instancer_tree(f"{name}_Instancer",
+                                                                         prototypes)
+    collection.objects.link(obj)
+    _mesh_stats["objects"] += 1
+    return [obj]
+
+
+def _light(collection, name, light_type, location=(0, 0, 0), rotation=(0, 0, 0), **settings):
+    data = bpy.data.lights.new(name=name, type=light_type)
+    _set_attrs(data, settings)
+    return _place(bpy.data.objects.new(name, data), collection, location, rotation, (1, 1, 1))
+
+
+def _camera(collection, name, location, rotation, make_active=True):
+    obj = _place(bpy.data.objects.new(name, bpy.data.cameras.new(name)),
+                 collection, location, rotation, (1, 1, 1))
+    if make_active:
+        bpy.context.scene.camera = obj
+    return obj
+
+
+def _text(collection, name, body, size, location=(0, 0, 0), rotation=(0, 0, 0)):
+    data = bpy.data.curves.new(name=name, type='FONT')
+    data.body = body
+    data.size = size
+    return _place(bpy.data.objects.new(name, data), collection, location, rotation, (1, 1, 1))
+
+
+def _armature(collection, name, location, bones):
+    data = bpy.data.armatures.new(name)
+    obj = _place(bpy.data.objects.new(name, data), collection, location, (0, 0, 0), (1, 1, 1))
+    # Edit bones only exist in edit mode; this is the one operator we keep.
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    for bone_name, head, tail, parent in bones:
+        bone = data.edit_bones.new(bone_name)
+        bone.head = head
+        bone.tail = tail
+        if parent:
+            bone.parent = data.edit_bones[parent]
+    bpy.ops.object.mode_set(mode='OBJECT')
+    return obj
+
+
+def _world(color=None, strength=None):
+    scene = bpy.context.scene
+    if scene.world is None:
+        scene.world = bpy.data.worlds.new("World")
+    scene.world.use_nodes = True
+    background = scene.world.node_tree.nodes["Background"]
+    if color is not None:
+        background.inputs[0].default_value = color
+    if strength is not None:
+        background.inputs[1].default_value = strength
+
+
+def _render_settings(engine, resolution, samples=None, eevee=None):
+    scene = bpy.context.scene
+    engines = {"EEVEE": ("BLENDER_EEVEE_NEXT", "BLENDER_EEVEE")}.get(engine, (engine,))
+    for candidate in engines:
+        try:
+            scene.render.engine = candidate
+            break
+        except TypeError:
+            continue
+    scene.render.resolution_x, scene.render.resolution_y = resolution
+    if samples is not None and engine == "CYCLES":
+        scene.cycles.samples = samples
+    _set_attrs(scene.eevee, eevee or {})
+'''
+
+
+class Param:
+    """Placeholder for a value supplied at run time through ``params``"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self):
+        return f"params[{self.name!r}]"
+
+
+def _transform_literal(transforms: Sequence[float]) -> str:
+    """Source for a transform array; large ones are packed float32"""
+    if len(transforms) <= PACK_THRESHOLD:
+        return repr(list(transforms))
+    packed = base64.b64encode(struct.pack(f"<{len(transforms)}f", *transforms)).decode()
+    return f"_unpack_transforms({packed!r})"
+
+
+def _identifier(name: str) -> str:
+    cleaned = "".join(ch.lower() if ch.isalnum() else "_" for ch in name)
+    return f"_{cleaned}"
+
+
+def resolve_params(value, params: Dict):
+    """Replace ``Param`` placeholders in a (nested) value with concrete values"""
+    if isinstance(value, Param):
+        return params[value.name]
+    if isinstance(value, dict):
+        return {key: resolve_params(item, params) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [resolve_params(item, params) for item in value]
+    return value
+
+
+class SceneBuilder:
+    """Collects scene operations and emits a data-API Blender script
+    
+    Declarative calls are also recorded as scene-graph nodes (see
+    ``nodes``); ``raw`` code only ends up in the script.
+    """
+
+    def __init__(self, collection: str, clear_scene: bool = False, progress: bool = False):
+        self.collection = collection
+        self.clear_scene = clear_scene
+        # Report each finished section through report_progress
+        self.progress = progress
+        self._nodes: Dict[str, Dict] = {}
+        self._sections: Dict[str, List[str]] = {section: [] for section in SECTIONS}
+        self._materials: Dict[str, str] = {}
+        self._material_keys: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+
+    # -- materials -----------------------------------------------------
+
+    def principled_material(self, name: str, **inputs) -> str:
+        """Principled BSDF material; inputs: base_color, metallic, roughness, specular, alpha, ior, clearcoat"""
+        self._node("material", name, shader="principled", settings=dict(inputs))
+        return self._material(name, ("principled", sorted(inputs.items())),
+                              f"_principled_material({name!r}{_kwargs(inputs)})")
+
+    def emission_material(self, name: str, color, strength: float) -> str:
+        self._node("material", name, shader="emission",
+                   settings={"color": color, "strength": strength})
+        return self._material(name, ("emission", color, strength),
+                              f"_emission_material({name!r}, {color!r}, {strength!r})")
+
+    def noise_material(self, name: str, roughness: float, scale: float, colors) -> str:
+        """Principled BSDF colored by a noise texture between two colors"""
+        self._node("material", name, shader="noise",
+                   settings={"roughness": roughness, "scale": scale, "colors": colors})
+        return self._material(name, ("noise", roughness, scale, colors),
+                              f"_noise_material({name!r}, {roughness!r}, {scale!r}, {colors!r})")
+
+    def _material(self, name: str, settings: Tuple, call: str) -> str:
+        # Identical settings within one script share a variable; across
+        # scripts the runtime registry dedupes by shader-parameter hash
+        key = repr(settings)
+        var = self._material_keys.get(key)
+        if var is None:
+            var = self._var(name, "mat")
+            self._emit("materials", f"{var} = {call}")
+            self._material_keys[key] = var
+        self._materials[name] = var
+        return var
+
+    # -- objects -------------------------------------------------------
+
+    def mesh(self, name: str, primitive: str, location=(0, 0, 0), rotation=(0, 0, 0),
+             scale=(1, 1, 1), materials: Sequence[str] = (), **geometry) -> str:
+        """Mesh object from a primitive: cube, plane, cylinder, uv_sphere or monkey"""
+        self._node("mesh", name, primitive=primitive, geometry=geometry, location=location,
+                   rotation=rotation, scale=scale, materials=list(materials), modifiers=[])
+        var = self._var(name)
+        mats = "(" + ", ".join(self._materials[m] for m in materials) + ("," if len(materials) == 1 else "") + ")"
+        self._emit("geometry",
+                   f"{var} = _mesh_object(_collection, {name!r}, {primitive!r}, "
+                   f"{location!r}, {rotation!r}, {scale!r}, {mats}, {geometry!r})")
+        return var
+
+    def scatter(self, name: str, types: Sequence[Dict], transforms: Sequence[float],
+                backend: str = "objects"):
+        """Props placed from a flat transform array (see prop_scatter)
+
+        ``types`` are dicts with name, primitive, materials and geometry.
+        The ``objects`` backend makes one object per prop; ``instances``
+        makes a single geometry-nodes instancer, for layouts too large for
+        per-object scenes. Either way the array is sent in one piece.
+        """
+        if backend not in SCATTER_BACKENDS:
+            raise ValueError(f"Unknown scatter backend {backend!r}")
+        types = [{"name": t["name"], "primitive": t["primitive"],
+                  "materials": list(t.get("materials", ())), "geometry": dict(t.get("geometry", {}))}
+                 for t in types]
+        self._node("scatter", name, types=types, transforms=list(transforms), backend=backend)
+        entries = ", ".join(
+            f"({t['name']!r}, {t['primitive']!r}, [{', '.join(self._materials[m] for m in t['materials'])}], "
+            f"{t['geometry']!r})" for t in types)
+        array = _transform_literal(transforms)
+        var = self._var(name, "scatter")
+        if backend == "instances":
+            self._emit("geometry", f"{var} = _scatter_instances(_collection, {name!r}, [{entries}], "
+                                   f"{array})")
+        else:
+            self._emit("geometry", f"{var} = _scatter(_collection, [{entries}], {array})")
+
+    def modifier(self, obj: str, name: str, modifier_type: str, **settings):
+        self._nodes[self._names[obj]]["modifiers"].append([name, modifier_type, settings])
+        lines = [f"_mod = {obj}.modifiers.new(name={name!r}, type={modifier_type!r})"]
+        lines += [f"_mod.{key} = {value!r}" for key, value in settings.items()]
+        self._emit("geometry", "\n".join(lines))
+
+    def text(self, name: str, body: str, size: float, location=(0, 0, 0), rotation=(0, 0, 0)) -> str:
+        self._node("text", name, body=body, size=size, location=location, rotation=rotation)
+        var = self._var(name)
+        self._emit("geometry", f"{var} = _text(_collection, {name!r}, {body!r}, {size!r}, "
+                               f"{location!r}, {rotation!r})")
+        return var
+
+    def armature(self, name: str, bones: Sequence[Tuple], location=(0, 0, 0)) -> str:
+        """Armature from (bone, head, tail, parent-or-None) tuples"""
+        self._node("armature", name, location=location, bones=list(bones))
+        var = self._var(name)
+        self._emit("armature", f"{var} = _armature(_collection, {name!r}, {location!r}, {list(bones)!r})")
+        return var
+
+    def light(self, name: str, light_type: str, location=(0, 0, 0), rotation=(0, 0, 0),
+              **settings) -> str:
+        self._node("light", name, light_type=light_type, location=location, rotation=rotation,
+                   settings=settings)
+        var = self._var(name)
+        self._emit("lighting", f"{var} = _light(_collection, {name!r}, {light_type!r}, "
+                               f"{location!r}, {rotation!r}{_kwargs(settings)})")
+        return var
+
+    def camera(self, name: str, location, rotation) -> str:
+        self._node("camera", name, location=location, rotation=rotation)
+        var = self._var(name)
+        self._emit("camera", f"{var} = _camera(_collection, {name!r}, {location!r}, {rotation!r})")
+        return var
+
+    def world(self, color=None, strength: Optional[float] = None):
+        self._node("world", "world", color=color, strength=strength)
+        self._emit("world", f"_world({color!r}, {strength!r})")
+
+    def render(self, engine: str, resolution=(1920, 1080), samples=None, **eevee):
+        self._node("render", "render", engine=engine, resolution=resolution, samples=samples,
+                   eevee=eevee)
+        self._emit("render settings", f"_render_settings({engine!r}, {resolution!r}, "
+                                      f"{samples!r}, {eevee!r})")
+
+    def raw(self, section: str, code: str):
+        """Append hand-written code to a section (runtime helpers are in scope)"""
+        self._emit(section, code.strip("\n"))
+
+    def summary(self, *lines: str):
+        for line in lines:
+            self._emit("summary", f"print({line!r})")
+
+    def material_var(self, name: str) -> str:
+        return self._materials[name]
+
+    # -- output --------------------------------------------------------
+
+    def nodes(self, params: Optional[Dict] = None) -> List[Dict]:
+        """Scene-graph nodes for the declarative part of the scene, with params filled in"""
+        return [resolve_params(node, params or {}) for node in self._nodes.values()]
+
+    def build(self, profile: bool = False) -> str:
+        """Return the complete Blender script
+        
+        With ``profile`` each section is timed in Blender and a breakdown
+        printed at the end (see section_profiler).
+        """
+        parts = [RUNTIME.strip("\n"), RESULT_RUNTIME.strip("\n"), ""]
+        if profile:
+            # Clearing the scene and the asset's old collection is the first section
+            parts += [PROFILE_RUNTIME.strip("\n"), "", f"_profile_section({SECTIONS[0]!r})"]
+        if self.clear_scene:
+            parts.append("_clear_scene()")
+        parts.append(f"_collection = _asset_collection({self.collection!r})")
+        steps = [section for section in SECTIONS[1:-1] if self._sections[section]]
+        for section in SECTIONS:
+            if self._sections[section]:
+                parts.append(f"\n# --- {section} ---")
+                if profile and section != SECTIONS[0]:
+                    parts.append(f"_profile_section({section!r})")
+                parts.extend(self._sections[section])
+                if self.progress and section in steps:
+                    parts.append(f"report_progress({steps.index(section) + 1}, {len(steps)}, "
+                                 f"{section.capitalize()!r})")
+        parts.append('print(f"   • Material registry: {_material_stats[\'built\']} built, '
+                     '{_material_stats[\'reused\']} reused")')
+        parts.append('print(f"   • Mesh data: {_mesh_stats[\'meshes\']} unique meshes for '
+                     '{_mesh_stats[\'objects\']} objects")')
+        if profile:
+            parts.append("_profile_report()")
+        parts.append("_asset_result([obj.name for obj in _collection.all_objects])")
+        return "\n".join(parts) + "\n"
+
+    def _node(self, kind: str, name: str, **fields):
+        node = {"kind": kind, "name": name, **fields}
+        if kind not in ("material", "world", "render"):
+            node["collection"] = self.collection
+        self._nodes[name if kind != "material" else f"material:{name}"] = node
+
+    def _emit(self, section: str, code: str):
+        self._sections[section].append(code)
+
+    def _var(self, name: str, prefix: str = "obj") -> str:
+        base = f"_{prefix}{_identifier(name)}"
+        var, n = base, 1
+        while var in self._names:
+            n += 1
+            var = f"{base}_{n}"
+        self._names[var] = name
+        return var
+
+
+def _kwargs(values: Dict) -> str:
+    return "".join(f", {key}={value!r}" for key, value in values.items())
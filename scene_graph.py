@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Scene Graph
+
+A client-side description of a Blender scene (materials, meshes, prop
+scatters, text, armatures, lights, cameras, world and render settings) and
+a diff engine that turns two versions of it into add/update/remove
+operations. Only those operations are sent to Blender, so changing one
+object in a large scene costs about as much as the change itself.
+
+Blender stamps the scene with the version of the last graph applied to it.
+When the stamp does not match what the client last applied (a fresh worker,
+a different worker of a pool, a reloaded file, an asset rebuilt over the
+graph's collections) the client resends the full graph instead of a diff.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from mcp_transport import result_text
+from asset_result import RESULT_RUNTIME, parse_result
+from scene_builder import RUNTIME
+import tracing
+
+logger = logging.getLogger(__name__)
+
+RESYNC_MARKER = "@@MCP_SCENE_RESYNC@@"
+APPLY_TEMPLATE = "scene_graph_diff"
+
+# Nodes are applied in this order so dependencies (materials) exist first
+KIND_ORDER = ("material", "mesh", "scatter", "text", "armature", "light", "camera", "world", "render")
+OBJECT_KINDS = ("mesh", "scatter", "text", "armature", "light", "camera")
+TRANSFORM_FIELDS = {"location", "rotation", "scale"}
+
+APPLY_SOURCE = RESULT_RUNTIME + '''
+_scene = bpy.context.scene
+
+
+def _graph_object(name):
+    obj = bpy.data.objects.get(name)
+    if obj is not None and obj.get("mcp_graph") == name:
+        return obj
+    return next((o for o in bpy.data.objects if o.get("mcp_graph") == name), None)
+
+
+def _graph_collection(name):
+    return _asset_collection(name, replace=False)
+
+
+def _create_node(node, materials):
+    kind, name = node["kind"], node["name"]
+    collection = _graph_collection(node["collection"])
+    if kind == "mesh":
+        obj = _mesh_object(collection, name, node["primitive"], node["location"], node["rotation"],
+                           node["scale"], [materials[m] for m in node["materials"]], node["geometry"])
+        for mod_name, mod_type, settings in node["modifiers"]:
+            _set_attrs(obj.modifiers.new(name=mod_name, type=mod_type), settings)
+    elif kind == "text":
+        obj = _text(collection, name, node["body"], node["size"], node["location"], node["rotation"])
+    elif kind == "armature":
+        obj = _armature(collection, name, node["location"], node["bones"])
+    elif kind == "light":
+        obj = _light(collection, name, node["light_type"], node["location"], node["rotation"],
+                     **node["settings"])
+    else:
+        obj = _camera(collection, name, node["location"], node["rotation"])
+    obj["mcp_graph"] = name
+    return obj
+
+
+def _create_scatter(node, materials):
+    types = [(t["name"], t["primitive"], [materials[m] for m in t["materials"]], t["geometry"])
+             for t in node["types"]]
+    collection = _graph_collection(node["collection"])
+    if node.get("backend") == "instances":
+        objects = _scatter_instances(collection, node["name"], types, node["transforms"])
+    else:
+        objects = _scatter(collection, types, node["transforms"])
+    for obj in objects:
+        obj["mcp_graph"] = obj.name
+        obj["mcp_scatter"] = node["name"]
+
+
+def _remove_node(name):
+    obj = _graph_object(name)
+    if obj is not None:
+        bpy.data.objects.remove(obj, do_unlink=True)
+
+
+def _remove_scatter(name):
+    for obj in [o for o in bpy.data.objects if o.get("mcp_scatter") == name]:
+        bpy.data.objects.remove(obj, do_unlink=True)
+    _remove_prototypes(name)
+
+
+def _apply_graph(params):
+    stats = {"added": 0, "updated": 0, "removed": 0}
+    if params["reset"]:
+        for obj in [o for o in bpy.data.objects if o.get("mcp_graph")]:
+            bpy.data.objects.remove(obj, do_unlink=True)
+        # Per-asset builds may have left their objects in the same collections
+        for name in {op["node"]["collection"] for op in params["ops"]
+                     if op["op"] != "remove" and "collection" in op["node"]}:
+            _remove_collection(name)
+    elif _scene.get("mcp_graph_version") != params["base"]:
+        print(params["resync_marker"])
+        return
+
+    materials = {}
+    for op in params["ops"]:
+        if op["op"] == "remove":
+            if op["kind"] == "scatter":
+                _remove_scatter(op["name"])
+                stats["removed"] += 1
+            elif op["kind"] not in ("material", "world", "render"):
+                _remove_node(op["name"])
+                stats["removed"] += 1
+            continue
+
+        node = op["node"]
+        kind = node["kind"]
+        stats["added" if op["op"] == "add" else "updated"] += 1
+        if kind == "material":
+            # The shared registry makes re-sending an unchanged material a lookup
+            materials[node["name"]] = _material(node["shader"], node["name"], node["settings"])
+        elif kind == "world":
+            _world(node["color"], node["strength"])
+        elif kind == "render":
+            _render_settings(node["engine"], node["resolution"], node["samples"], node["eevee"])
+        elif kind == "scatter":
+            # One node per layout; any change re-places the whole layout
+            _remove_scatter(node["name"])
+            _create_scatter(node, materials)
+        else:
+            obj = _graph_object(node["name"])
+            moved_only = set(op.get("fields", ())) <= set(params["transform_fields"])
+            if op["op"] == "update" and obj is not None and moved_only:
+                obj.location = node["location"]
+                obj.rotation_euler = node["rotation"]
+                if "scale" in node:
+                    obj.scale = node["scale"]
+            else:
+                if obj is not None:
+                    bpy.data.objects.remove(obj, do_unlink=True)
+                _create_node(node, materials)
+
+    _scene["mcp_graph_version"] = params["version"]
+    print(f"✅ Scene graph applied: {stats['added']} added, {stats['updated']} updated, "
+          f"{stats['removed']} removed")
+    _asset_result([obj.name for obj in bpy.data.objects if obj.get("mcp_graph")])
+
+
+_apply_graph(params)
+'''
+
+
+def _normalize(value):
+    # JSON round trip so tuples and lists compare equal, as they will once
+    # sent to Blender
+    return json.loads(json.dumps(value))
+
+
+def _offset(location, offset) -> List[float]:
+    return [a + b for a, b in zip(location, offset)]
+
+
+def _offset_transforms(transforms, offset) -> List[float]:
+    # Flat [type, x, y, z, rot_z, sx, sy, sz] records; shift x, y, z
+    moved = list(transforms)
+    for i in range(0, len(moved), 8):
+        moved[i + 1:i + 4] = _offset(moved[i + 1:i + 4], offset)
+    return moved
+
+
+def node_materials(node: Dict) -> List[str]:
+    """Names of the materials a node's objects use"""
+    if node["kind"] == "scatter":
+        return [name for prop in node["types"] for name in prop["materials"]]
+    return node.get("materials", [])
+
+
+class SceneGraph:
+    """Declarative scene: nodes keyed by (kind family, name)"""
+
+    def __init__(self, nodes: Iterable[Dict] = ()):
+        self._nodes: Dict[Tuple[str, str], Dict] = {}
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def key(node: Dict) -> Tuple[str, str]:
+        # Objects share one namespace in Blender whatever their kind
+        family = "object" if node["kind"] in OBJECT_KINDS else node["kind"]
+        return family, node["name"]
+
+    def add(self, node: Dict, offset=None):
+        """Add or replace a node, optionally moved by offset"""
+        node = _normalize(node)
+        if offset is not None and node["kind"] == "scatter":
+            node["transforms"] = _offset_transforms(node["transforms"], offset)
+        elif offset is not None and node["kind"] in OBJECT_KINDS:
+            node["location"] = _offset(node["location"], offset)
+        self._nodes[self.key(node)] = node
+
+    def merge(self, nodes: Iterable[Dict], offset=None):
+        """Add another asset's nodes; object names must not clash"""
+        for node in nodes:
+            existing = self._nodes.get(self.key(node))
+            if (existing is not None and node["kind"] in OBJECT_KINDS
+                    and existing.get("collection") != node.get("collection")):
+                raise ValueError(f"Object {node['name']!r} exists in both "
+                                 f"{existing['collection']!r} and {node['collection']!r}")
+            self.add(node, offset)
+
+    def remove(self, kind: str, name: str):
+        self._nodes.pop(self.key({"kind": kind, "name": name}), None)
+
+    def get(self, kind: str, name: str) -> Optional[Dict]:
+        return self._nodes.get(self.key({"kind": kind, "name": name}))
+
+    def nodes(self) -> List[Dict]:
+        return sorted(self._nodes.values(), key=lambda node: KIND_ORDER.index(node["kind"]))
+
+    def collections(self) -> List[str]:
+        """Names of the Blender collections the graph's objects live in"""
+        return sorted({node["collection"] for node in self._nodes.values() if "collection" in node})
+
+    def copy(self) -> "SceneGraph":
+        graph = SceneGraph()
+        graph._nodes = copy.deepcopy(self._nodes)
+        return graph
+
+    def version(self) -> str:
+        """Content hash identifying this exact graph"""
+        text = json.dumps(sorted(self._nodes.values(), key=lambda n: (n["kind"], n["name"])),
+                          sort_keys=True)
+        return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+    def __len__(self):
+        return len(self._nodes)
+
+
+def diff(old: SceneGraph, new: SceneGraph) -> List[Dict]:
+    """Operations that turn ``old`` into ``new``
+
+    Returns ``remove`` ops first, then ``add``/``update`` ops in dependency
+    order. Objects using a material whose settings changed are updated too,
+    and every material an added or updated object uses is (re)sent so
+    Blender can resolve it; the material registry makes that a lookup.
+    """
+    ops: List[Dict] = []
+    for key, node in old._nodes.items():
+        if key not in new._nodes or new._nodes[key]["kind"] != node["kind"]:
+            ops.append({"op": "remove", "kind": node["kind"], "name": node["name"]})
+
+    changed: Dict[Tuple[str, str], Dict] = {}
+    for key, node in new._nodes.items():
+        before = old._nodes.get(key)
+        if before is None or before["kind"] != node["kind"]:
+            changed[key] = {"op": "add", "node": node}
+        elif before != node:
+            fields = sorted(field for field in set(node) | set(before)
+                            if node.get(field) != before.get(field))
+            changed[key] = {"op": "update", "node": node, "fields": fields}
+
+    changed_materials = {name for (family, name) in changed if family == "material"}
+    for key, node in new._nodes.items():
+        if key not in changed and set(node_materials(node)) & changed_materials:
+            changed[key] = {"op": "update", "node": node, "fields": ["materials"]}
+
+    # Objects that get (re)created need their materials resolved in Blender
+    needed = {name for op in changed.values()
+              if op["op"] == "add" or not set(op["fields"]) <= TRANSFORM_FIELDS
+              for name in node_materials(op["node"])}
+    for name in needed:
+        key = ("material", name)
+        if key not in changed and key in new._nodes:
+            changed[key] = {"op": "update", "node": new._nodes[key], "fields": []}
+
+    ops.extend(sorted(changed.values(), key=lambda op: KIND_ORDER.index(op["node"]["kind"])))
+    return ops
+
+
+def apply_params(ops: List[Dict], base: Optional[str], version: str, reset: bool) -> Dict:
+    """Params for APPLY_SOURCE moving a scene stamped ``base`` to ``version``"""
+    return {
+        "ops": ops,
+        "base": base,
+        "version": version,
+        "reset": reset,
+        "transform_fields": sorted(TRANSFORM_FIELDS),
+        "resync_marker": RESYNC_MARKER,
+    }
+
+
+class SceneSync:
+    """Keeps a Blender scene in step with a SceneGraph by sending diffs
+
+    ``execute`` is the application's ``execute_blender_script(script,
+    template, params)`` coroutine, so diffs go through the same template,
+    batching and streaming path as asset scripts.
+    """
+
+    def __init__(self, execute: Callable[..., Awaitable]):
+        self.execute = execute
+        self.applied = SceneGraph()
+        self.applied_version: Optional[str] = None
+        # Structured result measured after the last applied diff
+        self.report: Optional[Dict] = None
+
+    async def apply(self, graph: SceneGraph) -> Optional[Dict]:
+        """Send Blender the changes since the last applied graph"""
+        version = graph.version()
+        if version == self.applied_version:
+            logger.info("Scene graph unchanged, nothing to send")
+            return {"added": 0, "updated": 0, "removed": 0}
+
+        with tracing.span("script_build"):
+            ops = diff(self.applied, graph)
+        result = await self._send(ops, version, reset=self.applied_version is None)
+        if result and RESYNC_MARKER in result_text(result):
+            logger.info("Blender scene is not at the last applied version, resending full graph")
+            with tracing.span("script_build"):
+                ops = diff(SceneGraph(), graph)
+            result = await self._send(ops, version, reset=True)
+        if not result:
+            return None
+
+        self.applied = graph.copy()
+        self.applied_version = version
+        self.report = parse_result(result) or self.report
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        for op in ops:
+            counts[{"add": "added", "update": "updated", "remove": "removed"}[op["op"]]] += 1
+        return counts
+
+    async def _send(self, ops: List[Dict], version: str, reset: bool):
+        return await self.execute(RUNTIME + APPLY_SOURCE, APPLY_TEMPLATE,
+                                  apply_params(ops, self.applied_version, version, reset))
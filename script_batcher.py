@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Script Batcher
+
+Coalesces Blender scripts submitted close together into one execution.
+Pending scripts are collected for a short window (or until a size limit),
+wrapped in a single payload that runs each one in its own namespace inside
+Blender, and the per-script output is split back to each caller.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from mcp_transport import MCPError, MCPTimeout, result_text
+import tracing
+
+logger = logging.getLogger(__name__)
+
+BATCH_MARKER = "@@MCP_BATCH_RESULTS@@"
+
+BATCH_RUNNER = '''
+import contextlib as _contextlib
+import io as _io
+import json as _json
+import traceback as _traceback
+
+_batch_results = []
+for _index, _source in enumerate(_batch_scripts):
+    _stdout = _io.StringIO()
+    _ok = True
+    try:
+        _code = compile(_source, "<batch-%d>" % _index, "exec")
+        with _contextlib.redirect_stdout(_stdout):
+            exec(_code, {"__name__": "__main__"})
+    except Exception:
+        _ok = False
+        _stdout.write(_traceback.format_exc())
+    _batch_results.append({"ok": _ok, "output": _stdout.getvalue()})
+
+print(_batch_marker + _json.dumps(_batch_results))
+'''
+
+
+def build_batch_script(scripts: List[str]) -> str:
+    """Wrap several scripts into one payload that runs each in isolation"""
+    return (f"_batch_scripts = {scripts!r}\n"
+            f"_batch_marker = {BATCH_MARKER!r}\n"
+            + BATCH_RUNNER)
+
+
+def split_batch_result(result: Dict, count: int) -> List[Dict]:
+    """Turn one batched MCP result back into per-script MCP results"""
+    text = result_text(result)
+    for line in reversed(text.splitlines()):
+        if line.startswith(BATCH_MARKER):
+            items = json.loads(line[len(BATCH_MARKER):])
+            if len(items) != count:
+                raise MCPError(f"Batch returned {len(items)} results for {count} scripts")
+            return [
+                {"content": [{"type": "text", "text": item["output"]}],
+                 "isError": not item["ok"]}
+                for item in items
+            ]
+    # Servers that only record scripts never run the wrapper; every script
+    # shares the batch's outcome.
+    return [result] * count
+
+
+class ScriptBatcher:
+    """Collects concurrent script submissions and sends them as batches
+    
+    ``batch_timeout`` is the deadline for each whole batch round trip.
+    At most ``max_pending`` scripts are queued or in flight; further
+    submitters wait until earlier scripts finish.
+    """
+
+    def __init__(self, transport, max_batch_size: int = 16, max_delay: float = 0.01,
+                 batch_timeout: Optional[float] = None, max_pending: int = 256):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.transport = transport
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batch_timeout = batch_timeout
+        self._capacity = asyncio.Semaphore(max_pending)
+
+        self.batches_sent = 0
+        self.scripts_sent = 0
+
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._in_flight = set()
+
+    async def submit(self, script: str, timeout: Optional[float] = None) -> Dict:
+        """Queue a script for the next batch and wait for its own result"""
+        async with self._capacity:
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((script, future))
+
+            if len(self._pending) >= self.max_batch_size:
+                self._flush_now()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self.max_delay, self._flush_now)
+
+            try:
+                result = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                raise MCPTimeout(f"Batched script exceeded its {timeout}s deadline")
+        if result.get("isError"):
+            raise MCPError(result_text(result) or "Batched script failed")
+        return result
+
+    async def flush(self):
+        """Send anything pending immediately and wait for in-flight batches"""
+        self._flush_now()
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight, return_exceptions=True)
+
+    async def close(self):
+        await self.flush()
+
+    def _flush_now(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._send(batch))
+        self._in_flight.add(task)
+        task.add_done_callback(self._in_flight.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]):
+        # A batch serves many jobs; each is charged the wait for its result
+        tracing.detach()
+        scripts = [script for script, _ in batch]
+        futures = [future for _, future in batch]
+        try:
+            if len(scripts) == 1:
+                results = [await self.transport.execute_script(scripts[0], self.batch_timeout)]
+            else:
+                payload = build_batch_script(scripts)
+                result = await self.transport.execute_script(payload, self.batch_timeout)
+                results = split_batch_result(result, len(scripts))
+            self.batches_sent += 1
+            self.scripts_sent += len(scripts)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
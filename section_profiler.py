@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Section Profiler
+
+Opt-in timing of the sections of a generated asset script (setup,
+materials, geometry, armature, lighting, camera, world, render settings)
+inside Blender. ``SceneBuilder.build(profile=True)`` puts a
+``_profile_section`` call at the start of each section and
+``_profile_report`` at the end; the report is one JSON line after
+PROFILE_MARKER with, per section:
+
+- ``seconds``: Python time running the section's code (perf_counter_ns)
+- ``eval_seconds``: evaluating the depsgraph right after the section. Data-API
+  edits defer their evaluation, so without this the cost of e.g. a
+  subdivision modifier would land after the script ends, in no section.
+- ``depsgraph_updates`` / ``ids_updated``: depsgraph update events during the
+  section (from a ``depsgraph_update_post`` handler) and the datablocks they
+  touched; ``bpy.ops`` calls show up here
+
+The forced evaluations make a profiled build slightly slower than a plain
+one, so profiling stays off unless asked for.
+"""
+
+import json
+from typing import Dict, Optional
+
+from mcp_transport import result_text
+
+PROFILE_MARKER = "@@MCP_PROFILE@@"
+
+# Emitted after RUNTIME (which imports bpy) in profiled scripts
+PROFILE_RUNTIME = f'''
+import json as _profile_json
+import time as _profile_time
+
+_profile = {{"sections": [], "current": None, "updates": 0, "ids": 0,
+            "started": _profile_time.perf_counter_ns()}}
+
+
+def _mcp_depsgraph_counter(scene, depsgraph):
+    _profile["updates"] += 1
+    _profile["ids"] += len(depsgraph.updates)
+
+
+def _profile_handlers(install):
+    handlers = bpy.app.handlers.depsgraph_update_post
+    # A profiled script that failed part-way leaves its counter behind
+    for handler in [h for h in handlers if getattr(h, "__name__", "") == "_mcp_depsgraph_counter"]:
+        handlers.remove(handler)
+    if install:
+        handlers.append(_mcp_depsgraph_counter)
+
+
+def _profile_close():
+    if _profile["current"] is None:
+        return
+    section, started, updates, ids = _profile["current"]
+    ran = _profile_time.perf_counter_ns()
+    bpy.context.view_layer.update()
+    evaluated = _profile_time.perf_counter_ns()
+    _profile["sections"].append({{
+        "section": section,
+        "seconds": round((ran - started) / 1e9, 6),
+        "eval_seconds": round((evaluated - ran) / 1e9, 6),
+        "depsgraph_updates": _profile["updates"] - updates,
+        "ids_updated": _profile["ids"] - ids,
+    }})
+    _profile["current"] = None
+
+
+def _profile_section(section):
+    _profile_close()
+    _profile["current"] = (section, _profile_time.perf_counter_ns(), _profile["updates"], _profile["ids"])
+
+
+def _profile_report():
+    _profile_close()
+    _profile_handlers(False)
+    print({PROFILE_MARKER!r} + _profile_json.dumps({{
+        "sections": _profile["sections"],
+        "total_seconds": round((_profile_time.perf_counter_ns() - _profile["started"]) / 1e9, 6),
+    }}))
+
+
+_profile_handlers(True)
+'''
+
+
+def parse_profile(result: Optional[Dict]) -> Optional[Dict]:
+    """The section breakdown a profiled script printed, if it ran"""
+    if not result:
+        return None
+    for line in reversed(result_text(result).splitlines()):
+        if line.startswith(PROFILE_MARKER):
+            return json.loads(line[len(PROFILE_MARKER):])
+    return None
+
+
+def format_profile(profile: Dict, limit: int = 4) -> str:
+    """The slowest sections on one line, e.g. ``geometry 120ms (3 updates)``"""
+    sections = sorted(profile["sections"], key=lambda s: -(s["seconds"] + s["eval_seconds"]))
+    return ", ".join(
+        f"{s['section']} {(s['seconds'] + s['eval_seconds']) * 1000:.0f}ms"
+        + (f" ({s['depsgraph_updates']} updates)" if s["depsgraph_updates"] else "")
+        for s in sections[:limit])
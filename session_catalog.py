@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Session Catalog
+
+SQLite index of asset-creation sessions, kept next to the session log in
+``output_dir``. The session log feeds it every batch of events it writes,
+so the catalog is current without ever re-reading logs, and listing,
+filtering (by category or date) and paging thousands of sessions are
+single indexed queries.
+
+Session summary files written before the catalog existed are imported
+once, the first time they are seen.
+"""
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CATALOG_NAME = "session_catalog.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    started TEXT,
+    ended TEXT,
+    total_assets INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS sessions_started ON sessions (started);
+CREATE TABLE IF NOT EXISTS assets (
+    session_id TEXT NOT NULL,
+    timestamp TEXT,
+    category TEXT,
+    type TEXT
+);
+CREATE INDEX IF NOT EXISTS assets_session ON assets (session_id);
+CREATE INDEX IF NOT EXISTS assets_category ON assets (category, session_id);
+CREATE TABLE IF NOT EXISTS imported_files (
+    name TEXT PRIMARY KEY
+);
+"""
+
+
+class SessionCatalog:
+    """Indexed sessions and their assets, safe to share between processes"""
+
+    def __init__(self, output_dir: Path):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / CATALOG_NAME
+        # Writers from several processes wait on each other instead of failing
+        self._db = sqlite3.connect(str(self.path), timeout=30.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def record(self, events: Iterable[Dict]):
+        """Apply a batch of session log events in one transaction"""
+        with self._db:
+            for event in events:
+                session_id = event["session"]
+                self._db.execute("INSERT OR IGNORE INTO sessions (session_id, started) VALUES (?, ?)",
+                                 (session_id, event["timestamp"]))
+                if event["event"] == "session_start":
+                    self._db.execute("UPDATE sessions SET started = ? WHERE session_id = ?",
+                                     (event["timestamp"], session_id))
+                elif event["event"] == "session_end":
+                    self._db.execute("UPDATE sessions SET ended = ? WHERE session_id = ?",
+                                     (event["timestamp"], session_id))
+                elif event["event"] == "asset":
+                    self._db.execute("INSERT INTO assets VALUES (?, ?, ?, ?)",
+                                     (session_id, event["timestamp"], event.get("category"),
+                                      event.get("type")))
+                    self._db.execute("UPDATE sessions SET total_assets = total_assets + 1 "
+                                     "WHERE session_id = ?", (session_id,))
+
+    def import_summaries(self, pattern: str = "real_assets_session*.json") -> int:
+        """Index summary files not seen before; returns how many were imported"""
+        known = {name for (name,) in self._db.execute("SELECT name FROM imported_files")}
+        imported = 0
+        for path in sorted(self.output_dir.glob(pattern)):
+            if path.name in known:
+                continue
+            try:
+                with open(path, 'r') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"Skipping unreadable session file {path.name}: {e}")
+                continue
+            session_id = data.get("session_id") or path.stem
+            with self._db:
+                self._db.execute("INSERT OR IGNORE INTO imported_files VALUES (?)", (path.name,))
+                exists = self._db.execute("SELECT 1 FROM sessions WHERE session_id = ?",
+                                          (session_id,)).fetchone()
+                if exists:
+                    # Already indexed from the event log as it was written
+                    continue
+                assets = data.get("assets_created", [])
+                self._db.execute("INSERT INTO sessions VALUES (?, ?, ?, ?)",
+                                 (session_id, data.get("session_start"), data.get("session_end"),
+                                  data.get("total_assets", len(assets))))
+                self._db.executemany("INSERT INTO assets VALUES (?, ?, ?, ?)", [
+                    (session_id, asset.get("timestamp"), asset.get("category"), asset.get("type"))
+                    for asset in assets])
+            imported += 1
+        return imported
+
+    def list_sessions(self, category: Optional[str] = None, since: Optional[str] = None,
+                      until: Optional[str] = None, page: int = 1,
+                      page_size: int = 20) -> Tuple[List[Dict], int]:
+        """One page of sessions, newest first, plus the total matching
+
+        ``since``/``until`` are ISO dates (``2025-07-12``) compared against
+        the session start; ``until`` is inclusive of that whole day.
+        """
+        where, args = [], []
+        if category:
+            where.append("EXISTS (SELECT 1 FROM assets a WHERE a.category = ? "
+                         "AND a.session_id = s.session_id)")
+            args.append(category)
+        if since:
+            where.append("s.started >= ?")
+            args.append(since)
+        if until:
+            where.append("s.started < ?")
+            # Timestamps extend the date ("2025-07-12T21:00:00"); "~" sorts after them
+            args.append(until + "~")
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+        total = self._db.execute(f"SELECT COUNT(*) FROM sessions s {clause}", args).fetchone()[0]
+        rows = self._db.execute(
+            f"SELECT s.session_id, s.started, s.ended, s.total_assets FROM sessions s {clause} "
+            f"ORDER BY s.started DESC LIMIT ? OFFSET ?",
+            args + [page_size, (max(page, 1) - 1) * page_size]).fetchall()
+
+        sessions = []
+        for session_id, started, ended, total_assets in rows:
+            categories = dict(self._db.execute(
+                "SELECT category, COUNT(*) FROM assets WHERE session_id = ? GROUP BY category",
+                (session_id,)).fetchall())
+            sessions.append({"session_id": session_id, "session_start": started,
+                             "session_end": ended, "total_assets": total_assets,
+                             "categories": categories})
+        return sessions, total
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Session Log
+
+Append-only JSONL event log shared by every app process writing to the
+same ``output_dir``. Events are buffered in memory and written (and
+fsync'd) in batches under a cross-process lock, so logging an asset costs
+the same whether it is the first or the ten-thousandth.
+
+Compaction turns the events of finished sessions into one summary file per
+session (``real_assets_session_<id>.json``, the format the launcher lists)
+and drops them from the log. It runs when a session closes or on demand:
+
+    python session_log.py created_assets
+"""
+
+import argparse
+import json
+import logging
+import os
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from file_lock import file_lock
+from session_catalog import SessionCatalog
+
+logger = logging.getLogger(__name__)
+
+LOG_NAME = "real_assets_session.jsonl"
+SUMMARY_PREFIX = "real_assets_session_"
+
+
+def new_session_id() -> str:
+    """Sortable id unique across concurrently started processes"""
+    return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+
+
+class SessionLog:
+    """Buffered writer for one session's events in the shared JSONL log
+
+    Up to ``flush_every`` events (or ``flush_interval`` seconds' worth) are
+    kept in memory; a crash loses at most that much. Each written batch is
+    also indexed in the session catalog.
+    """
+
+    def __init__(self, output_dir: Path, session_id: Optional[str] = None,
+                 flush_every: int = 32, flush_interval: float = 1.0):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / LOG_NAME
+        self.lock_path = self.output_dir / f".{LOG_NAME}.lock"
+        self.session_id = session_id or new_session_id()
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._buffer: List[Dict] = []
+        self._catalog: Optional[SessionCatalog] = None
+        self._last_flush = time.monotonic()
+        self.closed = False
+        self.append({"event": "session_start"})
+
+    def append(self, event: Dict):
+        """Queue an event; written with the next batch"""
+        record = {"session": self.session_id, "timestamp": datetime.now().isoformat(), **event}
+        self._buffer.append(record)
+        if (len(self._buffer) >= self.flush_every
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """Write and fsync buffered events in one append"""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        data = "".join(json.dumps(record) + "\n" for record in self._buffer)
+        # Lock before opening: compaction replaces the file, and a handle
+        # opened earlier would append to the replaced copy
+        with file_lock(self.lock_path):
+            with open(self.path, "a") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        try:
+            if self._catalog is None:
+                self._catalog = SessionCatalog(self.output_dir)
+            self._catalog.record(self._buffer)
+        except sqlite3.Error as e:
+            # The log is the source of truth; the catalog can be rebuilt from it
+            logger.warning(f"Session catalog not updated: {e}")
+        self._buffer.clear()
+
+    def close(self, compact: bool = True) -> List[Path]:
+        """End the session, flush, and compact finished sessions"""
+        if self.closed:
+            return []
+        self.append({"event": "session_end"})
+        self.flush()
+        self.closed = True
+        if self._catalog is not None:
+            self._catalog.close()
+        return compact_log(self.output_dir) if compact else []
+
+
+def summarize(events: List[Dict]) -> Dict:
+    """Session summary in the layout of the original session JSON file"""
+    summary = {"session_id": events[0]["session"], "session_start": events[0]["timestamp"],
+               "assets_created": [], "total_assets": 0}
+    for event in events:
+        if event["event"] == "session_start":
+            summary["session_start"] = event["timestamp"]
+        elif event["event"] == "session_end":
+            summary["session_end"] = event["timestamp"]
+        elif event["event"] == "asset":
+            asset = {key: value for key, value in event.items() if key not in ("event", "session")}
+            summary["assets_created"].append(asset)
+            summary["total_assets"] += 1
+        elif event["event"] == "lods":
+            # Triangle counts per LOD level, from the latest export of each asset
+            summary.setdefault("lods", {})[event["asset"]] = event["lods"]
+    return summary
+
+
+def compact_log(output_dir: Path, include_open: bool = False) -> List[Path]:
+    """Write summaries for finished sessions and drop their events
+
+    Events of sessions still running (no ``session_end`` yet) stay in the
+    log unless ``include_open`` is set, which summarizes them as they stand
+    without removing them. Returns the summary files written.
+    """
+    output_dir = Path(output_dir)
+    path = output_dir / LOG_NAME
+    with file_lock(output_dir / f".{LOG_NAME}.lock"):
+        if not path.exists():
+            return []
+        sessions: Dict[str, List[Dict]] = {}
+        with open(path, "r") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crashed writer
+                    logger.warning(f"Skipping unreadable session log line: {line[:80]!r}")
+                    continue
+                sessions.setdefault(event["session"], []).append(event)
+
+        written, keep = [], []
+        for session_id, events in sessions.items():
+            ended = any(event["event"] == "session_end" for event in events)
+            if ended or include_open:
+                summary_path = output_dir / f"{SUMMARY_PREFIX}{session_id}.json"
+                with open(summary_path, "w") as f:
+                    json.dump(summarize(events), f, indent=2)
+                written.append(summary_path)
+            if not ended:
+                keep.extend(events)
+
+        temp = path.with_suffix(".jsonl.tmp")
+        with open(temp, "w") as f:
+            f.writelines(json.dumps(event) + "\n" for event in keep)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp, path)
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Write summaries of finished sessions and drop their events from the log")
+    parser.add_argument("output_dir", nargs="?", default="created_assets",
+                        help="Application output directory holding the log")
+    parser.add_argument("--include-open", action="store_true",
+                        help="Also summarize sessions that have not ended (kept in the log)")
+    args = parser.parse_args()
+
+    for summary_path in compact_log(Path(args.output_dir), args.include_open):
+        print(f"📄 {summary_path}")
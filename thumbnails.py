@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Thumbnails
+
+Low-resolution preview images of built assets, so an asset can be checked
+without switching a Blender viewport to Material Preview. A thumbnail is
+rendered with the Workbench engine (or EEVEE at a handful of samples) at
+256 pixels, in the same Blender job that builds the asset, and stored by
+the asset's content hash: the asset-cache key of its script, params and
+Blender version. An asset whose thumbnail exists never renders again.
+
+Files are written under a temporary name and renamed into place, so a
+listing never shows a half-written image.
+"""
+
+import json
+import logging
+import os
+import uuid
+from pathlib import Path
+from typing import Dict, Optional
+
+from mcp_transport import result_text
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_MARKER = "@@MCP_THUMBNAIL@@"
+THUMBNAIL_ENGINES = ("workbench", "eevee")
+
+# Appended to an asset script, or run alone to preview a cached .blend
+# (params["blend"]) or collections already built on the worker
+# (params["thumbnail_collections"]); renders params["thumbnail_path"] from a
+# temporary scene holding only the asset, leaving the worker's scene untouched
+THUMBNAIL_SOURCE = f'''
+import bpy as _thumb_bpy, json as _thumb_json, mathutils as _thumb_mathutils, time as _thumb_time
+
+
+def _thumb_engine(scene, engine):
+    if engine == "eevee":
+        for candidate in ("BLENDER_EEVEE_NEXT", "BLENDER_EEVEE"):
+            try:
+                scene.render.engine = candidate
+                break
+            except TypeError:
+                continue
+        scene.eevee.taa_render_samples = 4
+    else:
+        scene.render.engine = 'BLENDER_WORKBENCH'
+        scene.display.shading.light = 'STUDIO'
+        scene.display.shading.color_type = 'MATERIAL'
+        scene.display.render_aa = 'FXAA'
+
+
+def _thumb_camera(scene):
+    # Frame every visible object from a three-quarter view
+    camera = _thumb_bpy.data.objects.new("mcp_thumbnail_camera",
+                                         _thumb_bpy.data.cameras.new("mcp_thumbnail_camera"))
+    scene.collection.objects.link(camera)
+    camera.rotation_euler = (1.1, 0.0, 0.785)
+    depsgraph = _thumb_bpy.context.evaluated_depsgraph_get()
+    coords = [c for obj in scene.objects if obj.type == 'MESH' and obj.visible_get()
+              for corner in obj.bound_box for c in obj.matrix_world @ _thumb_mathutils.Vector(corner)]
+    if coords:
+        camera.location, _ = camera.camera_fit_coords(depsgraph, coords)
+    return camera
+
+
+def _thumb_scene(params):
+    """A scene holding only the asset; removed again after the preview"""
+    if params.get("blend"):
+        with _thumb_bpy.data.libraries.load(params["blend"]) as (_src, _dst):
+            _dst.scenes = _src.scenes[:1]
+        return _dst.scenes[0]
+    # A composite scene names its collections; an asset script built _collection
+    if params.get("thumbnail_collections"):
+        missing = [name for name in params["thumbnail_collections"]
+                   if name not in _thumb_bpy.data.collections]
+        if missing:
+            raise RuntimeError(f"Collections not in this scene: {{', '.join(missing)}}")
+        collections = [_thumb_bpy.data.collections[name] for name in params["thumbnail_collections"]]
+    else:
+        collections = [_collection]
+    # Other assets built on this worker stay out of the preview
+    scene = _thumb_bpy.context.scene.copy()
+    for child in list(scene.collection.children):
+        if child not in collections:
+            scene.collection.children.unlink(child)
+    for obj in list(scene.collection.objects):
+        scene.collection.objects.unlink(obj)
+    objects = [obj for collection in collections for obj in collection.all_objects]
+    if scene.camera not in objects:
+        scene.camera = next((obj for obj in objects if obj.type == 'CAMERA'), None)
+    return scene
+
+
+def _thumbnail(params):
+    started = _thumb_time.perf_counter()
+    scene = _thumb_scene(params)
+    render = scene.render
+    camera = None
+    try:
+        _thumb_engine(scene, params["thumbnail_engine"])
+        size = params["thumbnail_size"]
+        aspect = render.resolution_y / render.resolution_x
+        render.resolution_x, render.resolution_y = size, max(int(size * aspect), 1)
+        render.resolution_percentage = 100
+        render.use_border = False
+        render.image_settings.file_format = 'PNG'
+        render.filepath = params["thumbnail_path"]
+        if scene.camera is None:
+            camera = scene.camera = _thumb_camera(scene)
+        _thumb_bpy.ops.render.render(write_still=True, scene=scene.name)
+    finally:
+        if camera is not None:
+            _thumb_bpy.data.objects.remove(camera, do_unlink=True)
+        _thumb_bpy.data.scenes.remove(scene)
+        if params.get("blend") and hasattr(_thumb_bpy.data, "orphans_purge"):
+            _thumb_bpy.data.orphans_purge(do_recursive=True)
+    print({THUMBNAIL_MARKER!r} + _thumb_json.dumps({{
+        "file": params["thumbnail_path"], "seconds": round(_thumb_time.perf_counter() - started, 4)}}))
+
+
+_thumbnail(params)
+'''
+
+
+class ThumbnailStore:
+    """Directory of ``<content hash>.png`` previews"""
+
+    def __init__(self, root: Path, size: int = 256, engine: str = "workbench"):
+        if engine not in THUMBNAIL_ENGINES:
+            raise ValueError(f"Unknown thumbnail engine {engine!r} "
+                             f"(choose from {', '.join(THUMBNAIL_ENGINES)})")
+        self.root = Path(root).resolve()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.size = size
+        self.engine = engine
+
+    def path(self, key: str) -> Path:
+        return self.root / f"{key}.png"
+
+    def get(self, key: str) -> Optional[Path]:
+        """The thumbnail for ``key``, if one has been rendered"""
+        path = self.path(key)
+        return path if path.exists() else None
+
+    def params(self, key: str) -> Dict:
+        """Params for THUMBNAIL_SOURCE, rendering to a private temporary file"""
+        staged = self.root / f".{key}.{os.getpid()}.{uuid.uuid4().hex[:8]}.png"
+        return {"thumbnail_path": str(staged), "thumbnail_size": self.size,
+                "thumbnail_engine": self.engine}
+
+    def commit(self, key: str, params: Dict, result: Optional[Dict]) -> Optional[Path]:
+        """Move a rendered thumbnail into place; None if Blender did not render it"""
+        staged = Path(params["thumbnail_path"])
+        report = None
+        for line in reversed(result_text(result).splitlines() if result else []):
+            if line.startswith(THUMBNAIL_MARKER):
+                report = json.loads(line[len(THUMBNAIL_MARKER):])
+                break
+        if report is None or not staged.exists():
+            staged.unlink(missing_ok=True)
+            return None
+        path = self.path(key)
+        os.replace(staged, path)
+        logger.info(f"Thumbnail {path.name} rendered in {report['seconds']:.2f}s")
+        return path
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Tracing
+
+Span-style timing of asset jobs, so a slow ``create_*`` call can be pinned
+on the phase responsible: building the script, the asset cache, waiting
+for a worker, the transport round trip, Blender executing the script, or
+logging the result.
+
+A job is opened with ``Tracer.job``; code anywhere below it (the app, the
+worker pools, the MCP connection) adds phases with the module-level
+``span``, ``record`` and ``remote`` helpers, which find the job through a
+context variable and do nothing outside one. Phases nest, and each phase's
+time is counted once: a ``transport`` span that contains ``queue_wait``
+and ``blender_exec`` is charged only for the rest.
+
+Finished jobs are written to ``<name>.json`` in Chrome trace format (open
+it in Perfetto or chrome://tracing, one row per job) and aggregated into
+per-asset-type latency histograms in ``<name>.prom``, Prometheus text
+format for the node exporter's textfile collector.
+"""
+
+import contextlib
+import contextvars
+import functools
+import itertools
+import json
+import logging
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("script_build", "cache", "queue_wait", "transport", "blender_exec", "logging")
+# Job time spent outside every phase
+OTHER_PHASE = "other"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+                   120.0, 300.0)
+METRIC_PREFIX = "blender_mcp"
+
+_current: contextvars.ContextVar = contextvars.ContextVar("mcp_trace_span", default=None)
+
+
+class Span:
+    """One timed phase; ``job`` is the root span it belongs to"""
+
+    __slots__ = ("name", "job", "parent", "start", "end", "attrs", "child_seconds")
+
+    def __init__(self, name: str, job: Optional["Job"], parent: Optional["Span"],
+                 start: float, attrs: Optional[Dict] = None):
+        self.name = name
+        self.job = job
+        self.parent = parent
+        self.start = start
+        self.end: Optional[float] = None
+        self.attrs = attrs or {}
+        self.child_seconds = 0.0
+
+    def finish(self, end: float):
+        self.end = end
+        if self.parent is not None:
+            self.parent.child_seconds += end - self.start
+        if self.job is not None:
+            self.job.spans.append(self)
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+    @property
+    def self_seconds(self) -> float:
+        # Concurrent children can add up to more than the parent
+        return max(self.seconds - self.child_seconds, 0.0)
+
+
+class Job(Span):
+    """Root span of one asset job"""
+
+    __slots__ = ("id", "asset_type", "status", "spans")
+
+    def __init__(self, job_id: int, asset_type: str, start: float):
+        super().__init__(asset_type, None, None, start)
+        self.id = job_id
+        self.asset_type = asset_type
+        self.status = "ok"
+        self.spans: List[Span] = []
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        """Seconds per phase, each counted once (nested phases excluded)"""
+        totals = dict.fromkeys(PHASES, 0.0)
+        for span in self.spans:
+            totals[span.name] = totals.get(span.name, 0.0) + span.self_seconds
+        totals[OTHER_PHASE] = self.self_seconds
+        return {phase: round(seconds, 6) for phase, seconds in totals.items()}
+
+
+@contextlib.contextmanager
+def span(name: str, **attrs):
+    """Time the enclosed block as phase ``name`` of the current job"""
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    current = Span(name, parent.job or parent, parent, time.perf_counter(), attrs)
+    token = _current.set(current)
+    try:
+        yield current
+    finally:
+        _current.reset(token)
+        current.finish(time.perf_counter())
+
+
+def record(name: str, started: float, **attrs):
+    """Add a phase that began at ``started`` (perf_counter) and ends now"""
+    parent = _current.get()
+    if parent is not None:
+        Span(name, parent.job or parent, parent, started, attrs).finish(time.perf_counter())
+
+
+def remote(phases: Iterable[Tuple[str, float]]):
+    """Add phases timed elsewhere (by the server), back to back and ending now"""
+    parent = _current.get()
+    phases = list(phases)
+    if parent is None or not phases:
+        return
+    end = time.perf_counter()
+    # Clock skew aside, the server cannot take longer than the enclosing call
+    start = max(end - sum(seconds for _, seconds in phases), parent.start)
+    for name, seconds in phases:
+        remote_span = Span(name, parent.job or parent, parent, start)
+        start = min(start + seconds, end)
+        remote_span.finish(start)
+
+
+def annotate(**attrs):
+    """Set attributes (such as ``worker``) on the current job"""
+    current = _current.get()
+    if current is not None:
+        (current.job or current).attrs.update(attrs)
+
+
+def detach():
+    """Stop attributing work in the current task to the job that started it
+
+    For background tasks that serve several jobs at once (script batches).
+    """
+    _current.set(None)
+
+
+def traced(asset_type: str):
+    """Run an async method returning success as a job of the object's ``tracer``"""
+    def decorate(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            with self.tracer.job(asset_type) as job:
+                result = await method(self, *args, **kwargs)
+                job.status = "ok" if result else "failed"
+                return result
+        return wrapper
+    return decorate
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)] if ordered else 0.0
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram, as Prometheus exposes it"""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float):
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += seconds
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _write_atomic(path: Path, text: str):
+    temp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(temp, 'w') as f:
+        f.write(text)
+    os.replace(temp, path)
+
+
+class Tracer:
+    """Collects finished jobs; writes them under ``root`` when one is given
+
+    Histograms cover every job; the trace file keeps the most recent
+    ``max_trace_jobs`` so a long batch does not grow it without bound.
+    """
+
+    def __init__(self, root: Optional[Path] = None, name: str = "trace",
+                 max_trace_jobs: int = 10000):
+        self.root = Path(root) if root is not None else None
+        self.name = name
+        self.jobs: deque = deque(maxlen=max_trace_jobs)
+        self.job_seconds: Dict[str, Histogram] = {}
+        self.phase_seconds: Dict[Tuple[str, str], Histogram] = {}
+        self.job_counts: Dict[Tuple[str, str], int] = {}
+        self.worker_jobs: Dict[str, int] = {}
+        self._ids = itertools.count(1)
+        # Trace timestamps are microseconds since the tracer started
+        self._epoch = time.perf_counter()
+        self._started_at = time.time()
+
+    @contextlib.contextmanager
+    def job(self, asset_type: str):
+        """Trace the enclosed block as one job; set ``job.status`` on failure"""
+        job = Job(next(self._ids), asset_type, time.perf_counter())
+        token = _current.set(job)
+        try:
+            yield job
+        except BaseException:
+            job.status = "error"
+            raise
+        finally:
+            _current.reset(token)
+            job.finish(time.perf_counter())
+            self._observe(job)
+
+    def _observe(self, job: Job):
+        self.jobs.append(job)
+        asset_type = job.asset_type
+        self.job_seconds.setdefault(asset_type, Histogram()).observe(job.seconds)
+        phases = job.phases
+        for phase in {span.name for span in job.spans} | {OTHER_PHASE}:
+            self.phase_seconds.setdefault((asset_type, phase), Histogram()).observe(phases[phase])
+        self.job_counts[asset_type, job.status] = self.job_counts.get((asset_type, job.status), 0) + 1
+        worker = job.attrs.get("worker")
+        if worker is not None:
+            self.worker_jobs[worker] = self.worker_jobs.get(worker, 0) + 1
+
+    def summary(self) -> Dict[str, Dict]:
+        """Per asset type: job count, p50/p95 seconds and mean seconds per phase"""
+        by_type: Dict[str, List[Job]] = {}
+        for job in self.jobs:
+            by_type.setdefault(job.asset_type, []).append(job)
+        summary = {}
+        for asset_type, jobs in sorted(by_type.items()):
+            seconds = [job.seconds for job in jobs]
+            phases: Dict[str, float] = {}
+            for job in jobs:
+                for phase, value in job.phases.items():
+                    phases[phase] = phases.get(phase, 0.0) + value / len(jobs)
+            summary[asset_type] = {
+                "jobs": len(jobs),
+                "p50_seconds": round(percentile(seconds, 0.5), 4),
+                "p95_seconds": round(percentile(seconds, 0.95), 4),
+                "phase_mean_seconds": {phase: round(value, 4) for phase, value in phases.items()
+                                       if value},
+            }
+        return summary
+
+    def trace_events(self) -> List[Dict]:
+        """Chrome trace events: the job, then its phases, on one row per job"""
+        def event(span: Span, category: str, tid: int, args: Dict) -> Dict:
+            return {"name": span.name, "cat": category, "ph": "X", "pid": os.getpid(), "tid": tid,
+                    "ts": round((span.start - self._epoch) * 1e6, 1),
+                    "dur": round(span.seconds * 1e6, 1), "args": args}
+
+        events = []
+        for job in self.jobs:
+            events.append(event(job, "job", job.id, {"status": job.status, **job.attrs,
+                                                     "phases": job.phases}))
+            for child in sorted(job.spans, key=lambda s: s.start):
+                events.append(event(child, "phase", job.id, dict(child.attrs)))
+        return events
+
+    def prometheus(self) -> str:
+        """All metrics in Prometheus text exposition format"""
+        lines = []
+
+        def histogram(name: str, help_text: str, series: Dict[Tuple, Histogram], label_names):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, hist in sorted(series.items()):
+                labels = dict(zip(label_names, key if isinstance(key, tuple) else (key,)))
+                for bound, count in zip(hist.buckets, hist.counts):
+                    lines.append(f"{name}_bucket{_labels({**labels, 'le': repr(bound)})} {count}")
+                lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {hist.count}")
+                lines.append(f"{name}_sum{_labels(labels)} {hist.sum:.6f}")
+                lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+
+        histogram(f"{METRIC_PREFIX}_job_seconds", "Wall time of asset jobs.",
+                  self.job_seconds, ("asset_type",))
+        histogram(f"{METRIC_PREFIX}_phase_seconds",
+                  "Time asset jobs spend in each phase, excluding nested phases.",
+                  self.phase_seconds, ("asset_type", "phase"))
+        lines.append(f"# HELP {METRIC_PREFIX}_jobs_total Asset jobs by outcome.")
+        lines.append(f"# TYPE {METRIC_PREFIX}_jobs_total counter")
+        for (asset_type, status), count in sorted(self.job_counts.items()):
+            lines.append(f"{METRIC_PREFIX}_jobs_total"
+                         f"{_labels({'asset_type': asset_type, 'status': status})} {count}")
+        lines.append(f"# HELP {METRIC_PREFIX}_worker_jobs_total Asset jobs by the worker that ran them.")
+        lines.append(f"# TYPE {METRIC_PREFIX}_worker_jobs_total counter")
+        for worker, count in sorted(self.worker_jobs.items()):
+            lines.append(f"{METRIC_PREFIX}_worker_jobs_total{_labels({'worker': worker})} {count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> List[Path]:
+        """Write the trace and metrics files; nothing without a root or jobs"""
+        if self.root is None or not self.job_counts:
+            return []
+        self.root.mkdir(parents=True, exist_ok=True)
+        trace_path = self.root / f"{self.name}.json"
+        metrics_path = self.root / f"{self.name}.prom"
+        _write_atomic(trace_path, json.dumps({
+            "traceEvents": self.trace_events(),
+            "displayTimeUnit": "ms",
+            "otherData": {"name": self.name,
+                          "started_at": time.strftime("%Y-%m-%dT%H:%M:%S",
+                                                      time.localtime(self._started_at))},
+            "summary": self.summary(),
+        }))
+        _write_atomic(metrics_path, self.prometheus())
+        return [trace_path, metrics_path]